@@ -5,6 +5,11 @@ import os
 # Add the backend directory to Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
+# Serverless instances are short-lived and numerous, so don't keep a
+# connection pool per instance; use the database's pooler (e.g. Supabase
+# pgbouncer on port 6543) in DATABASE_URL instead
+os.environ.setdefault("DB_SERVERLESS", "true")
+
 from backend.app.main import app
 
 # Export the FastAPI app for Vercel
@@ -0,0 +1,32 @@
+"""Add keyset pagination indexes
+
+Revision ID: 4b7e2c91a0d3
+Revises: 812d272aab4f
+Create Date: 2026-10-16 09:12:40.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b7e2c91a0d3'
+down_revision = '812d272aab4f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_businesses_created_at_id', 'businesses', ['created_at', 'id'], unique=False)
+    op.create_index('ix_campaigns_created_at_id', 'campaigns', ['created_at', 'id'], unique=False)
+    op.create_index('ix_campaigns_business_id_created_at_id', 'campaigns', ['business_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_content_created_at_id', 'content', ['created_at', 'id'], unique=False)
+    op.create_index('ix_content_business_id_created_at_id', 'content', ['business_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_content_business_id_created_at_id', table_name='content')
+    op.drop_index('ix_content_created_at_id', table_name='content')
+    op.drop_index('ix_campaigns_business_id_created_at_id', table_name='campaigns')
+    op.drop_index('ix_campaigns_created_at_id', table_name='campaigns')
+    op.drop_index('ix_businesses_created_at_id', table_name='businesses')
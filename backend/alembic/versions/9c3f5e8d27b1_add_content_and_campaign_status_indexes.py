@@ -0,0 +1,40 @@
+"""Add content and campaign status indexes
+
+Revision ID: 9c3f5e8d27b1
+Revises: 4b7e2c91a0d3
+Create Date: 2026-10-16 10:03:11.207419
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c3f5e8d27b1'
+down_revision = '4b7e2c91a0d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_content_status_scheduled_publish_at', 'content', ['status', 'scheduled_publish_at'], unique=False)
+    op.create_index(
+        'ix_content_scheduled_due', 'content', ['scheduled_publish_at'], unique=False,
+        postgresql_where=sa.text("status = 'SCHEDULED'"),
+        sqlite_where=sa.text("status = 'SCHEDULED'"),
+    )
+    op.create_index(
+        'ix_content_pending_approval', 'content', ['business_id', 'created_at'], unique=False,
+        postgresql_where=sa.text("status = 'PENDING_APPROVAL'"),
+        sqlite_where=sa.text("status = 'PENDING_APPROVAL'"),
+    )
+    op.create_index('ix_campaigns_business_id_status', 'campaigns', ['business_id', 'status'], unique=False)
+    op.create_index('ix_campaigns_status', 'campaigns', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_campaigns_status', table_name='campaigns')
+    op.drop_index('ix_campaigns_business_id_status', table_name='campaigns')
+    op.drop_index('ix_content_pending_approval', table_name='content')
+    op.drop_index('ix_content_scheduled_due', table_name='content')
+    op.drop_index('ix_content_status_scheduled_publish_at', table_name='content')
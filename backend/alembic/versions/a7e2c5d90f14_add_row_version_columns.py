@@ -0,0 +1,28 @@
+"""Add row_version columns
+
+Revision ID: a7e2c5d90f14
+Revises: f3c9a7e15b60
+Create Date: 2026-10-16 15:08:36.441920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7e2c5d90f14'
+down_revision = 'f3c9a7e15b60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('businesses', sa.Column('row_version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('campaigns', sa.Column('row_version', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('content', sa.Column('row_version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('content', 'row_version')
+    op.drop_column('campaigns', 'row_version')
+    op.drop_column('businesses', 'row_version')
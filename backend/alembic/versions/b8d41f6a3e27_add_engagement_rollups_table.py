@@ -0,0 +1,41 @@
+"""Add engagement rollups table
+
+Revision ID: b8d41f6a3e27
+Revises: e5a1d4b8c6f2
+Create Date: 2026-10-16 13:42:05.518230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8d41f6a3e27'
+down_revision = 'e5a1d4b8c6f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('engagement_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('granularity', sa.String(), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('business_id', sa.Integer(), nullable=False),
+    sa.Column('campaign_id', sa.Integer(), nullable=False),
+    sa.Column('content_type', sa.String(), nullable=False),
+    sa.Column('platform', sa.String(), nullable=False),
+    sa.Column('views', sa.Integer(), nullable=False),
+    sa.Column('clicks', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['business_id'], ['businesses.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('granularity', 'bucket_start', 'business_id', 'campaign_id', 'content_type', 'platform', name='uq_engagement_rollups_bucket_dimensions')
+    )
+    op.create_index(op.f('ix_engagement_rollups_id'), 'engagement_rollups', ['id'], unique=False)
+    op.create_index('ix_engagement_rollups_business_id_granularity_bucket_start', 'engagement_rollups', ['business_id', 'granularity', 'bucket_start'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_engagement_rollups_business_id_granularity_bucket_start', table_name='engagement_rollups')
+    op.drop_index(op.f('ix_engagement_rollups_id'), table_name='engagement_rollups')
+    op.drop_table('engagement_rollups')
@@ -0,0 +1,72 @@
+"""Add full-text search columns and indexes
+
+Revision ID: e5a1d4b8c6f2
+Revises: 9c3f5e8d27b1
+Create Date: 2026-10-16 11:20:54.901336
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a1d4b8c6f2'
+down_revision = '9c3f5e8d27b1'
+branch_labels = None
+depends_on = None
+
+# Weighted document for each searchable table (A ranks above B above C)
+SEARCH_VECTORS = {
+    'businesses': (
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(industry, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+    ),
+    'industries': (
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+    ),
+    'content': (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(meta_description, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(content_text, '')), 'C')"
+    ),
+}
+
+# Trigram indexes for fuzzy name matching; they also serve ILIKE '%term%'
+TRIGRAM_INDEXES = {
+    'ix_businesses_name_trgm': ('businesses', 'name'),
+    'ix_businesses_industry_trgm': ('businesses', 'industry'),
+    'ix_industries_name_trgm': ('industries', 'name'),
+}
+
+
+def upgrade() -> None:
+    # Search is PostgreSQL-only; other databases use the in-memory fallback
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, expression in SEARCH_VECTORS.items():
+        op.execute(
+            f'ALTER TABLE {table} ADD COLUMN search_vector tsvector '
+            f'GENERATED ALWAYS AS ({expression}) STORED'
+        )
+        op.create_index(f'ix_{table}_search_vector', table, ['search_vector'], postgresql_using='gin')
+    for name, (table, column) in TRIGRAM_INDEXES.items():
+        op.create_index(
+            name, table, [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for name, (table, column) in TRIGRAM_INDEXES.items():
+        op.drop_index(name, table_name=table)
+    for table in SEARCH_VECTORS:
+        op.drop_index(f'ix_{table}_search_vector', table_name=table)
+        op.drop_column(table, 'search_vector')
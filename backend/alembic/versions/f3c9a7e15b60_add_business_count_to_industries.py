@@ -0,0 +1,30 @@
+"""Add business_count to industries
+
+Revision ID: f3c9a7e15b60
+Revises: b8d41f6a3e27
+Create Date: 2026-10-16 14:27:48.903112
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c9a7e15b60'
+down_revision = 'b8d41f6a3e27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('industries', sa.Column('business_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE industries SET business_count = "
+        "(SELECT count(businesses.id) FROM businesses WHERE businesses.industry_id = industries.id)"
+    )
+    op.create_index('ix_industries_is_active_sort_order_name', 'industries', ['is_active', 'sort_order', 'name'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_industries_is_active_sort_order_name', table_name='industries')
+    op.drop_column('industries', 'business_count')
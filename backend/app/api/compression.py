@@ -0,0 +1,190 @@
+import gzip
+from typing import Dict, FrozenSet, Iterable, Optional
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+
+# Compressing bodies larger than this blocks the event loop noticeably
+_THREAD_THRESHOLD = 64 * 1024
+
+
+def supported_encodings() -> tuple:
+    """Encodings this process can produce, most preferred first"""
+    return (BROTLI, GZIP) if brotli is not None else (GZIP,)
+
+
+def choose_encoding(accept_encoding: str, supported: Iterable[str]) -> Optional[str]:
+    """Pick the supported encoding the client weights highest in Accept-Encoding.
+
+    Ties go to the earlier entry in ``supported``; ``q=0`` rules an encoding
+    out and ``*`` covers any encoding the client didn't list.
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.partition(";")
+        name = name.strip()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+
+    best = None
+    best_weight = 0.0
+    for encoding in supported:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class CompressionStats:
+    """Running totals of what the compression middleware did, per encoding"""
+
+    def __init__(self):
+        self.encodings: Dict[str, Dict[str, int]] = {}
+        self.skipped: Dict[str, int] = {}
+
+    def record(self, encoding: str, original_bytes: int, compressed_bytes: int) -> None:
+        totals = self.encodings.setdefault(encoding, {"responses": 0, "bytes_in": 0, "bytes_out": 0})
+        totals["responses"] += 1
+        totals["bytes_in"] += original_bytes
+        totals["bytes_out"] += compressed_bytes
+
+    def record_skip(self, reason: str) -> None:
+        self.skipped[reason] = self.skipped.get(reason, 0) + 1
+
+    def snapshot(self) -> dict:
+        encodings = {}
+        for encoding, totals in self.encodings.items():
+            ratio = totals["bytes_out"] / totals["bytes_in"] if totals["bytes_in"] else None
+            encodings[encoding] = {**totals, "ratio": round(ratio, 4) if ratio is not None else None}
+        return {"encodings": encodings, "skipped": dict(self.skipped)}
+
+
+class CompressionMiddleware:
+    """Compress JSON and text responses with Brotli or gzip.
+
+    Only complete bodies of at least ``minimum_size`` bytes with an allowed
+    content type are compressed. Streaming responses (whose first body
+    message has ``more_body`` set) and responses that already carry a
+    Content-Encoding pass through untouched, so NDJSON streams still reach
+    the client line by line.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        stats: Optional[CompressionStats] = None,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        content_types: Iterable[str] = ("application/json",),
+    ):
+        self.app = app
+        self.stats = stats if stats is not None else CompressionStats()
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.content_types: FrozenSet[str] = frozenset(t.strip().lower() for t in content_types if t.strip())
+        self.encodings = supported_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == BROTLI:
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+
+class _CompressionResponder:
+    """Holds back the response start until the first body message decides the encoding"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Optional[Message] = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+            return
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        self._passthrough = True
+        start = self._start
+        body = message.get("body", b"")
+        skip = self._skip_reason(start, body, message.get("more_body", False))
+        if skip is not None:
+            if skip != "empty":
+                self.middleware.stats.record_skip(skip)
+            if skip == "below_minimum_size":
+                # A larger body of the same resource would be compressed
+                MutableHeaders(raw=start["headers"]).add_vary_header("Accept-Encoding")
+            await self._send(start)
+            await self._send(message)
+            return
+
+        if len(body) >= _THREAD_THRESHOLD:
+            compressed = await anyio.to_thread.run_sync(self.middleware.compress, self.encoding, body)
+        else:
+            compressed = self.middleware.compress(self.encoding, body)
+        self.middleware.stats.record(self.encoding, len(body), len(compressed))
+
+        headers = MutableHeaders(raw=start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        # The compressed bytes differ from the identity representation, so a
+        # strong validator would no longer be byte-for-byte accurate
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    def _skip_reason(self, start: Message, body: bytes, more_body: bool) -> Optional[str]:
+        if start["status"] in (204, 304) or (not body and not more_body):
+            return "empty"
+        if more_body:
+            return "streaming"
+        headers = Headers(raw=start["headers"])
+        if "content-encoding" in headers:
+            return "already_encoded"
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type not in self.middleware.content_types:
+            return "content_type"
+        if len(body) < self.middleware.minimum_size:
+            return "below_minimum_size"
+        return None
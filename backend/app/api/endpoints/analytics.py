@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import datetime, timedelta, timezone
+from app.db.database import get_db
+from app.models.content import ContentType
+from app.repositories.analytics_repository import AnalyticsRepository, BUCKET_SIZES, as_utc, bucket_start
+from app.repositories.business_repository import BusinessRepository
+from app.schemas.analytics import AnalyticsGranularity, TimeseriesPoint, TimeseriesResponse
+
+router = APIRouter()
+
+MAX_BUCKETS = 2000
+DEFAULT_WINDOWS = {
+    AnalyticsGranularity.HOUR: timedelta(hours=48),
+    AnalyticsGranularity.DAY: timedelta(days=30),
+}
+
+@router.get("/timeseries", response_model=TimeseriesResponse)
+def get_timeseries(
+    business_id: int,
+    granularity: AnalyticsGranularity = AnalyticsGranularity.DAY,
+    start: Optional[datetime] = Query(None, description="Inclusive; defaults to 48 hours or 30 days before end"),
+    end: Optional[datetime] = Query(None, description="Exclusive; defaults to now"),
+    campaign_id: Optional[int] = None,
+    content_type: Optional[ContentType] = None,
+    platform: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """Get views and clicks per hour or day for a business from the rollup tables"""
+    end = as_utc(end) if end else datetime.now(timezone.utc)
+    start = as_utc(start) if start else end - DEFAULT_WINDOWS[granularity]
+    if start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must be before end"
+        )
+    if (end - bucket_start(start, granularity.value)) / BUCKET_SIZES[granularity.value] > MAX_BUCKETS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BUCKETS} {granularity.value} buckets per request"
+        )
+    
+    if not BusinessRepository(db).get_by_id(business_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Business not found"
+        )
+    
+    repo = AnalyticsRepository(db)
+    rows = repo.get_timeseries(
+        business_id,
+        granularity.value,
+        start,
+        end,
+        campaign_id=campaign_id,
+        content_type=content_type,
+        platform=platform
+    )
+    points = [TimeseriesPoint(bucket_start=bucket, views=views, clicks=clicks) for bucket, views, clicks in rows]
+    return TimeseriesResponse(
+        business_id=business_id,
+        granularity=granularity,
+        start=start,
+        end=end,
+        campaign_id=campaign_id,
+        content_type=content_type,
+        platform=platform,
+        total_views=sum(point.views for point in points),
+        total_clicks=sum(point.clicks for point in points),
+        points=points
+    )
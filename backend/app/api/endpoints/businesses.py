@@ -1,25 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from app.api.http_cache import is_not_modified, not_modified, row_validators, set_validators
+from app.api.responses import rows_response
 from app.db.database import get_db
 from app.schemas.business import BusinessCreate, BusinessUpdate, BusinessResponse
 from app.repositories.business_repository import BusinessRepository
+from app.repositories.pagination import InvalidCursorError
+from app.services.ai_content_service import AIContentService, get_ai_service
+from app.services.industry_catalog import IndustryCatalogCache, get_industry_catalog_cache
 
 router = APIRouter()
 
 @router.post("/", response_model=BusinessResponse)
-async def create_business(
+def create_business(
     business_data: BusinessCreate,
+    catalog_cache: IndustryCatalogCache = Depends(get_industry_catalog_cache),
     db: Session = Depends(get_db)
 ):
     """Create a new business profile"""
     repo = BusinessRepository(db)
     business = repo.create(business_data.dict())
+    # The industry's business_count changed with it
+    if business.industry_id is not None:
+        catalog_cache.invalidate()
     return business
 
 @router.get("/{business_id}", response_model=BusinessResponse)
-async def get_business(
+def get_business(
     business_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """Get business by ID"""
@@ -30,61 +42,91 @@ async def get_business(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Business not found"
         )
+    etag, last_modified = row_validators([business])
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+    set_validators(response, etag, last_modified)
     return business
 
 @router.put("/{business_id}", response_model=BusinessResponse)
 async def update_business(
     business_id: int,
     business_update: BusinessUpdate,
-    db: Session = Depends(get_db)
+    catalog_cache: IndustryCatalogCache = Depends(get_industry_catalog_cache),
+    db: Session = Depends(get_db),
+    ai_service: AIContentService = Depends(get_ai_service)
 ):
     """Update business profile"""
     repo = BusinessRepository(db)
-    business = repo.update(business_id, business_update.dict(exclude_unset=True))
+    update_data = business_update.dict(exclude_unset=True)
+    business = await run_in_threadpool(repo.update, business_id, update_data)
     if not business:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Business not found"
         )
+    
+    if "industry_id" in update_data:
+        await run_in_threadpool(catalog_cache.invalidate)
+    # Cached suggestions were generated from the old profile
+    if ai_service.suggestion_cache:
+        await ai_service.suggestion_cache.invalidate_business(business_id)
     return business
 
 @router.get("/", response_model=List[BusinessResponse])
-async def list_businesses(
+def list_businesses(
+    request: Request,
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's X-Next-Cursor header"),
     db: Session = Depends(get_db)
 ):
-    """List all businesses (for development - add auth later)"""
+    """List all businesses, newest first (for development - add auth later)"""
     repo = BusinessRepository(db)
-    businesses = repo.get_multi(skip=skip, limit=limit)
-    return businesses
+    try:
+        businesses, next_cursor = repo.get_page(cursor=cursor, skip=skip, limit=limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    # No Last-Modified on lists: removing a row doesn't advance it
+    etag, _ = row_validators(businesses, next_cursor)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+    return rows_response(BusinessResponse, businesses, headers=response.headers)
 
 @router.delete("/{business_id}")
 async def delete_business(
     business_id: int,
-    db: Session = Depends(get_db)
+    catalog_cache: IndustryCatalogCache = Depends(get_industry_catalog_cache),
+    db: Session = Depends(get_db),
+    ai_service: AIContentService = Depends(get_ai_service)
 ):
     """Delete business and all associated content (CASCADE)"""
     repo = BusinessRepository(db)
-    business = repo.get_by_id(business_id)
-    if not business:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Business not found"
-        )
     
-    # Check content count for informative message
+    # Counted first for an informative message; the CASCADE removes the rows
     from app.models.content import Content
-    content_count = db.query(Content).filter(Content.business_id == business_id).count()
+    content_count = await run_in_threadpool(
+        db.query(Content).filter(Content.business_id == business_id).count
+    )
     
     # Database CASCADE will handle associated content deletion automatically
-    success = repo.delete(business_id)
+    success = await run_in_threadpool(repo.delete, business_id)
     if not success:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete business"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Business not found"
         )
     
+    # The row's industry (if any) lost a business; deletes are rare enough
+    # not to load the row just to check
+    await run_in_threadpool(catalog_cache.invalidate)
+    if ai_service.suggestion_cache:
+        await ai_service.suggestion_cache.invalidate_business(business_id)
+    
     message = f"Business deleted successfully"
     if content_count > 0:
         message += f" (along with {content_count} associated content pieces)"
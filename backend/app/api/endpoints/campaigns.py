@@ -1,14 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from app.api.http_cache import is_not_modified, not_modified, row_validators, set_validators
+from app.api.responses import rows_response
 from app.db.database import get_db
 from app.schemas.campaign import CampaignCreate, CampaignUpdate, CampaignResponse
 from app.repositories.campaign_repository import CampaignRepository
+from app.repositories.pagination import InvalidCursorError
 
 router = APIRouter()
 
 @router.post("/", response_model=CampaignResponse)
-async def create_campaign(
+def create_campaign(
     campaign_data: CampaignCreate,
     db: Session = Depends(get_db)
 ):
@@ -18,8 +21,10 @@ async def create_campaign(
     return campaign
 
 @router.get("/{campaign_id}", response_model=CampaignResponse)
-async def get_campaign(
+def get_campaign(
     campaign_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """Get campaign by ID"""
@@ -30,22 +35,41 @@ async def get_campaign(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Campaign not found"
         )
+    etag, last_modified = row_validators([campaign])
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+    set_validators(response, etag, last_modified)
     return campaign
 
 @router.get("/", response_model=List[CampaignResponse])
-async def list_campaigns(
+def list_campaigns(
+    request: Request,
+    response: Response,
     business_id: int = None,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's X-Next-Cursor header"),
     db: Session = Depends(get_db)
 ):
-    """List campaigns"""
+    """List campaigns, newest first"""
     repo = CampaignRepository(db)
-    campaigns = repo.get_multi(business_id=business_id, skip=skip, limit=limit)
-    return campaigns
+    try:
+        campaigns, next_cursor = repo.get_page(
+            business_id=business_id, cursor=cursor, skip=skip, limit=limit
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    # No Last-Modified on lists: removing a row doesn't advance it
+    etag, _ = row_validators(campaigns, next_cursor)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+    return rows_response(CampaignResponse, campaigns, headers=response.headers)
 
 @router.put("/{campaign_id}/start")
-async def start_campaign(
+def start_campaign(
     campaign_id: int,
     db: Session = Depends(get_db)
 ):
@@ -1,24 +1,55 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.db.database import get_db
-from app.schemas.content import ContentCreate, ContentResponse, ContentGenerate, ContentUpdate
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Dict, List, Optional, Tuple, Union
+import asyncio
+import json
+from app.api.http_cache import is_not_modified, not_modified, row_validators, set_validators
+from app.api.responses import rows_response
+from app.db.database import get_db, release_connection
+from app.models.content import Content
+from app.schemas.content import (
+    ContentCreate,
+    ContentResponse,
+    ContentGenerate,
+    ContentUpdate,
+    ContentBatchGenerate,
+    ContentBatchItemResult,
+    ContentBatchResponse,
+    ContentListView,
+    ContentSummary,
+    GenerationJobResponse,
+    content_projection
+)
 from app.repositories.content_repository import ContentRepository
-from app.services.ai_content_service import AIContentService
+from app.repositories.business_repository import BusinessRepository
+from app.repositories.pagination import InvalidCursorError
+from app.services.ai_content_service import AIContentService, get_ai_service
+from app.services.generation_jobs import get_job_queue
 
 router = APIRouter()
 
-@router.post("/generate", response_model=ContentResponse)
+@router.post(
+    "/generate",
+    response_model=ContentResponse,
+    responses={202: {"model": GenerationJobResponse, "description": "Generation job queued"}}
+)
 async def generate_content(
     content_request: ContentGenerate,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    request: Request,
+    async_job: bool = Query(False, description="Queue the generation and return a job to poll"),
+    db: Session = Depends(get_db),
+    ai_service: AIContentService = Depends(get_ai_service),
+    job_queue = Depends(get_job_queue)
 ):
     """Generate AI content for a business"""
     # Get business info for context
-    from app.repositories.business_repository import BusinessRepository
     business_repo = BusinessRepository(db)
-    business = business_repo.get_by_id(content_request.business_id)
+    business = await run_in_threadpool(business_repo.get_by_id, content_request.business_id)
     
     if not business:
         raise HTTPException(
@@ -26,8 +57,19 @@ async def generate_content(
             detail="Business not found"
         )
     
+    if async_job:
+        # Hand off to a worker; poll GET /content/jobs/{job_id} for the result
+        job = await job_queue.submit(content_request)
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=GenerationJobResponse.model_validate(job).model_dump(mode="json"),
+            headers={"Location": str(request.url_for("get_generation_job", job_id=job.id))}
+        )
+    
+    # Don't hold a pooled connection while waiting on the AI provider
+    await run_in_threadpool(release_connection, db, business)
+    
     # Generate content using AI service
-    ai_service = AIContentService()
     content_data = await ai_service.generate_content(
         business=business,
         content_type=content_request.content_type,
@@ -37,13 +79,186 @@ async def generate_content(
     
     # Save to database
     content_repo = ContentRepository(db)
-    content = content_repo.create(content_data)
+    content = await run_in_threadpool(content_repo.create, content_data)
     
-    return content
+    # Serialize off the event loop too; the business relationship lazy-loads
+    return await run_in_threadpool(ContentResponse.model_validate, content)
+
+@router.post("/generate/stream")
+async def generate_content_stream(
+    content_request: ContentGenerate,
+    db: Session = Depends(get_db),
+    ai_service: AIContentService = Depends(get_ai_service)
+):
+    """Stream AI content for a business as newline-delimited JSON.
+
+    Emits ``{"type": "token", "text": ...}`` lines as tokens arrive, then a
+    final ``{"type": "complete", "content": ...}`` line once the content has
+    been saved (or ``{"type": "error", "detail": ...}`` if generation failed).
+    """
+    # Get business info for context
+    business_repo = BusinessRepository(db)
+    business = await run_in_threadpool(business_repo.get_by_id, content_request.business_id)
+    
+    if not business:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Business not found"
+        )
+    await run_in_threadpool(release_connection, db, business)
+    
+    def save(content_data) -> dict:
+        content = ContentRepository(db).create(content_data)
+        return ContentResponse.model_validate(content).model_dump(mode="json")
+    
+    async def event_stream():
+        try:
+            async for event, payload in ai_service.stream_content(
+                business=business,
+                content_type=content_request.content_type,
+                topic=content_request.topic,
+                keywords=content_request.keywords
+            ):
+                if event == "token":
+                    yield json.dumps({"type": "token", "text": payload}) + "\n"
+                else:
+                    # Save to database once the stream has finished
+                    response = await run_in_threadpool(save, payload)
+                    yield json.dumps({"type": "complete", "content": response}) + "\n"
+        except Exception as e:
+            print(f"Content streaming error: {e}")
+            yield json.dumps({"type": "error", "detail": "Content generation failed"}) + "\n"
+    
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+@router.post("/generate/batch", response_model=ContentBatchResponse)
+async def generate_content_batch(
+    batch_request: ContentBatchGenerate,
+    db: Session = Depends(get_db),
+    ai_service: AIContentService = Depends(get_ai_service)
+):
+    """Generate content for many (business, content type, topic) items at once.
+
+    Items run concurrently, bounded by the per-provider limits in
+    ``ai_provider_concurrency``. Successful items are saved in one
+    transaction, or one at a time if that transaction is rejected, so a
+    bad row only fails its own item; failures are reported per item.
+    """
+    # Load every referenced business with a single query
+    business_repo = BusinessRepository(db)
+    business_ids = {item.business_id for item in batch_request.items}
+    businesses = {
+        business.id: business
+        for business in await run_in_threadpool(business_repo.get_by_ids, business_ids)
+    }
+    await run_in_threadpool(release_connection, db, *businesses.values())
+    
+    async def generate(item: ContentGenerate):
+        business = businesses.get(item.business_id)
+        if not business:
+            raise LookupError("Business not found")
+        content_data = await ai_service.generate_content(
+            business=business,
+            content_type=item.content_type,
+            topic=item.topic,
+            keywords=item.keywords
+        )
+        if item.campaign_id:
+            content_data["campaign_id"] = item.campaign_id
+        return content_data
+    
+    outcomes = await asyncio.gather(
+        *(generate(item) for item in batch_request.items),
+        return_exceptions=True
+    )
+    
+    generated = [
+        (index, outcome) for index, outcome in enumerate(outcomes)
+        if not isinstance(outcome, Exception)
+    ]
+    content_repo = ContentRepository(db)
+    
+    def respond(content: Content) -> ContentResponse:
+        # Reuse the business loaded above rather than lazy-loading it per row
+        set_committed_value(content, "business", businesses[content.business_id])
+        return ContentResponse.model_validate(content)
+    
+    def save_all() -> Dict[int, Union[ContentResponse, Exception]]:
+        try:
+            contents = content_repo.create_many([content_data for _, content_data in generated])
+            return {index: respond(content) for (index, _), content in zip(generated, contents)}
+        except IntegrityError as e:
+            # e.g. a stale campaign_id; keep the other generations
+            print(f"Batch content save error, saving items one at a time: {e}")
+            db.rollback()
+        
+        saved = {}
+        for index, content_data in generated:
+            try:
+                saved[index] = respond(content_repo.create(content_data))
+            except IntegrityError as e:
+                db.rollback()
+                saved[index] = e
+        return saved
+    
+    saved = await run_in_threadpool(save_all)
+    
+    results = []
+    for index, (item, outcome) in enumerate(zip(batch_request.items, outcomes)):
+        if isinstance(saved.get(index), ContentResponse):
+            results.append(ContentBatchItemResult(
+                index=index,
+                business_id=item.business_id,
+                content=saved[index]
+            ))
+        elif index in saved:
+            results.append(ContentBatchItemResult(
+                index=index,
+                business_id=item.business_id,
+                error="Content could not be saved"
+            ))
+        else:
+            if not isinstance(outcome, LookupError):
+                print(f"Batch content generation error: {outcome}")
+            results.append(ContentBatchItemResult(
+                index=index,
+                business_id=item.business_id,
+                error=str(outcome) if isinstance(outcome, LookupError) else "Content generation failed"
+            ))
+    
+    succeeded = sum(1 for result in results if result.content is not None)
+    return ContentBatchResponse(
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results
+    )
+
+@router.get("/jobs/{job_id}", response_model=GenerationJobResponse)
+def get_generation_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    job_queue = Depends(get_job_queue)
+):
+    """Get the status of a content generation job"""
+    job = job_queue.get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    response = GenerationJobResponse.model_validate(job)
+    if job.content_id:
+        content = ContentRepository(db).get_by_id(job.content_id)
+        if content:
+            response.content = ContentResponse.model_validate(content)
+    return response
 
 @router.get("/{content_id}", response_model=ContentResponse)
-async def get_content(
+def get_content(
     content_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ):
     """Get content by ID"""
@@ -54,28 +269,86 @@ async def get_content(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Content not found"
         )
+    # The response embeds business details, so the business is part of the version
+    etag, last_modified = row_validators([content, content.business])
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+    set_validators(response, etag, last_modified)
     return content
 
-@router.get("/", response_model=List[ContentResponse])
-async def list_content(
+def _parse_fields(fields: Optional[str], view: ContentListView) -> Optional[Tuple[str, ...]]:
+    """Resolve ``fields``/``view`` to the fields to return, or None for full objects"""
+    if fields:
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = sorted(set(requested) - set(ContentResponse.model_fields))
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}"
+            )
+        return tuple(dict.fromkeys(["id", *requested]))
+    if view == ContentListView.SUMMARY:
+        return tuple(ContentSummary.model_fields)
+    return None
+
+@router.get(
+    "/",
+    response_model=List[ContentResponse],
+    responses={200: {"description": "Full objects, or only the selected fields with ``view`` or ``fields``"}}
+)
+def list_content(
+    request: Request,
+    response: Response,
     business_id: Optional[int] = None,
     content_type: Optional[str] = None,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's X-Next-Cursor header"),
+    view: ContentListView = Query(ContentListView.FULL, description="'summary' leaves out the body, prompt and settings"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return; overrides view"),
     db: Session = Depends(get_db)
 ):
-    """List content with optional filters"""
+    """List content with optional filters, newest first.
+
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` to fetch
+    the next page; the header is omitted on the last page. With ``view`` or
+    ``fields`` only the selected columns are read from the database. Rows
+    are serialized directly, without re-validating them against the schema.
+    """
+    selected = _parse_fields(fields, view)
     repo = ContentRepository(db)
-    content = repo.get_multi(
-        business_id=business_id,
-        content_type=content_type,
-        skip=skip,
-        limit=limit
-    )
-    return content
+    try:
+        content, next_cursor = repo.get_page(
+            business_id=business_id,
+            content_type=content_type,
+            cursor=cursor,
+            skip=skip,
+            limit=limit,
+            fields=selected
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    # No Last-Modified on lists: removing a row doesn't advance it
+    businesses = {}
+    if selected is None or "business" in selected:
+        businesses = {item.business_id: item.business for item in content}
+    etag, _ = row_validators([*content, *businesses.values()], next_cursor, *(selected or ()))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+    
+    if selected is None:
+        schema = ContentResponse
+    elif fields:
+        schema = content_projection(selected)
+    else:
+        schema = ContentSummary
+    return rows_response(schema, content, headers=response.headers)
 
 @router.post("/", response_model=ContentResponse)
-async def create_content(
+def create_content(
     content_data: ContentCreate,
     db: Session = Depends(get_db)
 ):
@@ -85,7 +358,7 @@ async def create_content(
     return content
 
 @router.put("/{content_id}", response_model=ContentResponse)
-async def update_content(
+def update_content(
     content_id: int,
     content_update: ContentUpdate,
     db: Session = Depends(get_db)
@@ -101,30 +374,23 @@ async def update_content(
     return content
 
 @router.delete("/{content_id}")
-async def delete_content(
+def delete_content(
     content_id: int,
     db: Session = Depends(get_db)
 ):
     """Delete content"""
     repo = ContentRepository(db)
-    content = repo.get_by_id(content_id)
-    if not content:
+    # DELETE ... RETURNING reports whether the row existed
+    if not repo.delete(content_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Content not found"
         )
     
-    success = repo.delete(content_id)
-    if not success:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete content"
-        )
-        
     return {"message": "Content deleted successfully", "content_id": content_id}
 
 @router.put("/{content_id}/draft")
-async def save_as_draft(
+def save_as_draft(
     content_id: int,
     db: Session = Depends(get_db)
 ):
@@ -139,7 +405,7 @@ async def save_as_draft(
     return {"message": "Content saved as draft", "content_id": content_id}
 
 @router.put("/{content_id}/approve")
-async def approve_content(
+def approve_content(
     content_id: int,
     db: Session = Depends(get_db)
 ):
@@ -154,7 +420,7 @@ async def approve_content(
     return {"message": "Content approved", "content_id": content_id}
 
 @router.put("/{content_id}/publish")
-async def publish_content(
+def publish_content(
     content_id: int,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
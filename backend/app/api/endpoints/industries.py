@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from app.api.http_cache import is_not_modified, not_modified, set_validators
 from app.db.database import get_db
 from app.schemas.industry import (
     IndustryCreate, 
@@ -9,91 +10,78 @@ from app.schemas.industry import (
     IndustryListResponse
 )
 from app.repositories.industry_repository import IndustryRepository
+from app.services.industry_catalog import IndustryCatalogCache, get_industry_catalog_cache
 
 router = APIRouter()
 
 @router.get("/", response_model=List[IndustryListResponse])
-async def list_industries(
+def list_industries(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     active_only: bool = Query(True),
     search: Optional[str] = Query(None),
+    catalog_cache: IndustryCatalogCache = Depends(get_industry_catalog_cache),
     db: Session = Depends(get_db)
 ):
     """List industries with business counts"""
-    repo = IndustryRepository(db)
+    catalog = catalog_cache.get(db)
+    if is_not_modified(request, catalog.etag):
+        return not_modified(catalog.etag)
+    set_validators(response, catalog.etag)
     
     if search:
-        industries = repo.search_by_name(search, skip=skip, limit=limit)
-        # Convert to list response format
-        return [
-            IndustryListResponse(
-                id=industry.id,
-                name=industry.name,
-                slug=industry.slug,
-                icon=industry.icon,
-                color=industry.color,
-                is_active=industry.is_active,
-                business_count=0  # Would need separate query for search results
-            )
-            for industry in industries
-        ]
-    
-    industries_with_counts = repo.get_industries_with_counts(
-        skip=skip, 
-        limit=limit, 
-        active_only=active_only
-    )
+        return catalog.search(search, skip=skip, limit=limit)
     
-    return [
-        IndustryListResponse(
-            id=row.id,
-            name=row.name,
-            slug=row.slug,
-            icon=row.icon,
-            color=row.color,
-            is_active=row.is_active,
-            business_count=row.business_count
-        )
-        for row in industries_with_counts
-    ]
+    return catalog.list(active_only=active_only, skip=skip, limit=limit)
 
 @router.get("/{industry_id}", response_model=IndustryResponse)
-async def get_industry(
+def get_industry(
     industry_id: int,
+    request: Request,
+    response: Response,
+    catalog_cache: IndustryCatalogCache = Depends(get_industry_catalog_cache),
     db: Session = Depends(get_db)
 ):
     """Get industry by ID with business count"""
-    repo = IndustryRepository(db)
-    industry = repo.get_with_business_count(industry_id)
+    catalog = catalog_cache.get(db)
+    industry = catalog.by_id.get(industry_id)
     if not industry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Industry not found"
         )
+    if is_not_modified(request, catalog.etag):
+        return not_modified(catalog.etag)
+    set_validators(response, catalog.etag)
     return industry
 
 @router.get("/slug/{slug}", response_model=IndustryResponse)
-async def get_industry_by_slug(
+def get_industry_by_slug(
     slug: str,
+    request: Request,
+    response: Response,
+    catalog_cache: IndustryCatalogCache = Depends(get_industry_catalog_cache),
     db: Session = Depends(get_db)
 ):
     """Get industry by slug"""
-    repo = IndustryRepository(db)
-    industry = repo.get_by_slug(slug)
+    catalog = catalog_cache.get(db)
+    industry = catalog.by_slug.get(slug)
     if not industry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Industry not found"
         )
-    
-    # Add business count
-    industry = repo.get_with_business_count(industry.id)
+    if is_not_modified(request, catalog.etag):
+        return not_modified(catalog.etag)
+    set_validators(response, catalog.etag)
     return industry
 
 @router.post("/", response_model=IndustryResponse)
-async def create_industry(
+def create_industry(
     industry_data: IndustryCreate,
+    catalog_cache: IndustryCatalogCache = Depends(get_industry_catalog_cache),
     db: Session = Depends(get_db)
 ):
     """Create a new industry"""
@@ -108,12 +96,14 @@ async def create_industry(
         )
     
     industry = repo.create(industry_data.model_dump())
-    return repo.get_with_business_count(industry.id)
+    catalog_cache.invalidate()
+    return industry
 
 @router.put("/{industry_id}", response_model=IndustryResponse)
-async def update_industry(
+def update_industry(
     industry_id: int,
     industry_update: IndustryUpdate,
+    catalog_cache: IndustryCatalogCache = Depends(get_industry_catalog_cache),
     db: Session = Depends(get_db)
 ):
     """Update an industry"""
@@ -132,17 +122,19 @@ async def update_industry(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Industry not found"
         )
-    return repo.get_with_business_count(industry.id)
+    catalog_cache.invalidate()
+    return industry
 
 @router.delete("/{industry_id}")
-async def delete_industry(
+def delete_industry(
     industry_id: int,
     force: bool = Query(False, description="Force delete even if businesses exist"),
+    catalog_cache: IndustryCatalogCache = Depends(get_industry_catalog_cache),
     db: Session = Depends(get_db)
 ):
     """Delete or deactivate an industry"""
     repo = IndustryRepository(db)
-    industry = repo.get_with_business_count(industry_id)
+    industry = repo.get_by_id(industry_id)
     
     if not industry:
         raise HTTPException(
@@ -151,11 +143,12 @@ async def delete_industry(
         )
     
     # Check if industry has businesses
-    if hasattr(industry, 'business_count') and industry.business_count > 0:
+    if industry.business_count > 0:
         if not force:
             # Soft delete (deactivate) instead of hard delete
             success = repo.deactivate(industry_id)
             if success:
+                catalog_cache.invalidate()
                 return {
                     "message": f"Industry deactivated (had {industry.business_count} businesses)",
                     "industry_id": industry_id,
@@ -165,6 +158,7 @@ async def delete_industry(
             # Force delete - this might cause issues with existing businesses
             success = repo.delete(industry_id)
             if success:
+                catalog_cache.invalidate()
                 return {
                     "message": f"Industry force deleted (had {industry.business_count} businesses)",
                     "industry_id": industry_id,
@@ -174,6 +168,7 @@ async def delete_industry(
         # Safe to hard delete
         success = repo.delete(industry_id)
         if success:
+            catalog_cache.invalidate()
             return {
                 "message": "Industry deleted successfully",
                 "industry_id": industry_id,
@@ -186,8 +181,9 @@ async def delete_industry(
     )
 
 @router.put("/{industry_id}/activate")
-async def activate_industry(
+def activate_industry(
     industry_id: int,
+    catalog_cache: IndustryCatalogCache = Depends(get_industry_catalog_cache),
     db: Session = Depends(get_db)
 ):
     """Activate a deactivated industry"""
@@ -198,4 +194,5 @@ async def activate_industry(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Industry not found"
         )
+    catalog_cache.invalidate()
     return {"message": "Industry activated successfully", "industry_id": industry_id}
\ No newline at end of file
@@ -0,0 +1,79 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import ValidationError
+from typing import AsyncIterator
+from app.core.config import settings
+from app.schemas.metrics import EngagementEvent, EventIngestError, EventIngestResponse
+from app.services.metrics_pipeline import MetricsPipeline, get_metrics_pipeline
+
+router = APIRouter()
+
+MAX_REPORTED_ERRORS = 10
+
+def _too_large(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+
+async def _iter_lines(request: Request) -> AsyncIterator[bytes]:
+    """Yield body lines as they arrive instead of buffering the whole body.
+
+    Raises 413 once the body passes ``metrics_max_body_bytes`` or a line
+    passes ``metrics_max_line_bytes``, so memory stays bounded whatever
+    the client sends.
+    """
+    max_body = settings.metrics_max_body_bytes
+    max_line = settings.metrics_max_line_bytes
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_body:
+        raise _too_large(f"Request body over {max_body} bytes")
+    
+    received = 0
+    pending = b""
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_body:
+            raise _too_large(f"Request body over {max_body} bytes")
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if len(line) > max_line:
+                raise _too_large(f"Lines over {max_line} bytes are not accepted")
+            yield line
+        if len(pending) > max_line:
+            raise _too_large(f"Lines over {max_line} bytes are not accepted")
+    if pending:
+        yield pending
+
+@router.post("/events", response_model=EventIngestResponse, status_code=status.HTTP_202_ACCEPTED)
+async def ingest_events(
+    request: Request,
+    pipeline: MetricsPipeline = Depends(get_metrics_pipeline)
+):
+    """Ingest a newline-delimited JSON batch of view/click events.
+
+    Each line is ``{"content_id": 1, "type": "view"|"click", "count": 1}``.
+    Valid lines are buffered and written to the database in bulk shortly
+    after; invalid lines are skipped and reported.
+    """
+    events = []
+    errors = []
+    rejected = 0
+    line_number = 0
+    async for line in _iter_lines(request):
+        line_number += 1
+        if not line.strip():
+            continue
+        if len(events) + rejected >= settings.metrics_max_events_per_request:
+            raise _too_large(f"At most {settings.metrics_max_events_per_request} events per request")
+        try:
+            events.append(EngagementEvent.model_validate_json(line))
+        except ValidationError as e:
+            rejected += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append(EventIngestError(line=line_number, detail=e.errors()[0]["msg"]))
+    
+    await pipeline.ingest(events)
+    return EventIngestResponse(accepted=len(events), rejected=rejected, errors=errors)
+
+@router.get("/compression")
+def compression_stats(request: Request):
+    """Report response compression totals per encoding since the process started"""
+    return request.app.state.compression_stats.snapshot()
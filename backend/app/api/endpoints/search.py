@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from app.db.database import get_db
+from app.schemas.search import SearchResponse, SearchResultType
+from app.services.search_service import SearchService
+
+router = APIRouter()
+
+@router.get("/", response_model=SearchResponse)
+def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms"),
+    types: Optional[List[SearchResultType]] = Query(None, description="Restrict results to these types"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """Search businesses, industries and content, best matches first"""
+    service = SearchService(db)
+    results = service.search(q, types=types, limit=limit)
+    return SearchResponse(query=q, results=results)
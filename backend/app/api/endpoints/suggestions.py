@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.db.database import get_db
-from app.schemas.suggestions import TopicSuggestionsRequest, KeywordSuggestionsRequest, TopicSuggestionsResponse, KeywordSuggestionsResponse
-from app.services.ai_content_service import AIContentService
+from app.db.database import get_db, release_connection
+from app.schemas.suggestions import TopicSuggestionsRequest, KeywordSuggestionsRequest, TopicSuggestionsResponse, KeywordSuggestionsResponse, SuggestionCacheStatsResponse
+from app.services.ai_content_service import AIContentService, get_ai_service
 from app.repositories.business_repository import BusinessRepository
 
 router = APIRouter()
@@ -11,21 +12,22 @@ router = APIRouter()
 @router.post("/topics", response_model=TopicSuggestionsResponse)
 async def generate_topic_suggestions(
     request: TopicSuggestionsRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    ai_service: AIContentService = Depends(get_ai_service)
 ):
     """Generate AI-powered topic suggestions"""
     # Get business info for context
     business_repo = BusinessRepository(db)
-    business = business_repo.get_by_id(request.business_id)
+    business = await run_in_threadpool(business_repo.get_by_id, request.business_id)
     
     if not business:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Business not found"
         )
+    await run_in_threadpool(release_connection, db, business)
     
     # Generate suggestions using AI service
-    ai_service = AIContentService()
     suggestions = await ai_service.generate_topic_suggestions(
         business=business,
         content_type=request.content_type,
@@ -38,21 +40,22 @@ async def generate_topic_suggestions(
 @router.post("/keywords", response_model=KeywordSuggestionsResponse)
 async def generate_keyword_suggestions(
     request: KeywordSuggestionsRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    ai_service: AIContentService = Depends(get_ai_service)
 ):
     """Generate AI-powered keyword suggestions"""
     # Get business info for context
     business_repo = BusinessRepository(db)
-    business = business_repo.get_by_id(request.business_id)
+    business = await run_in_threadpool(business_repo.get_by_id, request.business_id)
     
     if not business:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Business not found"
         )
+    await run_in_threadpool(release_connection, db, business)
     
     # Generate suggestions using AI service
-    ai_service = AIContentService()
     suggestions = await ai_service.generate_keyword_suggestions(
         business=business,
         content_type=request.content_type,
@@ -61,4 +64,16 @@ async def generate_keyword_suggestions(
         description=request.description
     )
     
-    return KeywordSuggestionsResponse(suggestions=suggestions)
\ No newline at end of file
+    return KeywordSuggestionsResponse(suggestions=suggestions)
+
+@router.get("/cache/stats", response_model=SuggestionCacheStatsResponse)
+async def get_suggestion_cache_stats(
+    ai_service: AIContentService = Depends(get_ai_service)
+):
+    """Get hit/miss counters for the suggestion response cache"""
+    if not ai_service.suggestion_cache:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Suggestion cache is disabled"
+        )
+    return SuggestionCacheStatsResponse(**ai_service.suggestion_cache.stats())
\ No newline at end of file
@@ -7,7 +7,7 @@ from app.repositories.user_repository import UserRepository
 router = APIRouter()
 
 @router.post("/", response_model=UserResponse)
-async def create_user(
+def create_user(
     user_data: UserCreate,
     db: Session = Depends(get_db)
 ):
@@ -26,7 +26,7 @@ async def create_user(
     return user
 
 @router.get("/{user_id}", response_model=UserResponse)
-async def get_user(
+def get_user(
     user_id: int,
     db: Session = Depends(get_db)
 ):
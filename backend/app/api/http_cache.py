@@ -0,0 +1,75 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Iterable, Optional, Tuple
+
+from fastapi import Request, Response, status
+
+# Clients may store responses but must revalidate them before reuse
+CACHE_CONTROL = "private, no-cache"
+
+
+def entity_tag(*parts: Any) -> str:
+    """Build a strong ETag from the values that determine a representation"""
+    digest = hashlib.sha256("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def row_validators(rows: Iterable[Any], *extra: Any) -> Tuple[str, Optional[datetime]]:
+    """ETag and Last-Modified for a representation built from ``rows``.
+
+    Each row contributes its table, id and ``row_version``, which every
+    UPDATE bumps, so the tag changes whenever any of them is written.
+    """
+    parts = []
+    modified = None
+    for row in rows:
+        parts.append(f"{row.__tablename__}:{row.id}:{row.row_version}")
+        timestamp = row.updated_at or row.created_at
+        if timestamp is not None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc) if timestamp.tzinfo is None else timestamp
+            modified = timestamp if modified is None else max(modified, timestamp)
+    return entity_tag(*parts, *extra), modified
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header matches ``etag`` (weak comparison)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Evaluate If-None-Match, falling back to If-Modified-Since as RFC 9110 requires"""
+    if "if-none-match" in request.headers:
+        return etag_matches(request, etag)
+    since = request.headers.get("if-modified-since")
+    if not since or last_modified is None:
+        return False
+    try:
+        since_at = parsedate_to_datetime(since)
+    except (TypeError, ValueError):
+        return False
+    if since_at.tzinfo is None:
+        since_at = since_at.replace(tzinfo=timezone.utc)
+    # HTTP dates only have whole seconds
+    return last_modified.replace(microsecond=0) <= since_at
+
+
+def set_validators(response: Response, etag: str, last_modified: Optional[datetime] = None) -> None:
+    """Attach ETag, Last-Modified and Cache-Control headers to a 200 response"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+
+
+def not_modified(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """An empty 304 response for a client whose cached copy is current"""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
@@ -0,0 +1,185 @@
+import logging
+import time
+from typing import Any, Iterator
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily, Metric
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.monitoring import HTTP_REQUEST_DURATION
+from app.core.tracing import span, tracing_active
+from app.db.instrumentation import count_queries
+from app.db.pool import pool_stats
+
+logger = logging.getLogger(__name__)
+
+
+class RequestMetricsMiddleware:
+    """Time every HTTP request into ``http_request_duration_seconds``.
+
+    Requests are labelled with the matched route's path template (e.g.
+    ``/api/v1/content/{content_id}``) rather than the raw path, so ids don't
+    create a new series each; unmatched paths share one label.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=str(status_code),
+            ).observe(time.perf_counter() - started)
+
+
+class RequestTracingMiddleware:
+    """Open a server span per HTTP request, parenting the repository and LLM spans it causes"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not tracing_active():
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        with span(f"{method} {scope['path']}", **{"http.method": method, "http.target": scope["path"]}) as current:
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    current.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    # Name by template so traces group like the latency metrics
+                    current.update_name(f"{method} {route.path}")
+                    current.set_attribute("http.route", route.path)
+
+
+class QueryCountMiddleware:
+    """Count each request's SQL statements and flag requests that run too many.
+
+    The count and total database time go out in a ``Server-Timing`` header
+    (visible in browser dev tools). Requests over ``query_budget``
+    statements are logged along with any statement repeated at least
+    ``repeated_threshold`` times, the usual sign of an N+1 loop.
+    """
+
+    def __init__(self, app: ASGIApp, query_budget: int, repeated_threshold: int, server_timing: bool = True):
+        self.app = app
+        self.query_budget = query_budget
+        self.repeated_threshold = repeated_threshold
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as stats:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start" and self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"'
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+        if stats.count > self.query_budget:
+            route = getattr(scope.get("route"), "path", scope["path"])
+            logger.warning(
+                "%s %s ran %d SQL statements in %.1fms (budget %d)",
+                scope["method"], route, stats.count, stats.duration * 1000, self.query_budget
+            )
+            for statement, count in stats.repeated(self.repeated_threshold):
+                logger.warning("Possible N+1, %dx: %s", count, " ".join(statement.split())[:200])
+
+
+class AppStateCollector:
+    """Metrics read from the app's long-lived components when Prometheus scrapes.
+
+    These are the counters of the worker serving the scrape, even in
+    multiprocess mode.
+    """
+
+    def __init__(self, app: Any, engine: Any):
+        self.app = app
+        self.engine = engine
+
+    def collect(self) -> Iterator[Metric]:
+        state = self.app.state
+
+        cache_requests = CounterMetricFamily("cache_requests", "Cache lookups by cache and result", labels=("cache", "result"))
+        ai_service = getattr(state, "ai_service", None)
+        suggestion_cache = getattr(ai_service, "suggestion_cache", None)
+        if suggestion_cache is not None:
+            stats = suggestion_cache.stats()
+            cache_requests.add_metric(("suggestions", "memory_hit"), stats["memory_hits"])
+            cache_requests.add_metric(("suggestions", "redis_hit"), stats["redis_hits"])
+            cache_requests.add_metric(("suggestions", "miss"), stats["misses"])
+        industry_catalog = getattr(state, "industry_catalog", None)
+        if industry_catalog is not None:
+            stats = industry_catalog.stats()
+            cache_requests.add_metric(("industry_catalog", "memory_hit"), stats["hits"])
+            cache_requests.add_metric(("industry_catalog", "miss"), stats["loads"])
+        yield cache_requests
+
+        compression_stats = getattr(state, "compression_stats", None)
+        if compression_stats is not None:
+            responses = CounterMetricFamily("http_compressed_responses", "Responses compressed, by encoding", labels=("encoding",))
+            bytes_in = CounterMetricFamily("http_compression_input_bytes", "Response bytes before compression", labels=("encoding",))
+            bytes_out = CounterMetricFamily("http_compression_output_bytes", "Response bytes after compression", labels=("encoding",))
+            for encoding, totals in compression_stats.encodings.items():
+                responses.add_metric((encoding,), totals["responses"])
+                bytes_in.add_metric((encoding,), totals["bytes_in"])
+                bytes_out.add_metric((encoding,), totals["bytes_out"])
+            skipped = CounterMetricFamily("http_compression_skipped", "Responses left uncompressed, by reason", labels=("reason",))
+            for reason, count in compression_stats.skipped.items():
+                skipped.add_metric((reason,), count)
+            yield from (responses, bytes_in, bytes_out, skipped)
+
+        metrics_pipeline = getattr(state, "metrics_pipeline", None)
+        if metrics_pipeline is not None:
+            events = CounterMetricFamily("engagement_events", "Engagement events by pipeline stage", labels=("stage",))
+            events.add_metric(("received",), metrics_pipeline.events_received)
+            events.add_metric(("flushed",), metrics_pipeline.events_flushed)
+            events.add_metric(("dropped",), metrics_pipeline.events_dropped)
+            flushes = CounterMetricFamily("engagement_flushes", "Engagement buffer flushes by outcome", labels=("outcome",))
+            flushes.add_metric(("success",), metrics_pipeline.flushes)
+            flushes.add_metric(("error",), metrics_pipeline.flush_failures)
+            yield from (events, flushes)
+
+        pool = pool_stats(self.engine.pool)
+        if "checked_out" in pool:
+            connections = GaugeMetricFamily("db_pool_connections", "Database pool connections by state", labels=("state",))
+            connections.add_metric(("checked_out",), pool["checked_out"])
+            connections.add_metric(("checked_in",), pool["checked_in"])
+            connections.add_metric(("overflow",), pool["overflow"])
+            yield connections
+        if "timeouts" in pool:
+            yield CounterMetricFamily("db_pool_timeouts", "Connection checkouts that timed out", value=pool["timeouts"])
@@ -0,0 +1,81 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Type, get_args
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Same output as Pydantic's JSON mode for the types our schemas use:
+# enums by value, ISO datetimes with "Z" for UTC
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+
+class FastJSONResponse(JSONResponse):
+    """The app's default response class; renders with orjson when available"""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+def _nested_schema(annotation: Any) -> Optional[Type[BaseModel]]:
+    """The BaseModel in ``annotation`` or ``Optional[annotation]``, if any"""
+    candidates = get_args(annotation) or (annotation,)
+    for candidate in candidates:
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+    return None
+
+
+@lru_cache(maxsize=128)
+def row_serializer(schema: Type[BaseModel]) -> Callable[[Any], Dict[str, Any]]:
+    """Build a function reading ``schema``'s fields straight off an ORM row.
+
+    The rows come from our own database, so they don't need re-validating;
+    skipping Pydantic validation is most of the cost of a large list
+    response. Nested schemas (e.g. the business on content) are handled
+    recursively; other values are left to orjson.
+    """
+    plain = []
+    nested = []
+    for name, field in schema.model_fields.items():
+        nested_schema = _nested_schema(field.annotation)
+        if nested_schema is None:
+            plain.append(name)
+        else:
+            nested.append((name, row_serializer(nested_schema)))
+
+    def serialize(row: Any) -> Dict[str, Any]:
+        data = {name: getattr(row, name) for name in plain}
+        for name, serialize_nested in nested:
+            value = getattr(row, name)
+            data[name] = serialize_nested(value) if value is not None else None
+        return data
+
+    return serialize
+
+
+@lru_cache(maxsize=128)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def rows_response(
+    schema: Type[BaseModel],
+    rows: Iterable[Any],
+    headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """Serialize ORM rows as a JSON list of ``schema`` without validating them"""
+    if orjson is not None:
+        serialize = row_serializer(schema)
+        body = orjson.dumps([serialize(row) for row in rows], option=ORJSON_OPTIONS)
+    else:
+        adapter = _list_adapter(schema)
+        body = adapter.dump_json(adapter.validate_python(list(rows), from_attributes=True))
+    return Response(content=body, media_type="application/json", headers=dict(headers or {}))
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.endpoints import users, businesses, industries, content, campaigns, suggestions
+from app.api.endpoints import users, businesses, industries, content, campaigns, suggestions, search, metrics, analytics
 
 api_router = APIRouter()
 
@@ -8,4 +8,7 @@ api_router.include_router(businesses.router, prefix="/businesses", tags=["busine
 api_router.include_router(industries.router, prefix="/industries", tags=["industries"])
 api_router.include_router(content.router, prefix="/content", tags=["content"])
 api_router.include_router(campaigns.router, prefix="/campaigns", tags=["campaigns"])
-api_router.include_router(suggestions.router, prefix="/suggestions", tags=["suggestions"])
\ No newline at end of file
+api_router.include_router(suggestions.router, prefix="/suggestions", tags=["suggestions"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
+api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
\ No newline at end of file
@@ -0,0 +1,123 @@
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client import multiprocess
+
+from app.core.tracing import set_span_attributes, span
+
+# Seconds; covers fast queries through long-form LLM generations
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# With several server workers, set PROMETHEUS_MULTIPROC_DIR (an empty
+# directory, before the app starts) so every worker writes its samples there
+# and a scrape of any one of them reports totals across all of them
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+# HTTP
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time to serve an HTTP request, by route template",
+    ("method", "route", "status"),
+    buckets=DEFAULT_BUCKETS,
+)
+
+# LLM providers
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds",
+    "Time for an LLM provider call to finish",
+    ("provider", "model", "content_type", "operation"),
+    buckets=DEFAULT_BUCKETS,
+)
+LLM_REQUESTS = Counter(
+    "llm_requests",
+    "LLM provider calls by outcome (success or error)",
+    ("provider", "model", "content_type", "operation", "outcome"),
+)
+LLM_TOKENS = Counter(
+    "llm_tokens",
+    "Tokens reported by LLM providers, by kind (prompt or completion)",
+    ("provider", "model", "content_type", "kind"),
+)
+LLM_FALLBACKS = Counter(
+    "llm_mock_fallbacks",
+    "Generations served with mock content, by reason (no_provider or error)",
+    ("content_type", "operation", "reason"),
+)
+
+# Database
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time, by statement kind",
+    ("operation",),
+    buckets=DEFAULT_BUCKETS,
+)
+
+
+def render_metrics(*collectors) -> bytes:
+    """Render the registered metrics, plus ``collectors`` read at scrape time, in the Prometheus text format"""
+    registry = REGISTRY
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    extra = CollectorRegistry(auto_describe=False)
+    for collector in collectors:
+        extra.register(collector)
+    return generate_latest(registry) + generate_latest(extra)
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauge files on shutdown (multiprocess mode only)"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+@contextmanager
+def observe_llm_call(provider: str, model: str, content_type: str, operation: str) -> Iterator[None]:
+    """Time the enclosed LLM provider call, count its outcome and trace it as a span"""
+    started = time.perf_counter()
+    labels = {"provider": provider, "model": model, "content_type": content_type, "operation": operation}
+    try:
+        with span(
+            f"llm.{operation}",
+            **{"llm.provider": provider, "llm.model": model, "llm.content_type": content_type}
+        ):
+            yield
+    except BaseException as e:
+        record_llm_failure(e, **labels)
+        raise
+    else:
+        LLM_REQUESTS.labels(outcome="success", **labels).inc()
+    finally:
+        LLM_REQUEST_DURATION.labels(**labels).observe(time.perf_counter() - started)
+
+
+def record_llm_failure(error: BaseException, provider: str, model: str, content_type: str, operation: str) -> None:
+    """Count a failed provider call once, however many layers see ``error`` go by"""
+    if getattr(error, "_llm_failure_recorded", False):
+        return
+    LLM_REQUESTS.labels(
+        provider=provider, model=model, content_type=content_type, operation=operation, outcome="error"
+    ).inc()
+    try:
+        error._llm_failure_recorded = True
+    except AttributeError:
+        pass
+
+
+def record_llm_tokens(
+    provider: str,
+    model: str,
+    content_type: str,
+    prompt_tokens: Optional[int],
+    completion_tokens: Optional[int]
+) -> None:
+    """Record the token usage a provider reported, if any"""
+    set_span_attributes(**{"llm.prompt_tokens": prompt_tokens, "llm.completion_tokens": completion_tokens})
+    for kind, tokens in (("prompt", prompt_tokens), ("completion", completion_tokens)):
+        if tokens:
+            LLM_TOKENS.labels(provider=provider, model=model, content_type=content_type, kind=kind).inc(tokens)
@@ -0,0 +1,117 @@
+import functools
+import importlib
+import pkgutil
+from contextlib import nullcontext
+from types import FunctionType
+from typing import Any, ContextManager, Optional
+
+from app.core.config import settings
+
+try:
+    from opentelemetry import trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SimpleSpanProcessor
+except ImportError:
+    trace = None
+
+# None while tracing is off; every helper below checks this first and
+# does nothing else, so disabled tracing costs one global lookup
+_tracer = None
+_provider = None
+_NOOP_SPAN = nullcontext()
+
+
+def tracing_active() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, **attributes: Any) -> ContextManager:
+    """Open a child span of the current one, or do nothing while tracing is off"""
+    if _tracer is None:
+        return _NOOP_SPAN
+    return _tracer.start_as_current_span(name, attributes=_clean(attributes))
+
+
+def set_span_attributes(**attributes: Any) -> None:
+    """Attach attributes to the current span, e.g. token counts known only after a call"""
+    if _tracer is None:
+        return
+    current = trace.get_current_span()
+    if current.is_recording():
+        current.set_attributes(_clean(attributes))
+
+
+def _clean(attributes: dict) -> dict:
+    # OpenTelemetry rejects None attribute values
+    return {key: value for key, value in attributes.items() if value is not None}
+
+
+def configure_tracing(exporter: Optional[Any] = None) -> bool:
+    """Start exporting spans, returning whether tracing is now active.
+
+    ``exporter`` overrides ``tracing_exporter`` and is flushed synchronously,
+    which lets tests collect spans with an in-memory exporter.
+    """
+    global _tracer, _provider
+    if trace is None:
+        print("⚠️  Tracing enabled but opentelemetry-sdk is not installed; continuing without it")
+        return False
+
+    provider = TracerProvider(resource=Resource.create({"service.name": settings.tracing_service_name}))
+    if exporter is not None:
+        processor = SimpleSpanProcessor(exporter)
+    elif settings.tracing_exporter == "console":
+        processor = SimpleSpanProcessor(ConsoleSpanExporter())
+    else:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        processor = BatchSpanProcessor(OTLPSpanExporter(endpoint=settings.tracing_otlp_endpoint))
+    provider.add_span_processor(processor)
+
+    instrument_repositories()
+    _provider = provider
+    _tracer = provider.get_tracer("app")
+    return True
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and stop tracing"""
+    global _tracer, _provider
+    if _provider is not None:
+        _provider.shutdown()
+    _tracer = None
+    _provider = None
+
+
+def _traced_method(name: str, method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if _tracer is None:
+            return method(self, *args, **kwargs)
+        with _tracer.start_as_current_span(f"{type(self).__name__}.{name}"):
+            return method(self, *args, **kwargs)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def instrument_repositories() -> None:
+    """Wrap every public repository method in a span named ``Repository.method``.
+
+    Only done once tracing is configured, so untraced processes keep the
+    original methods.
+    """
+    import app.repositories
+    from app.repositories.base_repository import BaseRepository
+
+    for module in pkgutil.iter_modules(app.repositories.__path__):
+        importlib.import_module(f"app.repositories.{module.name}")
+
+    pending = [BaseRepository]
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        for name, value in list(vars(cls).items()):
+            if name.startswith("_") or not isinstance(value, FunctionType) or getattr(value, "__traced__", False):
+                continue
+            setattr(cls, name, _traced_method(name, value))
@@ -1,13 +1,46 @@
+from typing import Any, Dict
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 from app.core.config import settings
+from app.db.instrumentation import install_query_instrumentation
+from app.db.pool import InstrumentedQueuePool
+
+def engine_options(database_url: str) -> Dict[str, Any]:
+    """Build ``create_engine`` keyword arguments from the pool settings"""
+    url = make_url(database_url)
+    options: Dict[str, Any] = {
+        "echo": settings.db_echo,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    
+    connect_args: Dict[str, Any] = {}
+    if url.get_backend_name() == "sqlite":
+        connect_args["check_same_thread"] = False
+    elif url.get_backend_name() == "postgresql" and settings.db_statement_timeout_ms:
+        connect_args["options"] = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+    if connect_args:
+        options["connect_args"] = connect_args
+    
+    if settings.db_serverless:
+        # Each invocation opens and closes its own connection; pooling is
+        # left to an external pooler in front of the database
+        options["poolclass"] = NullPool
+    elif url.get_backend_name() != "sqlite" or url.database not in (None, "", ":memory:"):
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    return options
 
 # Create database engine
-engine = create_engine(
-    settings.database_url,
-    echo=settings.debug,  # Log SQL queries in debug mode
-)
+engine = create_engine(settings.database_url, **engine_options(settings.database_url))
+install_query_instrumentation()
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -21,4 +54,15 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def release_connection(db: Session, *instances) -> None:
+    """End the session's transaction so its pooled connection is returned.
+
+    Call before awaiting slow non-database work such as an AI provider
+    request. ``instances`` are detached first and keep their loaded
+    attributes; the session starts a new transaction on next use.
+    """
+    for instance in instances:
+        db.expunge(instance)
+    db.commit()
@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.monitoring import DB_QUERY_DURATION
+
+_OPERATIONS = {"select", "insert", "update", "delete"}
+# Not queries as far as a request's query budget is concerned
+_TRANSACTION_CONTROL = {"begin", "commit", "rollback", "savepoint", "release"}
+
+
+def statement_operation(statement: str) -> str:
+    """The kind of SQL statement, e.g. ``select``, for metric labels"""
+    keyword = _first_keyword(statement)
+    if keyword == "with":
+        # CTEs are almost always reads here
+        return "select"
+    return keyword if keyword in _OPERATIONS else "other"
+
+
+def _first_keyword(statement: str) -> str:
+    return statement.lstrip().split(None, 1)[0].lower() if statement.strip() else ""
+
+
+class QueryStats:
+    """SQL statements run within one request or ``count_queries`` block.
+
+    Statements are counted by their SQL text, so the same query repeated
+    with different parameters (the N+1 pattern) shows up in ``repeated``.
+    Counts also roll up into the enclosing block, if any.
+    """
+
+    def __init__(self, parent: Optional["QueryStats"] = None):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+        self._parent = parent
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, seconds: float) -> None:
+        stats = self
+        while stats is not None:
+            with stats._lock:
+                stats.count += 1
+                stats.duration += seconds
+                stats.statements[statement] += 1
+            stats = stats._parent
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements run at least ``threshold`` times, most frequent first"""
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """Count the SQL statements run inside the block, including in threadpool calls it awaits"""
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    operation = statement_operation(statement)
+    DB_QUERY_DURATION.labels(operation=operation).observe(elapsed)
+    stats = _current_stats.get()
+    if stats is not None and not (operation == "other" and _first_keyword(statement) in _TRANSACTION_CONTROL):
+        stats.record(statement, elapsed)
+
+
+def install_query_instrumentation() -> None:
+    """Time and count every SQL statement on every engine, including test engines"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,58 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool, QueuePool
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection.
+
+    Waits show up when every pooled and overflow connection is checked out,
+    which is the first sign that the pool is too small for the load.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self.checkouts += 1
+                self.total_wait += waited
+                self.max_wait = max(self.max_wait, waited)
+
+
+def pool_stats(pool: Pool) -> Dict[str, Any]:
+    """Describe a connection pool's current usage for monitoring"""
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(0, pool.overflow()),
+        )
+    if isinstance(pool, InstrumentedQueuePool):
+        checkouts = pool.checkouts
+        stats.update(
+            checkouts=checkouts,
+            timeouts=pool.timeouts,
+            avg_wait_ms=pool.total_wait / checkouts * 1000 if checkouts else 0.0,
+            max_wait_ms=pool.max_wait * 1000,
+        )
+    return stats
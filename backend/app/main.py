@@ -1,14 +1,78 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from sqlalchemy.orm import Session
 from app.core.config import settings
+from app.api.compression import CompressionMiddleware, CompressionStats
+from app.api.monitoring import (
+    AppStateCollector,
+    QueryCountMiddleware,
+    RequestMetricsMiddleware,
+    RequestTracingMiddleware,
+)
+from app.api.responses import FastJSONResponse
 from app.api.routes import api_router
+from app.core.monitoring import CONTENT_TYPE as METRICS_CONTENT_TYPE, mark_process_dead, render_metrics
+from app.core.tracing import configure_tracing, shutdown_tracing
+from app.db.database import SessionLocal, engine, get_db
+from app.db.pool import pool_stats
+from app.services.ai_content_service import AIContentService
+from app.services.generation_jobs import create_job_queue
+from app.services.industry_catalog import create_industry_catalog_cache
+from app.services.metrics_pipeline import create_metrics_pipeline
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.tracing_enabled:
+        configure_tracing()
+    
+    # Create the AI service once so provider clients and their connection
+    # pools are shared across requests
+    ai_service = AIContentService()
+    await ai_service.startup()
+    app.state.ai_service = ai_service
+    
+    job_queue = create_job_queue(ai_service, SessionLocal)
+    await job_queue.start()
+    app.state.job_queue = job_queue
+    
+    metrics_pipeline = create_metrics_pipeline(SessionLocal)
+    metrics_pipeline.start()
+    app.state.metrics_pipeline = metrics_pipeline
+    
+    industry_catalog = create_industry_catalog_cache()
+    industry_catalog.start()
+    app.state.industry_catalog = industry_catalog
+    yield
+    industry_catalog.stop()
+    await metrics_pipeline.stop()
+    await job_queue.stop()
+    await ai_service.aclose()
+    shutdown_tracing()
+    mark_process_dead()
 
 app = FastAPI(
     title="AI SEO Platform",
     description="AI-powered SEO and marketing automation platform",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
+# Compress large JSON and text bodies; streamed responses pass through as-is
+app.state.compression_stats = CompressionStats()
+if settings.compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        stats=app.state.compression_stats,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+        content_types=settings.compression_content_types.split(","),
+    )
+
 # Configure CORS
 # Configure allowed origins
 allowed_origins = [
@@ -30,8 +94,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allow all HTTP methods
     allow_headers=["*"],  # Allow all headers
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],  # Pagination cursor for list endpoints, cache validators
 )
 
+# Count SQL statements per request; reports them in Server-Timing
+app.add_middleware(
+    QueryCountMiddleware,
+    query_budget=settings.db_query_budget,
+    repeated_threshold=settings.db_repeated_query_threshold,
+    server_timing=settings.db_server_timing,
+)
+
+# Added last so it is outermost and times the other middleware too
+if settings.tracing_enabled:
+    app.add_middleware(RequestTracingMiddleware)
+app.add_middleware(RequestMetricsMiddleware)
+
 app.include_router(api_router, prefix="/api/v1")
 
 @app.get("/")
@@ -40,4 +118,24 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """Expose request, LLM, database, cache and compression metrics for Prometheus"""
+    body = render_metrics(AppStateCollector(app, engine))
+    return Response(content=body, media_type=METRICS_CONTENT_TYPE)
+
+@app.get("/health/db")
+def database_health_check(db: Session = Depends(get_db)):
+    """Check database connectivity and report connection pool usage"""
+    pool = pool_stats(db.get_bind().engine.pool)
+    try:
+        db.execute(text("SELECT 1"))
+    except Exception as e:
+        print(f"Database health check failed: {e}")
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "unhealthy", "pool": pool}
+        )
+    return {"status": "healthy", "pool": pool}
\ No newline at end of file
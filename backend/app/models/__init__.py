@@ -4,5 +4,6 @@ from .business import Business
 from .industry import Industry
 from .content import Content, ContentType
 from .campaign import Campaign
+from .analytics import EngagementRollup
 
-__all__ = ["User", "Business", "Industry", "Content", "ContentType", "Campaign"]
\ No newline at end of file
+__all__ = ["User", "Business", "Industry", "Content", "ContentType", "Campaign", "EngagementRollup"]
\ No newline at end of file
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, UniqueConstraint
+from app.db.database import Base
+
+class EngagementRollup(Base):
+    __tablename__ = "engagement_rollups"
+    __table_args__ = (
+        # One row per bucket and dimension combination; upserts conflict on it
+        UniqueConstraint(
+            "granularity", "bucket_start", "business_id", "campaign_id", "content_type", "platform",
+            name="uq_engagement_rollups_bucket_dimensions"
+        ),
+        # Dashboard time series for a business
+        Index("ix_engagement_rollups_business_id_granularity_bucket_start", "business_id", "granularity", "bucket_start"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    granularity = Column(String, nullable=False)  # "hour" or "day"
+    bucket_start = Column(DateTime(timezone=True), nullable=False)  # UTC start of the bucket
+    
+    # Dimensions
+    business_id = Column(Integer, ForeignKey("businesses.id", ondelete="CASCADE"), nullable=False)
+    campaign_id = Column(Integer, nullable=False, default=0)  # 0 for content outside a campaign
+    content_type = Column(String, nullable=False)  # ContentType value, e.g. "blog_post"
+    platform = Column(String, nullable=False)  # e.g. "linkedin"
+    
+    # Totals for the bucket
+    views = Column(Integer, nullable=False, default=0)
+    clicks = Column(Integer, nullable=False, default=0)
@@ -1,15 +1,23 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON, Index, event, inspect, update
+from sqlalchemy.orm import column_property, object_session, relationship
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql import func, literal_column
 from app.db.database import Base
+from app.models.industry import Industry
 
 class Business(Base):
     __tablename__ = "businesses"
+    __table_args__ = (
+        # Newest-first listings and their keyset cursors
+        Index("ix_businesses_created_at_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     industry = Column(String, nullable=True)  # Legacy field - will be deprecated
-    industry_id = Column(Integer, ForeignKey("industries.id"), nullable=True)
+    # Active history keeps the previous value so industry counts can be moved
+    industry_id = column_property(Column(Integer, ForeignKey("industries.id"), nullable=True), active_history=True)
     description = Column(Text, nullable=True)
     website_url = Column(String, nullable=True)
     location = Column(String, nullable=True)
@@ -27,6 +35,8 @@ class Business(Base):
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Incremented by every UPDATE, including bulk ones; used for ETags
+    row_version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("row_version") + 1)
     
     # Foreign keys
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -35,4 +45,38 @@ class Business(Base):
     owner = relationship("User", back_populates="businesses")
     industry_ref = relationship("Industry", back_populates="businesses")
     content = relationship("Content", back_populates="business", cascade="all, delete-orphan")
-    campaigns = relationship("Campaign", back_populates="business", cascade="all, delete-orphan")
\ No newline at end of file
+    campaigns = relationship("Campaign", back_populates="business", cascade="all, delete-orphan")
+
+def _adjust_business_count(target, connection, industry_id, delta: int) -> None:
+    """Increment an industry's business_count within the current flush"""
+    if industry_id is None:
+        return
+    industries = Industry.__table__
+    connection.execute(
+        update(industries)
+        .where(industries.c.id == industry_id)
+        .values(business_count=industries.c.business_count + delta)
+    )
+    # Sessions keep state across commits, so bring an already-loaded
+    # industry in line with the row instead of leaving the old count
+    session = object_session(target)
+    industry = session.identity_map.get(identity_key(Industry, industry_id)) if session else None
+    if industry is not None and "business_count" in industry.__dict__:
+        set_committed_value(industry, "business_count", industry.business_count + delta)
+
+@event.listens_for(Business, "after_insert")
+def _business_inserted(mapper, connection, target):
+    _adjust_business_count(target, connection, target.industry_id, 1)
+
+@event.listens_for(Business, "after_delete")
+def _business_deleted(mapper, connection, target):
+    _adjust_business_count(target, connection, target.industry_id, -1)
+
+@event.listens_for(Business, "after_update")
+def _business_updated(mapper, connection, target):
+    history = inspect(target).attrs.industry_id.history
+    if not history.has_changes():
+        return
+    for old_industry_id in history.deleted:
+        _adjust_business_count(target, connection, old_industry_id, -1)
+    _adjust_business_count(target, connection, target.industry_id, 1)
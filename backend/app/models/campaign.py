@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON, Boolean, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON, Boolean, Enum, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, literal_column
 from app.db.database import Base
 import enum
 
@@ -21,6 +21,14 @@ class CampaignType(enum.Enum):
 
 class Campaign(Base):
     __tablename__ = "campaigns"
+    __table_args__ = (
+        # Newest-first listings and their keyset cursors
+        Index("ix_campaigns_created_at_id", "created_at", "id"),
+        Index("ix_campaigns_business_id_created_at_id", "business_id", "created_at", "id"),
+        # Status filters, per business and across all businesses
+        Index("ix_campaigns_business_id_status", "business_id", "status"),
+        Index("ix_campaigns_status", "status"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -57,6 +65,8 @@ class Campaign(Base):
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Incremented by every UPDATE, including bulk ones; used for ETags
+    row_version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("row_version") + 1)
     
     # Foreign keys
     business_id = Column(Integer, ForeignKey("businesses.id"), nullable=False)
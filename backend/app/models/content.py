@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum, JSON, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum, JSON, Boolean, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text, literal_column
 from app.db.database import Base
 import enum
 
@@ -25,6 +25,24 @@ class ContentStatus(enum.Enum):
 
 class Content(Base):
     __tablename__ = "content"
+    __table_args__ = (
+        # Newest-first listings and their keyset cursors
+        Index("ix_content_created_at_id", "created_at", "id"),
+        Index("ix_content_business_id_created_at_id", "business_id", "created_at", "id"),
+        # Status filters and the publishing scheduler
+        Index("ix_content_status_scheduled_publish_at", "status", "scheduled_publish_at"),
+        # Small partial indexes for the two work queues (PostgreSQL and SQLite)
+        Index(
+            "ix_content_scheduled_due", "scheduled_publish_at",
+            postgresql_where=text("status = 'SCHEDULED'"),
+            sqlite_where=text("status = 'SCHEDULED'"),
+        ),
+        Index(
+            "ix_content_pending_approval", "business_id", "created_at",
+            postgresql_where=text("status = 'PENDING_APPROVAL'"),
+            sqlite_where=text("status = 'PENDING_APPROVAL'"),
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -59,6 +77,8 @@ class Content(Base):
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Incremented by every UPDATE, including bulk ones; used for ETags
+    row_version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=literal_column("row_version") + 1)
     
     # Foreign keys with cascading delete
     business_id = Column(Integer, ForeignKey("businesses.id", ondelete="CASCADE"), nullable=False)
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.database import Base
 
 class Industry(Base):
     __tablename__ = "industries"
+    __table_args__ = (
+        # Active industries in display order
+        Index("ix_industries_is_active_sort_order_name", "is_active", "sort_order", "name"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, unique=True, index=True)
@@ -14,6 +18,7 @@ class Industry(Base):
     color = Column(String, nullable=True)  # Hex color for UI
     sort_order = Column(Integer, default=0)  # For custom ordering
     is_active = Column(Boolean, default=True)  # Soft delete
+    business_count = Column(Integer, nullable=False, default=0, server_default="0")  # Maintained by Business mapper events
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
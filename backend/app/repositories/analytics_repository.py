@@ -0,0 +1,196 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import delete, func, insert, or_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.analytics import EngagementRollup
+from app.models.content import Content, ContentType
+from app.repositories.base_repository import BaseRepository
+
+HOUR = "hour"
+DAY = "day"
+BUCKET_SIZES = {HOUR: timedelta(hours=1), DAY: timedelta(days=1)}
+
+# (hour bucket start, business_id, campaign_id, content_type, platform) -> views, clicks
+RollupKey = Tuple[datetime, int, int, str, str]
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE; others take a slower row-by-row path
+_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+_DIMENSIONS = ("granularity", "bucket_start", "business_id", "campaign_id", "content_type", "platform")
+
+def has_native_upsert(dialect_name: str) -> bool:
+    """Whether rollups for ``dialect_name`` are written with a single upsert statement"""
+    return dialect_name in _INSERTS
+
+def as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC and convert aware ones to UTC"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def bucket_start(value: datetime, granularity: str) -> datetime:
+    """Start of the UTC hour or day containing ``value``"""
+    value = as_utc(value).replace(minute=0, second=0, microsecond=0)
+    if granularity == DAY:
+        value = value.replace(hour=0)
+    return value
+
+def default_platform(content_type: ContentType) -> str:
+    """Platform implied by a content type, e.g. ``linkedin`` for LinkedIn posts"""
+    return content_type.value.removesuffix("_post")
+
+class AnalyticsRepository(BaseRepository[EngagementRollup]):
+    def __init__(self, db: Session):
+        super().__init__(db, EngagementRollup)
+    
+    def apply_rollup_deltas(
+        self,
+        deltas: Iterable[Tuple[RollupKey, int, int]],
+        commit: bool = True
+    ) -> int:
+        """Add hourly ``(key, views, clicks)`` deltas to the hourly and daily rollups"""
+        totals: Dict[tuple, List[int]] = {}
+        for (hour, business_id, campaign_id, content_type, platform), views, clicks in deltas:
+            for granularity in (HOUR, DAY):
+                key = (granularity, bucket_start(hour, granularity), business_id, campaign_id or 0, content_type, platform)
+                total = totals.setdefault(key, [0, 0])
+                total[0] += views
+                total[1] += clicks
+        if not totals:
+            return 0
+        
+        table = EngagementRollup.__table__
+        # Sorted so concurrent flushes lock rows in the same order
+        params = [
+            {
+                "granularity": granularity,
+                "bucket_start": start,
+                "business_id": business_id,
+                "campaign_id": campaign_id,
+                "content_type": content_type,
+                "platform": platform,
+                "views": views,
+                "clicks": clicks,
+            }
+            for (granularity, start, business_id, campaign_id, content_type, platform), (views, clicks)
+            in sorted(totals.items())
+        ]
+        dialect_insert = _INSERTS.get(self.db.get_bind().dialect.name)
+        if dialect_insert is None:
+            self._add_rollups_row_by_row(params)
+        else:
+            statement = dialect_insert(table)
+            statement = statement.on_conflict_do_update(
+                index_elements=list(_DIMENSIONS),
+                set_={
+                    "views": table.c.views + statement.excluded.views,
+                    "clicks": table.c.clicks + statement.excluded.clicks,
+                }
+            )
+            self.db.connection().execute(statement, params)
+        if commit:
+            self._commit()
+        return len(params)
+    
+    def _add_rollups_row_by_row(self, params: List[Dict[str, Any]]) -> None:
+        """Portable upsert: add to each existing bucket, then insert the ones that matched nothing"""
+        table = EngagementRollup.__table__
+        connection = self.db.connection()
+        missing = []
+        for row in params:
+            result = connection.execute(
+                update(table)
+                .where(*(table.c[name] == row[name] for name in _DIMENSIONS))
+                .values(views=table.c.views + row["views"], clicks=table.c.clicks + row["clicks"])
+            )
+            if result.rowcount == 0:
+                missing.append(row)
+        if missing:
+            connection.execute(insert(table), missing)
+    
+    def get_timeseries(
+        self,
+        business_id: int,
+        granularity: str,
+        start: datetime,
+        end: datetime,
+        campaign_id: Optional[int] = None,
+        content_type: Optional[ContentType] = None,
+        platform: Optional[str] = None
+    ) -> List[Tuple[datetime, int, int]]:
+        """Get ``(bucket_start, views, clicks)`` for every bucket in ``[start, end)``, zero-filled"""
+        start = bucket_start(start, granularity)
+        end = as_utc(end)
+        query = (
+            self.db.query(
+                EngagementRollup.bucket_start,
+                func.sum(EngagementRollup.views).label("views"),
+                func.sum(EngagementRollup.clicks).label("clicks")
+            )
+            .filter(
+                EngagementRollup.business_id == business_id,
+                EngagementRollup.granularity == granularity,
+                EngagementRollup.bucket_start >= start,
+                EngagementRollup.bucket_start < end
+            )
+        )
+        if campaign_id is not None:
+            query = query.filter(EngagementRollup.campaign_id == campaign_id)
+        if content_type is not None:
+            query = query.filter(EngagementRollup.content_type == content_type.value)
+        if platform is not None:
+            query = query.filter(EngagementRollup.platform == platform)
+        
+        rows = {
+            as_utc(row.bucket_start): (int(row.views), int(row.clicks))
+            for row in query.group_by(EngagementRollup.bucket_start)
+        }
+        step = BUCKET_SIZES[granularity]
+        points = []
+        current = start
+        while current < end:
+            views, clicks = rows.get(current, (0, 0))
+            points.append((current, views, clicks))
+            current += step
+        return points
+    
+    def rebuild_from_content(self, business_id: Optional[int] = None) -> int:
+        """Replace the rollups with totals recomputed from content counters.
+        
+        Content rows only keep lifetime totals, so each row's views and clicks
+        are attributed to the hour it was published (or created, if it was
+        never published).
+        """
+        clear = delete(EngagementRollup)
+        rows = self.db.query(
+            Content.business_id,
+            Content.campaign_id,
+            Content.content_type,
+            func.coalesce(Content.published_at, Content.created_at).label("occurred_at"),
+            Content.views,
+            Content.clicks
+        ).filter(or_(Content.views > 0, Content.clicks > 0))
+        if business_id is not None:
+            clear = clear.where(EngagementRollup.business_id == business_id)
+            rows = rows.filter(Content.business_id == business_id)
+        
+        self.db.execute(clear)
+        written = self.apply_rollup_deltas(
+            (
+                (
+                    (
+                        bucket_start(row.occurred_at, HOUR),
+                        row.business_id,
+                        row.campaign_id,
+                        row.content_type.value,
+                        default_platform(row.content_type)
+                    ),
+                    row.views or 0,
+                    row.clicks or 0
+                )
+                for row in rows.yield_per(1000)
+            ),
+            commit=False
+        )
+        self._commit()
+        return written
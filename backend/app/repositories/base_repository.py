@@ -1,10 +1,18 @@
-from sqlalchemy.orm import Session
-from typing import Generic, TypeVar, Type, List, Optional, Dict, Any
+from sqlalchemy import delete, inspect, update
+from sqlalchemy.orm import RelationshipDirection, Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+from typing import Generic, TypeVar, Type, List, Optional, Dict, Any, Iterable, Tuple
 from app.db.database import Base
+from app.repositories.pagination import paginate
 
 ModelType = TypeVar("ModelType", bound=Base)
 
 class BaseRepository(Generic[ModelType]):
+    # Set by repositories whose models react to updates in mapper events,
+    # which only fire when changes are flushed from a loaded object
+    update_through_session = False
+    
     def __init__(self, db: Session, model: Type[ModelType]):
         self.db = db
         self.model = model
@@ -13,34 +21,124 @@ class BaseRepository(Generic[ModelType]):
         """Create a new record"""
         db_obj = self.model(**obj_data)
         self.db.add(db_obj)
-        self.db.commit()
-        self.db.refresh(db_obj)
+        # Server defaults come back with the INSERT via RETURNING, so there
+        # is nothing left to refresh
+        self._commit(db_obj)
         return db_obj
     
     def get_by_id(self, id: int) -> Optional[ModelType]:
         """Get record by ID"""
         return self.db.query(self.model).filter(self.model.id == id).first()
     
+    def get_by_ids(self, ids: Iterable[int]) -> List[ModelType]:
+        """Get records for several IDs in one query"""
+        ids = list(ids)
+        if not ids:
+            return []
+        return self.db.query(self.model).filter(self.model.id.in_(ids)).all()
+    
+    def create_many(self, objs_data: List[Dict[str, Any]]) -> List[ModelType]:
+        """Create several records in a single transaction"""
+        db_objs = [self.model(**obj_data) for obj_data in objs_data]
+        if not db_objs:
+            return []
+        self.db.add_all(db_objs)
+        self._commit(*db_objs)
+        return db_objs
+    
     def get_multi(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
         """Get multiple records with pagination"""
         return self.db.query(self.model).offset(skip).limit(limit).all()
     
+    def get_page(
+        self,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """Get a page of records, newest first, with the cursor for the next page"""
+        return paginate(self.db.query(self.model), self.model, cursor=cursor, skip=skip, limit=limit)
+    
     def update(self, id: int, obj_data: Dict[str, Any]) -> Optional[ModelType]:
-        """Update a record"""
-        db_obj = self.get_by_id(id)
+        """Update a record with one UPDATE ... RETURNING, without loading it first"""
+        if self.update_through_session:
+            return self._update_loaded(id, obj_data)
+        columns = inspect(self.model).column_attrs.keys()
+        values = {key: value for key, value in obj_data.items() if key in columns}
+        if not values:
+            return self.get_by_id(id)
+        # A returned row only fills in an already-loaded object's expired
+        # attributes, so expire it up front to take the new values
+        self._expire_loaded([id])
+        db_obj = self.db.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        self._commit(db_obj)
+        return db_obj
+    
+    def _update_loaded(self, id: int, obj_data: Dict[str, Any]) -> Optional[ModelType]:
+        db_obj = self.db.get(self.model, id)
         if db_obj:
             for key, value in obj_data.items():
                 if hasattr(db_obj, key):
                     setattr(db_obj, key, value)
-            self.db.commit()
-            self.db.refresh(db_obj)
+            self._commit(db_obj)
         return db_obj
     
     def delete(self, id: int) -> bool:
         """Delete a record"""
-        db_obj = self.get_by_id(id)
-        if db_obj:
+        if self._has_dependents():
+            # Cascades and foreign-key nulling on dependent rows need the ORM
+            db_obj = self.db.get(self.model, id)
+            if not db_obj:
+                return False
             self.db.delete(db_obj)
             self.db.commit()
             return True
-        return False
\ No newline at end of file
+        deleted_id = self.db.execute(
+            delete(self.model).where(self.model.id == id).returning(self.model.id)
+        ).scalar_one_or_none()
+        self.db.commit()
+        return deleted_id is not None
+    
+    def _commit(self, *db_objs: Optional[ModelType]) -> None:
+        """Commit, keeping the column values ``db_objs`` were just written or returned with.
+
+        The session still expires everything else on commit; only these
+        objects skip the SELECT that would otherwise reload them on next access.
+        """
+        db_objs = [db_obj for db_obj in db_objs if db_obj is not None]
+        inserted = {id(db_obj) for db_obj in db_objs if inspect(db_obj).pending}
+        self.db.flush()
+        columns = inspect(self.model).column_attrs
+        written = []
+        for db_obj in db_objs:
+            values = {key: db_obj.__dict__[key] for key in columns.keys() if key in db_obj.__dict__}
+            if id(db_obj) in inserted:
+                # Columns left unset were inserted as NULL unless the
+                # database filled them in, which RETURNING already brought back
+                for key, attr in columns.items():
+                    if key not in values and attr.columns[0].server_default is None:
+                        values[key] = None
+            written.append((db_obj, values))
+        self.db.commit()
+        for db_obj, values in written:
+            for key, value in values.items():
+                set_committed_value(db_obj, key, value)
+    
+    def _expire_loaded(self, ids: Iterable[int]) -> None:
+        """Reload rows changed behind the session's back (Core bulk updates) on next access"""
+        for id in ids:
+            db_obj = self.db.identity_map.get(identity_key(self.model, id))
+            if db_obj is not None:
+                self.db.expire(db_obj)
+    
+    def _has_dependents(self) -> bool:
+        return any(
+            relationship.direction is RelationshipDirection.ONETOMANY
+            for relationship in inspect(self.model).relationships
+        )
\ No newline at end of file
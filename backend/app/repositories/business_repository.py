@@ -4,6 +4,9 @@ from app.models.business import Business
 from app.repositories.base_repository import BaseRepository
 
 class BusinessRepository(BaseRepository[Business]):
+    # Industry business counts follow industry_id changes in mapper events
+    update_through_session = True
+    
     def __init__(self, db: Session):
         super().__init__(db, Business)
     
@@ -1,7 +1,9 @@
+from sqlalchemy import bindparam, case, func, update
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from app.models.campaign import Campaign, CampaignStatus, CampaignType
 from app.repositories.base_repository import BaseRepository
+from app.repositories.pagination import paginate
 from datetime import datetime
 
 class CampaignRepository(BaseRepository[Campaign]):
@@ -22,6 +24,21 @@ class CampaignRepository(BaseRepository[Campaign]):
         
         return query.offset(skip).limit(limit).all()
     
+    def get_page(
+        self,
+        business_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Campaign], Optional[str]]:
+        """Get a page of campaigns, newest first, with the cursor for the next page"""
+        query = self.db.query(Campaign)
+        
+        if business_id:
+            query = query.filter(Campaign.business_id == business_id)
+        
+        return paginate(query, Campaign, cursor=cursor, skip=skip, limit=limit)
+    
     def get_by_status(self, status: CampaignStatus, skip: int = 0, limit: int = 100) -> List[Campaign]:
         """Get campaigns by status"""
         return (
@@ -53,47 +70,76 @@ class CampaignRepository(BaseRepository[Campaign]):
     
     def start_campaign(self, campaign_id: int) -> Optional[Campaign]:
         """Start a campaign (set status to active)"""
-        campaign = self.get_by_id(campaign_id)
-        if campaign:
-            campaign.status = CampaignStatus.ACTIVE
-            if not campaign.start_date:
-                campaign.start_date = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(campaign)
-        return campaign
+        return self.update(campaign_id, {
+            "status": CampaignStatus.ACTIVE,
+            "start_date": func.coalesce(Campaign.start_date, datetime.utcnow())
+        })
     
     def pause_campaign(self, campaign_id: int) -> Optional[Campaign]:
         """Pause a campaign"""
-        campaign = self.get_by_id(campaign_id)
-        if campaign:
-            campaign.status = CampaignStatus.PAUSED
-            self.db.commit()
-            self.db.refresh(campaign)
-        return campaign
+        return self.update(campaign_id, {"status": CampaignStatus.PAUSED})
     
     def complete_campaign(self, campaign_id: int) -> Optional[Campaign]:
         """Mark campaign as completed"""
-        campaign = self.get_by_id(campaign_id)
-        if campaign:
-            campaign.status = CampaignStatus.COMPLETED
-            campaign.end_date = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(campaign)
-        return campaign
+        return self.update(campaign_id, {"status": CampaignStatus.COMPLETED, "end_date": datetime.utcnow()})
     
     def update_campaign_metrics(self, campaign_id: int, content_pieces: int = 0, published: int = 0, views: int = 0, clicks: int = 0) -> Optional[Campaign]:
         """Update campaign performance metrics"""
-        campaign = self.get_by_id(campaign_id)
-        if campaign:
-            campaign.total_content_pieces += content_pieces
-            campaign.published_content += published
-            campaign.total_views += views
-            campaign.total_clicks += clicks
-            
-            # Calculate average engagement rate
-            if campaign.total_views > 0:
-                campaign.avg_engagement_rate = int((campaign.total_clicks / campaign.total_views) * 100 * 100)
-            
-            self.db.commit()
-            self.db.refresh(campaign)
-        return campaign
\ No newline at end of file
+        # Increment in the database so concurrent updates can't overwrite each other
+        total_views = func.coalesce(Campaign.total_views, 0) + views
+        total_clicks = func.coalesce(Campaign.total_clicks, 0) + clicks
+        self._expire_loaded([campaign_id])
+        campaign = self.db.execute(
+            update(Campaign)
+            .where(Campaign.id == campaign_id)
+            .values(
+                total_content_pieces=func.coalesce(Campaign.total_content_pieces, 0) + content_pieces,
+                published_content=func.coalesce(Campaign.published_content, 0) + published,
+                total_views=total_views,
+                total_clicks=total_clicks,
+                # Average engagement rate, stored as percentage * 100
+                avg_engagement_rate=case(
+                    (total_views > 0, total_clicks * 10000 // total_views),
+                    else_=Campaign.avg_engagement_rate
+                )
+            )
+            .returning(Campaign)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        self._commit(campaign)
+        return campaign
+    
+    def apply_metric_deltas(self, deltas: Iterable[Tuple[int, int, int]], commit: bool = True) -> int:
+        """Add ``(campaign_id, views, clicks)`` deltas to campaign totals in one statement batch"""
+        totals: Dict[int, List[int]] = {}
+        for campaign_id, views, clicks in deltas:
+            total = totals.setdefault(campaign_id, [0, 0])
+            total[0] += views
+            total[1] += clicks
+        if not totals:
+            return 0
+        
+        table = Campaign.__table__
+        total_views = func.coalesce(table.c.total_views, 0) + bindparam("views_delta")
+        total_clicks = func.coalesce(table.c.total_clicks, 0) + bindparam("clicks_delta")
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("campaign_id"))
+            .values(
+                total_views=total_views,
+                total_clicks=total_clicks,
+                avg_engagement_rate=case(
+                    (total_views > 0, total_clicks * 10000 // total_views),
+                    else_=table.c.avg_engagement_rate
+                ),
+            )
+        )
+        params = [
+            {"campaign_id": campaign_id, "views_delta": views, "clicks_delta": clicks}
+            for campaign_id, (views, clicks) in sorted(totals.items())
+        ]
+        self.db.connection().execute(statement, params)
+        self._expire_loaded(totals)
+        if commit:
+            self._commit()
+        return len(params)
\ No newline at end of file
@@ -1,7 +1,10 @@
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+from sqlalchemy import bindparam, case, func, update
+from sqlalchemy.orm import Session, joinedload, load_only
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from app.models.business import Business
 from app.models.content import Content, ContentType, ContentStatus
 from app.repositories.base_repository import BaseRepository
+from app.repositories.pagination import paginate
 from datetime import datetime
 
 class ContentRepository(BaseRepository[Content]):
@@ -13,10 +16,49 @@ class ContentRepository(BaseRepository[Content]):
         business_id: Optional[int] = None,
         content_type: Optional[str] = None,
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None
     ) -> List[Content]:
-        """Get content with optional filters"""
-        query = self.db.query(Content).options(joinedload(Content.business))
+        """Get content with optional filters, loading only ``fields`` if given"""
+        query = self._filtered_query(business_id, content_type, fields)
+        return query.order_by(Content.created_at.desc()).offset(skip).limit(limit).all()
+    
+    def get_page(
+        self,
+        business_id: Optional[int] = None,
+        content_type: Optional[str] = None,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Content], Optional[str]]:
+        """Get a page of content, newest first, with the cursor for the next page"""
+        query = self._filtered_query(business_id, content_type, fields)
+        return paginate(query, Content, cursor=cursor, skip=skip, limit=limit)
+    
+    def _filtered_query(
+        self,
+        business_id: Optional[int],
+        content_type: Optional[str],
+        fields: Optional[Sequence[str]] = None
+    ):
+        query = self.db.query(Content)
+        if fields is None:
+            query = query.options(joinedload(Content.business))
+        else:
+            # Select only the requested columns; the rest, notably content_text
+            # and the AI prompt, stay deferred and are never fetched
+            columns = [getattr(Content, name) for name in fields if name in Content.__table__.c]
+            # Always needed for cursors and ETags
+            query = query.options(load_only(
+                Content.business_id, Content.created_at, Content.updated_at, Content.row_version, *columns
+            ))
+            if "business" in fields:
+                query = query.options(
+                    joinedload(Content.business).load_only(
+                        Business.name, Business.industry, Business.created_at, Business.updated_at, Business.row_version
+                    )
+                )
         
         if business_id:
             query = query.filter(Content.business_id == business_id)
@@ -24,7 +66,7 @@ class ContentRepository(BaseRepository[Content]):
         if content_type:
             query = query.filter(Content.content_type == content_type)
         
-        return query.order_by(Content.created_at.desc()).offset(skip).limit(limit).all()
+        return query
     
     def get_by_status(self, status: ContentStatus, skip: int = 0, limit: int = 100) -> List[Content]:
         """Get content by status"""
@@ -56,12 +98,7 @@ class ContentRepository(BaseRepository[Content]):
     
     def update_status(self, content_id: int, status: ContentStatus) -> Optional[Content]:
         """Update content status"""
-        content = self.get_by_id(content_id)
-        if content:
-            content.status = status
-            self.db.commit()
-            self.db.refresh(content)
-        return content
+        return self.update(content_id, {"status": status})
 
     def save_as_draft(self, content_id: int) -> Optional[Content]:
         """Save content as draft"""
@@ -73,21 +110,63 @@ class ContentRepository(BaseRepository[Content]):
     
     def publish_content(self, content_id: int) -> Optional[Content]:
         """Mark content as published"""
-        content = self.update_status(content_id, ContentStatus.PUBLISHED)
-        if content:
-            content.published_at = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(content)
-        return content
+        return self.update(content_id, {"status": ContentStatus.PUBLISHED, "published_at": datetime.utcnow()})
     
     def update_performance_metrics(self, content_id: int, views: int = 0, clicks: int = 0, engagement_rate: int = 0) -> Optional[Content]:
         """Update content performance metrics"""
-        content = self.get_by_id(content_id)
-        if content:
-            content.views += views
-            content.clicks += clicks
-            if engagement_rate > 0:
-                content.engagement_rate = engagement_rate
-            self.db.commit()
-            self.db.refresh(content)
-        return content
\ No newline at end of file
+        # Increment in the database so concurrent updates can't overwrite each other
+        values = {
+            "views": func.coalesce(Content.views, 0) + views,
+            "clicks": func.coalesce(Content.clicks, 0) + clicks,
+        }
+        if engagement_rate > 0:
+            values["engagement_rate"] = engagement_rate
+        self._expire_loaded([content_id])
+        content = self.db.execute(
+            update(Content)
+            .where(Content.id == content_id)
+            .values(**values)
+            .returning(Content)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        self._commit(content)
+        return content
+    
+    def apply_metric_deltas(self, deltas: Iterable[Tuple[int, int, int]], commit: bool = True) -> int:
+        """Add ``(content_id, views, clicks)`` deltas in one transaction.
+
+        Deltas for the same content are summed first, and rows are updated in
+        id order so concurrent batches lock rows in the same order. The
+        engagement rate is recomputed from the new totals. Returns the number
+        of distinct content ids in the batch.
+        """
+        totals: Dict[int, List[int]] = {}
+        for content_id, views, clicks in deltas:
+            total = totals.setdefault(content_id, [0, 0])
+            total[0] += views
+            total[1] += clicks
+        if not totals:
+            return 0
+        
+        table = Content.__table__
+        views = func.coalesce(table.c.views, 0) + bindparam("views_delta")
+        clicks = func.coalesce(table.c.clicks, 0) + bindparam("clicks_delta")
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("content_id"))
+            .values(
+                views=views,
+                clicks=clicks,
+                # Click-through rate, stored as percentage * 100
+                engagement_rate=case((views > 0, clicks * 10000 // views), else_=table.c.engagement_rate),
+            )
+        )
+        params = [
+            {"content_id": content_id, "views_delta": views, "clicks_delta": clicks}
+            for content_id, (views, clicks) in sorted(totals.items())
+        ]
+        self.db.connection().execute(statement, params)
+        self._expire_loaded(totals)
+        if commit:
+            self._commit()
+        return len(params)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, update
 from typing import List, Optional
 from app.models.industry import Industry
 from app.models.business import Business
@@ -24,44 +24,36 @@ class IndustryRepository(BaseRepository[Industry]):
         """Get industry by slug"""
         return self.db.query(Industry).filter(Industry.slug == slug).first()
     
-    def get_with_business_count(self, industry_id: int) -> Optional[Industry]:
-        """Get industry with business count"""
-        industry = self.get_by_id(industry_id)
-        if industry:
-            business_count = (
-                self.db.query(func.count(Business.id))
-                .filter(Business.industry_id == industry_id)
-                .scalar()
-            )
-            # Add business_count as a dynamic attribute
-            industry.business_count = business_count or 0
-        return industry
-    
     def get_industries_with_counts(self, skip: int = 0, limit: int = 100, active_only: bool = True) -> List[Industry]:
-        """Get industries with business counts"""
-        query = (
-            self.db.query(
-                Industry.id,
-                Industry.name,
-                Industry.slug,
-                Industry.description,
-                Industry.icon,
-                Industry.color,
-                Industry.sort_order,
-                Industry.is_active,
-                Industry.created_at,
-                Industry.updated_at,
-                func.count(Business.id).label('business_count')
-            )
-            .outerjoin(Business, Industry.id == Business.industry_id)
-            .group_by(Industry.id)
-            .order_by(Industry.sort_order.asc(), Industry.name.asc())
-        )
+        """Get industries in display order; business counts are stored on each row"""
+        query = self.db.query(Industry)
         
         if active_only:
             query = query.filter(Industry.is_active == True)
-            
-        return query.offset(skip).limit(limit).all()
+        
+        return (
+            query.order_by(Industry.sort_order.asc(), Industry.name.asc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+    
+    def reconcile_business_counts(self) -> int:
+        """Recount businesses per industry, fixing counts that drifted; returns industries corrected"""
+        # Bulk and raw SQL changes to businesses bypass the mapper events
+        actual = (
+            select(func.count(Business.id))
+            .where(Business.industry_id == Industry.id)
+            .scalar_subquery()
+        )
+        result = self.db.execute(
+            update(Industry)
+            .where(Industry.business_count != actual)
+            .values(business_count=actual)
+            .execution_options(synchronize_session="fetch")
+        )
+        self._commit()
+        return result.rowcount
     
     def search_by_name(self, name: str, skip: int = 0, limit: int = 100) -> List[Industry]:
         """Search industries by name"""
@@ -77,18 +69,8 @@ class IndustryRepository(BaseRepository[Industry]):
     
     def deactivate(self, industry_id: int) -> bool:
         """Soft delete an industry by marking as inactive"""
-        industry = self.get_by_id(industry_id)
-        if industry:
-            industry.is_active = False
-            self.db.commit()
-            return True
-        return False
+        return self.update(industry_id, {"is_active": False}) is not None
     
     def activate(self, industry_id: int) -> bool:
         """Reactivate an industry"""
-        industry = self.get_by_id(industry_id)
-        if industry:
-            industry.is_active = True
-            self.db.commit()
-            return True
-        return False
\ No newline at end of file
+        return self.update(industry_id, {"is_active": True}) is not None
\ No newline at end of file
@@ -0,0 +1,66 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Query
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """Build an opaque cursor pointing just after a row"""
+    payload = json.dumps([created_at.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Parse a cursor produced by ``encode_cursor``"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(id)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def paginate(
+    query: Query,
+    model: Any,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100
+) -> Tuple[List[Any], Optional[str]]:
+    """Return one page of ``query``, newest first, and the cursor for the next page.
+
+    Rows are ordered by ``(created_at, id)`` descending so the
+    ``(..., created_at, id)`` indexes can serve both the ordering and the
+    cursor seek. ``skip`` is still honoured for offset-based callers, but a
+    cursor keeps page cost constant however deep the client has scrolled.
+    The next cursor is ``None`` on the last page.
+    """
+    if limit <= 0:
+        return [], None
+    if cursor:
+        created_at, id = decode_cursor(cursor)
+        column = model.created_at
+        if query.session.get_bind().dialect.name == "sqlite":
+            # SQLite stores timestamps as text whose precision depends on
+            # how the row was written, so compare them numerically
+            column, created_at = func.julianday(column), func.julianday(created_at)
+        # Row-value comparison lets PostgreSQL seek the composite index directly
+        query = query.filter(tuple_(column, model.id) < tuple_(created_at, id))
+
+    rows = (
+        query.order_by(model.created_at.desc(), model.id.desc())
+        .offset(skip)
+        .limit(limit + 1)
+        .all()
+    )
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
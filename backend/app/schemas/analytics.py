@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+from app.models.content import ContentType
+import enum
+
+class AnalyticsGranularity(str, enum.Enum):
+    HOUR = "hour"
+    DAY = "day"
+
+class TimeseriesPoint(BaseModel):
+    bucket_start: datetime = Field(..., description="UTC start of the hour or day")
+    views: int
+    clicks: int
+
+class TimeseriesResponse(BaseModel):
+    business_id: int
+    granularity: AnalyticsGranularity
+    start: datetime
+    end: datetime
+    campaign_id: Optional[int] = None
+    content_type: Optional[ContentType] = None
+    platform: Optional[str] = None
+    total_views: int
+    total_clicks: int
+    points: List[TimeseriesPoint]
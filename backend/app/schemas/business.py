@@ -5,6 +5,7 @@ from datetime import datetime
 class BusinessBase(BaseModel):
     name: str
     industry: Optional[str] = None
+    industry_id: Optional[int] = None
     description: Optional[str] = None
     website_url: Optional[str] = None
     location: Optional[str] = None
@@ -21,6 +22,7 @@ class BusinessCreate(BusinessBase):
 class BusinessUpdate(BaseModel):
     name: Optional[str] = None
     industry: Optional[str] = None
+    industry_id: Optional[int] = None
     description: Optional[str] = None
     website_url: Optional[str] = None
     location: Optional[str] = None
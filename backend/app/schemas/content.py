@@ -1,7 +1,9 @@
-from pydantic import BaseModel
-from typing import Optional, List, Dict
+from pydantic import BaseModel, ConfigDict, Field, create_model
+from typing import Optional, List, Dict, Tuple, Type
 from datetime import datetime
+from functools import lru_cache
 from app.models.content import ContentType, ContentStatus
+import enum
 
 class ContentBase(BaseModel):
     title: str
@@ -62,4 +64,72 @@ class ContentResponse(ContentBase):
     business: Optional[BusinessInfo] = None
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ContentListView(str, enum.Enum):
+    FULL = "full"
+    SUMMARY = "summary"
+
+class ContentSummary(BaseModel):
+    """List projection without the body, prompt and generation settings"""
+    id: int
+    business_id: int
+    campaign_id: Optional[int] = None
+    title: str
+    content_type: ContentType
+    status: ContentStatus
+    meta_description: Optional[str] = None
+    seo_score: Optional[int] = None
+    scheduled_publish_at: Optional[datetime] = None
+    published_at: Optional[datetime] = None
+    views: int = 0
+    clicks: int = 0
+    engagement_rate: int = 0
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+@lru_cache(maxsize=128)
+def content_projection(fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """A ContentResponse variant with only ``fields``, for ``?fields=`` requests"""
+    return create_model(
+        "ContentProjection",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (ContentResponse.model_fields[name].annotation, ContentResponse.model_fields[name]) for name in fields}
+    )
+
+class ContentBatchGenerate(BaseModel):
+    items: List[ContentGenerate] = Field(..., min_length=1, max_length=100)
+
+class ContentBatchItemResult(BaseModel):
+    index: int  # Position of the item in the request
+    business_id: int
+    content: Optional[ContentResponse] = None
+    error: Optional[str] = None
+
+class ContentBatchResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[ContentBatchItemResult]
+
+class GenerationJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+class GenerationJobResponse(BaseModel):
+    id: str
+    status: GenerationJobStatus
+    stage: str
+    progress: int = 0
+    content_id: Optional[int] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    content: Optional[ContentResponse] = None
+    
+    class Config:
+        from_attributes = True
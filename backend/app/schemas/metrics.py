@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+import enum
+
+class EngagementEventType(str, enum.Enum):
+    VIEW = "view"
+    CLICK = "click"
+
+class EngagementEvent(BaseModel):
+    content_id: int
+    type: EngagementEventType
+    count: int = Field(1, ge=1, le=1_000_000, description="Number of identical events this line represents")
+    occurred_at: Optional[datetime] = Field(None, description="When the events happened; defaults to when they are received")
+    platform: Optional[str] = Field(
+        None,
+        pattern=r"^[a-z0-9_]{1,32}$",
+        description="Where the events happened; defaults to the platform of the content type"
+    )
+
+class EventIngestError(BaseModel):
+    line: int = Field(..., description="1-based line number in the request body")
+    detail: str
+
+class EventIngestResponse(BaseModel):
+    accepted: int
+    rejected: int
+    errors: List[EventIngestError] = Field(default_factory=list, description="First few rejected lines")
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+import enum
+
+class SearchResultType(str, enum.Enum):
+    BUSINESS = "business"
+    INDUSTRY = "industry"
+    CONTENT = "content"
+
+class SearchResult(BaseModel):
+    type: SearchResultType
+    id: int
+    title: str = Field(..., description="Business or industry name, or content title")
+    snippet: Optional[str] = Field(None, description="Start of the description or content body")
+    business_id: Optional[int] = Field(None, description="Owning business for content results")
+    score: float = Field(..., description="Relevance; only comparable within one response")
+
+class SearchResponse(BaseModel):
+    query: str
+    results: List[SearchResult]
@@ -18,4 +18,14 @@ class KeywordSuggestionsRequest(BaseModel):
     description: Optional[str] = Field(None, description="Additional context for keyword generation")
 
 class KeywordSuggestionsResponse(BaseModel):
-    suggestions: List[str] = Field(..., description="List of AI-generated keyword suggestions")
\ No newline at end of file
+    suggestions: List[str] = Field(..., description="List of AI-generated keyword suggestions")
+
+class SuggestionCacheStatsResponse(BaseModel):
+    hits: int = Field(..., description="Lookups answered from any cache tier")
+    memory_hits: int = Field(..., description="Lookups answered from the in-process LRU")
+    redis_hits: int = Field(..., description="Lookups answered from Redis")
+    misses: int = Field(..., description="Lookups that required an LLM call")
+    hit_rate: float = Field(..., description="Fraction of lookups served from cache")
+    redis_errors: int = Field(..., description="Redis operations that failed")
+    entries: int = Field(..., description="Entries held in the in-process LRU")
+    redis_enabled: bool = Field(..., description="Whether the Redis tier is configured")
\ No newline at end of file
@@ -1,28 +1,204 @@
-import openai
-from anthropic import Anthropic
-import ollama
+import asyncio
+import logging
+from openai import AsyncOpenAI
+from anthropic import AsyncAnthropic
 import httpx
-from typing import Dict, Any, List, Optional
+from fastapi import Request
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
 from app.core.config import settings
+from app.core.monitoring import LLM_FALLBACKS, observe_llm_call, record_llm_failure, record_llm_tokens
+from app.core.tracing import span
 from app.models.content import ContentType, ContentStatus
 from app.models.business import Business
+from app.services.ollama_model_cache import OllamaModelCache
+from app.services.suggestion_cache import SuggestionCache
+from redis.asyncio import Redis
 import json
 
+logger = logging.getLogger(__name__)
+
+OPENAI_MODEL = "gpt-4"
+ANTHROPIC_MODEL = "claude-3-sonnet-20240229"
+
+# Create a more focused prompt for Ollama, especially reasoning models
+OLLAMA_CONTENT_SYSTEM_PROMPT = """You are a professional content writer specializing in SEO and digital marketing. 
+
+IMPORTANT: Output ONLY the final content - no explanations, no reasoning, no thinking process, no meta-commentary.
+
+For Twitter posts: Provide only the tweet text with hashtags.
+For blog posts: Provide only the article content with headings.
+For social media: Provide only the post content.
+
+Do not include phrases like:
+- "I need to create..."
+- "First, I'll..."
+- "The content should..."
+- "Here's the content..."
+
+Just provide the clean, final content that can be used directly."""
+
+class ReasoningFilter:
+    """Incrementally strip <think>...</think> reasoning blocks from a token stream.
+
+    Tags may be split across chunks, so any trailing text that could be the
+    start of a tag is held back until the next chunk arrives.
+    """
+
+    OPEN_TAG = "<think>"
+    CLOSE_TAG = "</think>"
+
+    def __init__(self):
+        self._buffer = ""
+        self._in_reasoning = False
+        self._reasoning: List[str] = []
+        self._strip_leading = True
+
+    def feed(self, text: str) -> str:
+        """Consume a chunk and return the text that is safe to emit"""
+        self._buffer += text
+        output: List[str] = []
+        while True:
+            tag = self.CLOSE_TAG if self._in_reasoning else self.OPEN_TAG
+            index = self._buffer.find(tag)
+            if index == -1:
+                keep = self._partial_tag_length(self._buffer, tag)
+                ready = self._buffer[:len(self._buffer) - keep]
+                self._buffer = self._buffer[len(self._buffer) - keep:]
+                self._emit(ready, output)
+                break
+            self._emit(self._buffer[:index], output)
+            self._buffer = self._buffer[index + len(tag):]
+            if self._in_reasoning:
+                # Reasoning finished - drop it and trim whitespace before the content
+                self._reasoning = []
+                self._strip_leading = True
+            self._in_reasoning = not self._in_reasoning
+        return "".join(output)
+
+    def flush(self) -> str:
+        """Return any held-back text once the stream has ended"""
+        text = self._buffer
+        self._buffer = ""
+        if self._in_reasoning:
+            # No closing tag - keep what followed <think>, like the non-streaming path
+            self._in_reasoning = False
+            text = "".join(self._reasoning) + text
+            self._reasoning = []
+        output: List[str] = []
+        self._emit(text, output)
+        return "".join(output)
+
+    def _emit(self, text: str, output: List[str]) -> None:
+        if not text:
+            return
+        if self._in_reasoning:
+            self._reasoning.append(text)
+            return
+        if self._strip_leading:
+            text = text.lstrip()
+            if not text:
+                return
+            self._strip_leading = False
+        output.append(text)
+
+    @staticmethod
+    def _partial_tag_length(text: str, tag: str) -> int:
+        """Length of the longest suffix of text that is a prefix of tag"""
+        for length in range(min(len(tag) - 1, len(text)), 0, -1):
+            if text.endswith(tag[:length]):
+                return length
+        return 0
+
 class AIContentService:
+    """AI content generation service.
+
+    A single instance is created at application startup (see ``app.main``) and
+    shared by all requests, so the provider clients below keep their HTTP
+    connection pools alive between calls instead of paying for a new TLS
+    handshake on every generation.
+    """
+
     def __init__(self):
         self.openai_client = None
         self.anthropic_client = None
-        self.ollama_available = False
+        self.ollama_client = None
+        self.ollama_models = None
+        self.suggestion_cache = None
+        self._provider_semaphores = {
+            provider: asyncio.Semaphore(limit)
+            for provider, limit in settings.ai_provider_concurrency.items()
+        }
         
         if settings.openai_api_key:
-            openai.api_key = settings.openai_api_key
-            self.openai_client = openai
+            self.openai_client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                http_client=self._create_http_client(),
+            )
         
         if settings.anthropic_api_key:
-            self.anthropic_client = Anthropic(api_key=settings.anthropic_api_key)
+            self.anthropic_client = AsyncAnthropic(
+                api_key=settings.anthropic_api_key,
+                http_client=self._create_http_client(),
+            )
+        
+        # Ollama is only used in local development
+        if settings.environment == "development":
+            self.ollama_client = self._create_http_client(base_url=settings.ollama_base_url)
+            self.ollama_models = OllamaModelCache(
+                self.ollama_client,
+                ttl=settings.ollama_models_cache_ttl,
+                refresh_interval=settings.ollama_models_refresh_interval,
+            )
         
+        if settings.suggestions_cache_enabled:
+            redis_client = None
+            if settings.redis_cache_enabled:
+                redis_client = Redis.from_url(settings.redis_url)
+            self.suggestion_cache = SuggestionCache(
+                max_entries=settings.suggestions_cache_max_entries,
+                ttl=settings.suggestions_cache_ttl,
+                redis_client=redis_client,
+            )
+    
+    @property
+    def ollama_available(self) -> bool:
+        """Whether Ollama is reachable and has at least one model installed"""
+        return self.ollama_models is not None and self.ollama_models.available
+    
+    @staticmethod
+    def _create_http_client(base_url: str = "") -> httpx.AsyncClient:
+        """Create a long-lived async HTTP client with a keep-alive connection pool"""
+        return httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(settings.ai_http_timeout, connect=settings.ai_http_connect_timeout),
+            limits=httpx.Limits(
+                max_connections=settings.ai_http_max_connections,
+                max_keepalive_connections=settings.ai_http_max_keepalive_connections,
+                keepalive_expiry=settings.ai_http_keepalive_expiry,
+            ),
+        )
+    
+    async def startup(self) -> None:
+        """Run one-off startup checks (called from the application lifespan)"""
         # Check if Ollama is available (local development only)
-        self.ollama_available = self._check_ollama_availability()
+        await self._check_ollama_availability()
+        if self.ollama_models:
+            self.ollama_models.start()
+        if self.suggestion_cache:
+            await self.suggestion_cache.start()
+    
+    async def aclose(self) -> None:
+        """Close all provider clients and their connection pools"""
+        if self.ollama_models:
+            await self.ollama_models.stop()
+        if self.openai_client:
+            await self.openai_client.close()
+        if self.anthropic_client:
+            await self.anthropic_client.close()
+        if self.ollama_client:
+            await self.ollama_client.aclose()
+        if self.suggestion_cache:
+            await self.suggestion_cache.aclose()
     
     async def generate_content(
         self, 
@@ -32,15 +208,62 @@ class AIContentService:
         keywords: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """Generate AI content based on business context"""
+        with span("ai.generate_content", **{"llm.content_type": content_type.value, "business.id": business.id}):
+            # Build prompt based on content type and business context
+            with span("ai.build_prompt"):
+                prompt = self._build_prompt(business, content_type, topic, keywords)
+            
+            # Generate content using available AI service
+            content_text = await self._generate_with_ai(prompt, content_type)
+            
+            return await self._build_content_data(business, content_type, topic, keywords, prompt, content_text)
+    
+    async def stream_content(
+        self, 
+        business: Business, 
+        content_type: ContentType,
+        topic: Optional[str] = None,
+        keywords: Optional[List[str]] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Stream AI content as it is generated.
+
+        Yields ``("token", text)`` events as tokens arrive from the provider,
+        followed by a single ``("complete", content_data)`` event carrying the
+        same payload ``generate_content`` returns.
+        """
+        with span("ai.build_prompt"):
+            prompt = self._build_prompt(business, content_type, topic, keywords)
         
-        # Build prompt based on content type and business context
-        prompt = self._build_prompt(business, content_type, topic, keywords)
-        
-        # Generate content using available AI service
-        content_text = await self._generate_with_ai(prompt, content_type)
+        reasoning_filter = ReasoningFilter()
+        parts: List[str] = []
+        async for chunk in self._stream_with_ai(prompt, content_type):
+            text = reasoning_filter.feed(chunk)
+            if text:
+                parts.append(text)
+                yield "token", text
+        text = reasoning_filter.flush()
+        if text:
+            parts.append(text)
+            yield "token", text
         
+        content_text = "".join(parts).strip()
+        yield "complete", await self._build_content_data(
+            business, content_type, topic, keywords, prompt, content_text
+        )
+    
+    async def _build_content_data(
+        self,
+        business: Business,
+        content_type: ContentType,
+        topic: Optional[str],
+        keywords: Optional[List[str]],
+        prompt: str,
+        content_text: str
+    ) -> Dict[str, Any]:
+        """Build the Content row data for generated text"""
         # Generate SEO metadata
-        seo_data = await self._generate_seo_metadata(content_text, keywords)
+        with span("ai.seo_metadata"):
+            seo_data = await self._generate_seo_metadata(content_text, keywords)
         
         return {
             "title": seo_data.get("title", topic or "Generated Content"),
@@ -158,26 +381,163 @@ Requirements:
         """Generate content using available AI service"""
         max_tokens = self._get_max_tokens(content_type)
         
+        provider = self._get_provider()
         try:
-            # Environment-based priority:
-            # Local development: Ollama -> Mock
-            # Deployed environments: Anthropic -> OpenAI -> Mock
-            
-            if settings.environment == "development" and self.ollama_available:
-                response = await self._generate_with_ollama(prompt, max_tokens, content_type)
-            elif self.anthropic_client:
-                response = await self._generate_with_anthropic(prompt, max_tokens)
-            elif self.openai_client:
-                response = await self._generate_with_openai(prompt, max_tokens)
-            else:
+            if provider == "mock":
                 # Fallback mock content 
+                LLM_FALLBACKS.labels(content_type=content_type.value, operation="generate", reason="no_provider").inc()
                 return self._generate_mock_content(content_type)
             
+            # Bound concurrent calls per provider across all requests
+            async with self._provider_semaphores[provider]:
+                if provider == "ollama":
+                    response = await self._generate_with_ollama(prompt, max_tokens, content_type)
+                elif provider == "anthropic":
+                    response = await self._generate_with_anthropic(prompt, max_tokens, content_type)
+                else:
+                    response = await self._generate_with_openai(prompt, max_tokens, content_type)
+            
             return response
         except Exception as e:
-            print(f"AI generation error: {e}")
+            logger.exception("AI generation failed (%s), serving mock content", provider)
+            record_llm_failure(e, provider, self._provider_model(provider), content_type.value, "generate")
+            LLM_FALLBACKS.labels(content_type=content_type.value, operation="generate", reason="error").inc()
             return self._generate_mock_content(content_type)
     
+    async def _stream_with_ai(self, prompt: str, content_type: ContentType) -> AsyncIterator[str]:
+        """Stream raw content chunks from the available AI service"""
+        max_tokens = self._get_max_tokens(content_type)
+        
+        provider = self._get_provider()
+        if provider == "mock":
+            LLM_FALLBACKS.labels(content_type=content_type.value, operation="stream", reason="no_provider").inc()
+            async for chunk in self._stream_mock_content(content_type):
+                yield chunk
+            return
+        
+        if provider == "ollama":
+            stream = self._stream_with_ollama(prompt, max_tokens, content_type)
+        elif provider == "anthropic":
+            stream = self._stream_with_anthropic(prompt, max_tokens, content_type)
+        else:
+            stream = self._stream_with_openai(prompt, max_tokens, content_type)
+        
+        started = False
+        try:
+            # A stream holds its provider slot until the last chunk (or the
+            # client disconnecting), so it counts against the same limit
+            async with self._provider_semaphores[provider]:
+                async for chunk in stream:
+                    started = True
+                    yield chunk
+        except Exception as e:
+            # Tokens already sent to the client cannot be taken back
+            if started:
+                raise
+            logger.exception("AI streaming failed (%s), serving mock content", provider)
+            record_llm_failure(e, provider, self._provider_model(provider), content_type.value, "stream")
+            LLM_FALLBACKS.labels(content_type=content_type.value, operation="stream", reason="error").inc()
+            async for chunk in self._stream_mock_content(content_type):
+                yield chunk
+    
+    async def _stream_with_ollama(self, prompt: str, max_tokens: int, content_type: ContentType) -> AsyncIterator[str]:
+        """Stream content from Ollama's /api/chat NDJSON response"""
+        selected_model = await self._select_ollama_model(content_type)
+        print(f"🎯 Streaming with model: {selected_model} for {content_type.value}")
+        
+        with observe_llm_call("ollama", selected_model, content_type.value, "stream"):
+            async with self.ollama_client.stream(
+                "POST",
+                "/api/chat",
+                json={
+                    "model": selected_model,
+                    "messages": [
+                        {"role": "system", "content": OLLAMA_CONTENT_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "options": {
+                        "num_predict": max_tokens,
+                        "temperature": 0.7,
+                        "top_p": 0.9,
+                    },
+                    "stream": True,
+                },
+            ) as response:
+                self._raise_for_ollama_status(response)
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    text = chunk.get("message", {}).get("content")
+                    if text:
+                        yield text
+                    if chunk.get("done"):
+                        record_llm_tokens(
+                            "ollama", selected_model, content_type.value,
+                            chunk.get("prompt_eval_count"), chunk.get("eval_count")
+                        )
+                        break
+    
+    async def _stream_with_anthropic(self, prompt: str, max_tokens: int, content_type: ContentType) -> AsyncIterator[str]:
+        """Stream content from Anthropic Claude"""
+        with observe_llm_call("anthropic", ANTHROPIC_MODEL, content_type.value, "stream"):
+            stream = await self.anthropic_client.messages.create(
+                model=ANTHROPIC_MODEL,
+                max_tokens=max_tokens,
+                temperature=0.7,
+                messages=[{"role": "user", "content": prompt}],
+                stream=True
+            )
+            async for event in stream:
+                if event.type == "content_block_delta" and event.delta.text:
+                    yield event.delta.text
+                elif event.type == "message_start":
+                    record_llm_tokens("anthropic", ANTHROPIC_MODEL, content_type.value, event.message.usage.input_tokens, None)
+                elif event.type == "message_delta":
+                    record_llm_tokens("anthropic", ANTHROPIC_MODEL, content_type.value, None, event.usage.output_tokens)
+    
+    async def _stream_with_openai(self, prompt: str, max_tokens: int, content_type: ContentType) -> AsyncIterator[str]:
+        """Stream content from OpenAI"""
+        with observe_llm_call("openai", OPENAI_MODEL, content_type.value, "stream"):
+            stream = await self.openai_client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=0.7,
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+    
+    async def _stream_mock_content(self, content_type: ContentType) -> AsyncIterator[str]:
+        """Stream mock content line by line for development/testing"""
+        for line in self._generate_mock_content(content_type).splitlines(keepends=True):
+            yield line
+    
+    def _get_provider(self) -> str:
+        """Pick the AI provider for the next generation.
+
+        Environment-based priority:
+        Local development: Ollama -> Mock
+        Deployed environments: Anthropic -> OpenAI -> Mock
+        """
+        if settings.environment == "development" and self.ollama_available:
+            return "ollama"
+        elif self.anthropic_client:
+            return "anthropic"
+        elif self.openai_client:
+            return "openai"
+        return "mock"
+    
+    def _provider_model(self, provider: str) -> str:
+        """Model label for a provider failure that happened before the call reported its own"""
+        if provider == "anthropic":
+            return ANTHROPIC_MODEL
+        if provider == "openai":
+            return OPENAI_MODEL
+        return settings.ollama_default_model
+    
     def _get_model_name(self) -> str:
         """Get the name of the AI model being used"""
         if settings.environment == "development" and self.ollama_available:
@@ -189,23 +549,34 @@ Requirements:
         else:
             return "mock-content"
     
-    async def _generate_with_openai(self, prompt: str, max_tokens: int) -> str:
+    async def _generate_with_openai(self, prompt: str, max_tokens: int, content_type: ContentType) -> str:
         """Generate content using OpenAI"""
-        response = await self.openai_client.ChatCompletion.acreate(
-            model="gpt-4",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=max_tokens,
-            temperature=0.7
-        )
+        with observe_llm_call("openai", OPENAI_MODEL, content_type.value, "generate"):
+            response = await self.openai_client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=0.7
+            )
+        if response.usage:
+            record_llm_tokens(
+                "openai", OPENAI_MODEL, content_type.value,
+                response.usage.prompt_tokens, response.usage.completion_tokens
+            )
         return response.choices[0].message.content
     
-    async def _generate_with_anthropic(self, prompt: str, max_tokens: int) -> str:
+    async def _generate_with_anthropic(self, prompt: str, max_tokens: int, content_type: ContentType) -> str:
         """Generate content using Anthropic Claude"""
-        response = await self.anthropic_client.messages.create(
-            model="claude-3-sonnet-20240229",
-            max_tokens=max_tokens,
-            temperature=0.7,
-            messages=[{"role": "user", "content": prompt}]
+        with observe_llm_call("anthropic", ANTHROPIC_MODEL, content_type.value, "generate"):
+            response = await self.anthropic_client.messages.create(
+                model=ANTHROPIC_MODEL,
+                max_tokens=max_tokens,
+                temperature=0.7,
+                messages=[{"role": "user", "content": prompt}]
+            )
+        record_llm_tokens(
+            "anthropic", ANTHROPIC_MODEL, content_type.value,
+            response.usage.input_tokens, response.usage.output_tokens
         )
         return response.content[0].text
     
@@ -320,74 +691,50 @@ Which one would you try first? Tell us in the comments!
             "seo_score": seo_score
         }
     
-    def _check_ollama_availability(self) -> bool:
+    async def _check_ollama_availability(self) -> bool:
         """Check if Ollama is available and has the required model (local development only)"""
         # Only check Ollama in development environment
         if settings.environment != "development":
             print("🚀 Production environment - Skipping Ollama (using cloud APIs)")
             return False
             
-        try:
-            import httpx
-            response = httpx.get(f"{settings.ollama_base_url}/api/tags", timeout=2.0)
-            if response.status_code == 200:
-                models = response.json().get("models", [])
-                model_names = [model["name"] for model in models]
-                # Check if our default model is available
-                if settings.ollama_default_model in model_names:
-                    print(f"✅ Ollama available with model: {settings.ollama_default_model}")
-                    return True
-                else:
-                    print(f"⚠️  Ollama available but model {settings.ollama_default_model} not found. Available models: {model_names}")
-                    print("💡 Available models:", model_names)
-                    # Return True anyway if any model is available - fallback logic will handle it
-                    return len(model_names) > 0
-            return False
-        except Exception as e:
-            print(f"❌ Ollama not available (local development): {e}")
+        model_names = await self.ollama_models.refresh(force=True)
+        if not model_names:
+            print("❌ Ollama not available (local development)")
             print("💡 Install Ollama: https://ollama.ai/download")
             return False
+        # Check if our default model is available
+        if settings.ollama_default_model in model_names:
+            print(f"✅ Ollama available with model: {settings.ollama_default_model}")
+        else:
+            print(f"⚠️  Ollama available but model {settings.ollama_default_model} not found. Available models: {model_names}")
+            print("💡 Available models:", model_names)
+        # Any available model is fine - fallback logic in _select_ollama_model will handle it
+        return True
     
     async def _generate_with_ollama(self, prompt: str, max_tokens: int, content_type: ContentType) -> str:
         """Generate content using Ollama with intelligent model selection"""
         try:
-            import ollama
-            
-            # Configure the client to use the correct host
-            client = ollama.Client(host=settings.ollama_base_url)
-            
             # Select the best model for this content type
-            selected_model = self._select_ollama_model(content_type)
+            selected_model = await self._select_ollama_model(content_type)
             print(f"🎯 Using model: {selected_model} for {content_type.value}")
             
-            # Create a more focused prompt for Ollama, especially reasoning models
-            system_prompt = """You are a professional content writer specializing in SEO and digital marketing. 
-
-IMPORTANT: Output ONLY the final content - no explanations, no reasoning, no thinking process, no meta-commentary.
-
-For Twitter posts: Provide only the tweet text with hashtags.
-For blog posts: Provide only the article content with headings.
-For social media: Provide only the post content.
-
-Do not include phrases like:
-- "I need to create..."
-- "First, I'll..."
-- "The content should..."
-- "Here's the content..."
-
-Just provide the clean, final content that can be used directly."""
-            
-            response = client.chat(
-                model=selected_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                options={
-                    "num_predict": max_tokens,
-                    "temperature": 0.7,
-                    "top_p": 0.9,
-                }
+            with observe_llm_call("ollama", selected_model, content_type.value, "generate"):
+                response = await self._ollama_chat(
+                    model=selected_model,
+                    messages=[
+                        {"role": "system", "content": OLLAMA_CONTENT_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    options={
+                        "num_predict": max_tokens,
+                        "temperature": 0.7,
+                        "top_p": 0.9,
+                    }
+                )
+            record_llm_tokens(
+                "ollama", selected_model, content_type.value,
+                response.get("prompt_eval_count"), response.get("eval_count")
             )
             
             content = response['message']['content']
@@ -410,7 +757,28 @@ Just provide the clean, final content that can be used directly."""
             print(f"Ollama generation error: {e}")
             raise e
     
-    def _select_ollama_model(self, content_type: ContentType) -> str:
+    async def _ollama_chat(self, model: str, messages: List[Dict[str, str]], options: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a non-streaming chat request to Ollama without blocking the event loop"""
+        response = await self.ollama_client.post(
+            "/api/chat",
+            json={
+                "model": model,
+                "messages": messages,
+                "options": options,
+                "stream": False,
+            },
+        )
+        self._raise_for_ollama_status(response)
+        return response.json()
+    
+    def _raise_for_ollama_status(self, response: httpx.Response) -> None:
+        """Raise for error responses, dropping the cached model inventory on a missing model"""
+        if response.status_code == 404:
+            # The model was removed since the inventory was fetched
+            self.ollama_models.invalidate()
+        response.raise_for_status()
+    
+    async def _select_ollama_model(self, content_type: ContentType) -> str:
         """Select the best Ollama model for the given content type"""
         # Map content types to model preferences
         content_type_map = {
@@ -430,7 +798,7 @@ Just provide the clean, final content that can be used directly."""
         selected_model = settings.ollama_models.get(model_key, settings.ollama_default_model)
         
         # Check if the selected model is available, fallback to available ones
-        available_models = self._get_available_ollama_models()
+        available_models = await self.ollama_models.get_models()
         
         if selected_model in available_models:
             return selected_model
@@ -451,18 +819,6 @@ Just provide the clean, final content that can be used directly."""
         # Should not happen if ollama_available is True
         raise Exception("No Ollama models available")
     
-    def _get_available_ollama_models(self) -> list:
-        """Get list of currently available Ollama models"""
-        try:
-            import httpx
-            response = httpx.get(f"{settings.ollama_base_url}/api/tags", timeout=2.0)
-            if response.status_code == 200:
-                models = response.json().get("models", [])
-                return [model["name"] for model in models]
-            return []
-        except Exception:
-            return []
-    
     async def generate_topic_suggestions(
         self, 
         business: Business, 
@@ -513,15 +869,13 @@ Return ONLY a simple numbered list of 5 topics, nothing else:
 
             # Use existing AI generation infrastructure
             if settings.environment == "development" and self.ollama_available:
-                response = await self._generate_suggestions_with_ollama(prompt, "topics")
+                suggestions = await self._generate_cached_suggestions(business.id, prompt, "topics", limit=5)
             else:
                 # Fallback for non-development environments
                 response = self._generate_fallback_topics(business, content_type, category)
                 return response
             
-            # Parse response into list
-            suggestions = self._parse_numbered_list(response)
-            return suggestions[:5] if suggestions else self._generate_fallback_topics(business, content_type, category)
+            return suggestions if suggestions else self._generate_fallback_topics(business, content_type, category)
             
         except Exception as e:
             print(f"Error generating topic suggestions: {e}")
@@ -583,30 +937,43 @@ Return ONLY a simple numbered list of 10 keywords, nothing else:
 
             # Use existing AI generation infrastructure
             if settings.environment == "development" and self.ollama_available:
-                response = await self._generate_suggestions_with_ollama(prompt, "keywords")
+                suggestions = await self._generate_cached_suggestions(business.id, prompt, "keywords", limit=10)
             else:
                 # Fallback for non-development environments
                 response = self._generate_fallback_keywords(business, content_type, category)
                 return response
             
-            # Parse response into list
-            suggestions = self._parse_numbered_list(response)
-            return suggestions[:10] if suggestions else self._generate_fallback_keywords(business, content_type, category)
+            return suggestions if suggestions else self._generate_fallback_keywords(business, content_type, category)
             
         except Exception as e:
             print(f"Error generating keyword suggestions: {e}")
             return self._generate_fallback_keywords(business, content_type, category)
 
+    async def _generate_cached_suggestions(self, business_id: int, prompt: str, suggestion_type: str, limit: int) -> List[str]:
+        """Generate suggestions, reusing a cached answer for an identical prompt and model"""
+        cache_key = None
+        if self.suggestion_cache:
+            cache_key = self.suggestion_cache.make_key(prompt, self._get_suggestion_model())
+            cached = await self.suggestion_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        response = await self._generate_suggestions_with_ollama(prompt, suggestion_type)
+        
+        # Parse response into list
+        suggestions = self._parse_numbered_list(response)[:limit]
+        if suggestions and cache_key:
+            await self.suggestion_cache.set(cache_key, business_id, suggestions)
+        return suggestions
+    
+    def _get_suggestion_model(self) -> str:
+        """Use a fast model for suggestions"""
+        return settings.ollama_models.get("fast", settings.ollama_default_model)
+    
     async def _generate_suggestions_with_ollama(self, prompt: str, suggestion_type: str) -> str:
         """Generate suggestions using Ollama with the existing infrastructure"""
         try:
-            import ollama
-            
-            # Configure the client to use the correct host
-            client = ollama.Client(host=settings.ollama_base_url)
-            
-            # Use a fast model for suggestions
-            selected_model = settings.ollama_models.get("fast", settings.ollama_default_model)
+            selected_model = self._get_suggestion_model()
             print(f"🎯 Using model: {selected_model} for {suggestion_type} suggestions")
             
             system_prompt = """You are a content marketing and SEO expert. 
@@ -623,17 +990,22 @@ Do not include phrases like:
 
 Just provide the clean, numbered list."""
             
-            response = client.chat(
-                model=selected_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt}
-                ],
-                options={
-                    "num_predict": 300,  # Shorter for suggestions
-                    "temperature": 0.8,  # More creative for suggestions
-                    "top_p": 0.9,
-                }
+            with observe_llm_call("ollama", selected_model, suggestion_type, "suggestions"):
+                response = await self._ollama_chat(
+                    model=selected_model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt}
+                    ],
+                    options={
+                        "num_predict": 300,  # Shorter for suggestions
+                        "temperature": 0.8,  # More creative for suggestions
+                        "top_p": 0.9,
+                    }
+                )
+            record_llm_tokens(
+                "ollama", selected_model, suggestion_type,
+                response.get("prompt_eval_count"), response.get("eval_count")
             )
             
             content = response['message']['content']
@@ -711,4 +1083,9 @@ Just provide the clean, numbered list."""
             f"{business_name} {industry.lower()}"
         ]
         
-        return fallback_keywords[:10]
\ No newline at end of file
+        return fallback_keywords[:10]
+
+
+def get_ai_service(request: Request) -> AIContentService:
+    """Dependency returning the process-wide AIContentService instance"""
+    return request.app.state.ai_service
@@ -0,0 +1,249 @@
+import asyncio
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from redis import Redis
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import release_connection
+from app.repositories.business_repository import BusinessRepository
+from app.repositories.content_repository import ContentRepository
+from app.schemas.content import ContentGenerate, GenerationJobStatus
+from app.services.ai_content_service import AIContentService
+
+
+@dataclass
+class GenerationJob:
+    id: str
+    status: GenerationJobStatus = GenerationJobStatus.QUEUED
+    stage: str = "queued"
+    progress: int = 0
+    content_id: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = None
+
+
+ProgressCallback = Callable[[str, int], None]
+
+
+async def run_generation_job(
+    ai_service: AIContentService,
+    session_factory: Callable[[], Session],
+    content_request: ContentGenerate,
+    on_progress: ProgressCallback
+) -> int:
+    """Generate and save content for a job, returning the new content id.
+
+    Shared by the in-process worker pool and the Celery task so both
+    backends report the same stages.
+    """
+    db = await run_in_threadpool(session_factory)
+    try:
+        on_progress("loading_business", 10)
+        business = await run_in_threadpool(BusinessRepository(db).get_by_id, content_request.business_id)
+        if not business:
+            raise LookupError("Business not found")
+        await run_in_threadpool(release_connection, db, business)
+
+        on_progress("generating", 30)
+        content_data = await ai_service.generate_content(
+            business=business,
+            content_type=content_request.content_type,
+            topic=content_request.topic,
+            keywords=content_request.keywords
+        )
+        if content_request.campaign_id:
+            content_data["campaign_id"] = content_request.campaign_id
+
+        on_progress("saving", 90)
+        content = await run_in_threadpool(ContentRepository(db).create, content_data)
+        return content.id
+    finally:
+        await run_in_threadpool(db.close)
+
+
+class InProcessJobQueue:
+    """Generation job queue backed by an asyncio worker pool.
+
+    Jobs and their results live in memory, so this backend needs no broker
+    and is what local development and the test suite use. Because a job can
+    only be polled on the process that accepted it, it is for single-worker
+    deployments; use the Celery backend when running several. Finished jobs
+    are kept until ``max_retained`` newer ones have completed.
+    """
+
+    def __init__(
+        self,
+        ai_service: AIContentService,
+        session_factory: Callable[[], Session],
+        workers: int,
+        max_retained: int
+    ):
+        self.ai_service = ai_service
+        self.session_factory = session_factory
+        self._worker_count = workers
+        self._max_retained = max_retained
+        self._queue: "asyncio.Queue[tuple[GenerationJob, ContentGenerate]]" = asyncio.Queue()
+        self._jobs: "OrderedDict[str, GenerationJob]" = OrderedDict()
+        self._workers: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        for _ in range(self._worker_count):
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, content_request: ContentGenerate) -> GenerationJob:
+        """Queue a content generation request"""
+        job = GenerationJob(id=uuid.uuid4().hex)
+        self._jobs[job.id] = job
+        await self._queue.put((job, content_request))
+        return job
+
+    def get(self, job_id: str) -> Optional[GenerationJob]:
+        return self._jobs.get(job_id)
+
+    async def join(self) -> None:
+        """Wait until every queued job has finished"""
+        await self._queue.join()
+
+    async def _worker(self) -> None:
+        while True:
+            job, content_request = await self._queue.get()
+            try:
+                await self._run(job, content_request)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: GenerationJob, content_request: ContentGenerate) -> None:
+        def on_progress(stage: str, progress: int) -> None:
+            job.stage = stage
+            job.progress = progress
+            job.updated_at = datetime.utcnow()
+
+        job.status = GenerationJobStatus.RUNNING
+        try:
+            job.content_id = await run_generation_job(
+                self.ai_service, self.session_factory, content_request, on_progress
+            )
+            job.status = GenerationJobStatus.SUCCEEDED
+            on_progress("completed", 100)
+        except Exception as e:
+            print(f"Content generation job {job.id} failed: {e}")
+            job.status = GenerationJobStatus.FAILED
+            job.error = str(e)
+            on_progress("failed", job.progress)
+        self._evict_finished()
+
+    def _evict_finished(self) -> None:
+        finished = [
+            job_id for job_id, job in self._jobs.items()
+            if job.status in (GenerationJobStatus.SUCCEEDED, GenerationJobStatus.FAILED)
+        ]
+        for job_id in finished[:max(0, len(finished) - self._max_retained)]:
+            del self._jobs[job_id]
+
+
+class CeleryJobQueue:
+    """Generation job queue that hands jobs to Celery workers (see ``app.worker``).
+
+    Celery reports any id it has no result for as PENDING, so submitted ids
+    are also recorded in Redis; ids that were never submitted (or whose
+    results have expired) are reported as missing rather than queued.
+    """
+
+    KEY_PREFIX = "generation_jobs"
+
+    _STATUS_MAP = {
+        "PENDING": GenerationJobStatus.QUEUED,
+        "RECEIVED": GenerationJobStatus.QUEUED,
+        "STARTED": GenerationJobStatus.RUNNING,
+        "PROGRESS": GenerationJobStatus.RUNNING,
+        "RETRY": GenerationJobStatus.RUNNING,
+        "SUCCESS": GenerationJobStatus.SUCCEEDED,
+        "FAILURE": GenerationJobStatus.FAILED,
+        "REVOKED": GenerationJobStatus.FAILED,
+    }
+
+    def __init__(self, redis_client: Redis):
+        self._redis = redis_client
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        self._redis.close()
+
+    async def submit(self, content_request: ContentGenerate) -> GenerationJob:
+        job = GenerationJob(id=uuid.uuid4().hex)
+        # Both calls are network round trips, so keep them off the event loop
+        await run_in_threadpool(self._submit, job.id, content_request.model_dump(mode="json"))
+        return job
+
+    def _submit(self, job_id: str, request_data: dict) -> None:
+        from app.worker import celery_app, generate_content_task
+
+        # Record the id first so a poll that races the broker still finds it
+        expires = int(celery_app.conf.result_expires.total_seconds())
+        self._redis.set(self._job_key(job_id), 1, ex=expires)
+        try:
+            generate_content_task.apply_async(args=[request_data], task_id=job_id)
+        except Exception:
+            self._redis.delete(self._job_key(job_id))
+            raise
+
+    def get(self, job_id: str) -> Optional[GenerationJob]:
+        from app.worker import celery_app
+
+        if not self._redis.exists(self._job_key(job_id)):
+            return None
+        result = celery_app.AsyncResult(job_id)
+        job = GenerationJob(id=job_id, status=self._STATUS_MAP.get(result.state, GenerationJobStatus.QUEUED))
+        job.stage = result.state.lower()
+        if result.state == "PROGRESS" and isinstance(result.info, dict):
+            job.stage = result.info.get("stage", job.stage)
+            job.progress = result.info.get("progress", 0)
+        elif result.state == "SUCCESS":
+            job.stage = "completed"
+            job.progress = 100
+            job.content_id = result.result.get("content_id")
+        elif result.state in ("FAILURE", "REVOKED"):
+            job.stage = "failed"
+            job.error = str(result.result)
+        return job
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{job_id}"
+
+
+def create_job_queue(ai_service: AIContentService, session_factory: Callable[[], Session]):
+    """Create the job queue configured by ``job_queue_backend``"""
+    if settings.job_queue_backend == "celery":
+        return CeleryJobQueue(Redis.from_url(settings.redis_url))
+    if settings.web_concurrency > 1:
+        raise RuntimeError(
+            "job_queue_backend 'inprocess' keeps jobs in the memory of one process; "
+            "set JOB_QUEUE_BACKEND=celery when running more than one worker"
+        )
+    return InProcessJobQueue(
+        ai_service,
+        session_factory,
+        workers=settings.job_workers,
+        max_retained=settings.job_max_retained,
+    )
+
+
+def get_job_queue(request: Request):
+    """Dependency returning the process-wide generation job queue"""
+    return request.app.state.job_queue
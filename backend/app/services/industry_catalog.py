@@ -0,0 +1,156 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from fastapi import Request
+from redis import Redis
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.industry import Industry
+from app.schemas.industry import IndustryResponse
+
+
+class IndustryCatalog:
+    """Immutable snapshot of every industry, indexed by id and slug"""
+
+    def __init__(self, version: int, industries: List[IndustryResponse]):
+        self.version = version
+        self.industries = industries  # Display order: sort_order, then name
+        self.by_id = {industry.id: industry for industry in industries}
+        self.by_slug = {industry.slug: industry for industry in industries}
+        self.loaded_at = time.monotonic()
+        # Derived from the data, so every worker holding the same catalog
+        # hands out the same ETag
+        payload = json.dumps([industry.model_dump(mode="json") for industry in industries], sort_keys=True)
+        self.etag = '"' + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32] + '"'
+
+    def list(self, active_only: bool = True, skip: int = 0, limit: int = 100) -> List[IndustryResponse]:
+        """Industries in display order, as ``IndustryRepository.get_industries_with_counts``"""
+        industries = self.industries
+        if active_only:
+            industries = [industry for industry in industries if industry.is_active]
+        return industries[skip:skip + limit]
+
+    def search(self, name: str, skip: int = 0, limit: int = 100) -> List[IndustryResponse]:
+        """Active industries whose name contains ``name``, as ``IndustryRepository.search_by_name``"""
+        needle = name.casefold()
+        matches = sorted(
+            (industry for industry in self.industries if industry.is_active and needle in industry.name.casefold()),
+            key=lambda industry: industry.name
+        )
+        return matches[skip:skip + limit]
+
+
+class IndustryCatalogCache:
+    """Process-local cache of the industry catalogue.
+
+    Reads are served from an in-memory snapshot. Writes call ``invalidate``,
+    which bumps a version number; with Redis the version is shared, and the
+    bump is published so every other worker drops its snapshot too. The
+    snapshot is also reloaded after ``ttl`` seconds, which bounds how stale
+    business counts can get, since they change with businesses rather than
+    through the industry endpoints.
+    """
+
+    VERSION_KEY = "industries:catalog:version"
+    CHANNEL = "industries:catalog:invalidations"
+
+    def __init__(self, ttl: float, redis_client: Optional[Redis] = None):
+        self._ttl = ttl
+        self._redis = redis_client
+        self._lock = threading.Lock()
+        self._catalog: Optional[IndustryCatalog] = None
+        self._version = 0
+        self._listener = None
+        self.hits = 0
+        self.loads = 0
+        self.redis_errors = 0
+
+    def get(self, db: Session) -> IndustryCatalog:
+        """Return the current catalog, loading it with ``db`` if it is missing or stale"""
+        catalog = self._catalog
+        if self._is_fresh(catalog):
+            self.hits += 1
+            return catalog
+        with self._lock:
+            catalog = self._catalog
+            if self._is_fresh(catalog):
+                self.hits += 1
+                return catalog
+            # Read the version first so a bump during the query forces another load
+            version = self._version
+            rows = db.query(Industry).order_by(Industry.sort_order.asc(), Industry.name.asc()).all()
+            catalog = IndustryCatalog(version, [IndustryResponse.model_validate(row) for row in rows])
+            self._catalog = catalog
+            self.loads += 1
+            return catalog
+
+    def invalidate(self) -> None:
+        """Drop the catalog in this worker and, through Redis, in every other one"""
+        with self._lock:
+            self._catalog = None
+            if self._redis is None:
+                self._version += 1
+                return
+            try:
+                self._version = self._redis.incr(self.VERSION_KEY)
+                self._redis.publish(self.CHANNEL, self._version)
+            except Exception as e:
+                print(f"Industry catalog Redis error: {e}")
+                self.redis_errors += 1
+                self._version += 1
+
+    def start(self) -> None:
+        """Follow version bumps published by other workers"""
+        if self._redis is None or self._listener is not None:
+            return
+        try:
+            self._version = int(self._redis.get(self.VERSION_KEY) or 0)
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self.CHANNEL: self._on_version})
+            self._listener = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+        except Exception as e:
+            # Other workers' changes are still picked up after the TTL
+            print(f"Industry catalog Redis error: {e}")
+            self.redis_errors += 1
+
+    def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._redis is not None:
+            self._redis.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/load counters for monitoring"""
+        return {
+            "hits": self.hits,
+            "loads": self.loads,
+            "version": self._version,
+            "redis_errors": self.redis_errors,
+            "redis_enabled": self._redis is not None,
+        }
+
+    def _is_fresh(self, catalog: Optional[IndustryCatalog]) -> bool:
+        return (
+            catalog is not None
+            and catalog.version == self._version
+            and time.monotonic() - catalog.loaded_at < self._ttl
+        )
+
+    def _on_version(self, message: dict) -> None:
+        self._version = int(message["data"])
+
+
+def create_industry_catalog_cache() -> IndustryCatalogCache:
+    """Create the cache, sharing versions through Redis when ``redis_cache_enabled`` is set"""
+    redis_client = Redis.from_url(settings.redis_url) if settings.redis_cache_enabled else None
+    return IndustryCatalogCache(ttl=settings.industry_catalog_ttl, redis_client=redis_client)
+
+
+def get_industry_catalog_cache(request: Request) -> IndustryCatalogCache:
+    """Dependency returning the process-wide industry catalog cache"""
+    return request.app.state.industry_catalog
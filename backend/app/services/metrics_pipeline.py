@@ -0,0 +1,358 @@
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.content import Content
+from app.repositories.analytics_repository import AnalyticsRepository, as_utc, default_platform, has_native_upsert
+from app.repositories.campaign_repository import CampaignRepository
+from app.repositories.content_repository import ContentRepository
+from app.schemas.metrics import EngagementEvent, EngagementEventType
+
+# (content_id, hours since the epoch, platform or "" for the content's default)
+MetricKey = Tuple[int, int, str]
+# MetricKey -> (views, clicks)
+MetricDeltas = Dict[MetricKey, Tuple[int, int]]
+
+# Keep IN lists well under SQLite's bound parameter limit
+_LOOKUP_CHUNK_SIZE = 1000
+
+
+def aggregate_events(events: Iterable[EngagementEvent], now: Optional[datetime] = None) -> MetricDeltas:
+    """Sum events into view and click deltas per content, hour and platform"""
+    received_hour = int((now or datetime.now(timezone.utc)).timestamp()) // 3600
+    totals: Dict[MetricKey, list] = {}
+    for event in events:
+        hour = int(as_utc(event.occurred_at).timestamp()) // 3600 if event.occurred_at else received_hour
+        total = totals.setdefault((event.content_id, hour, event.platform or ""), [0, 0])
+        if event.type == EngagementEventType.VIEW:
+            total[0] += event.count
+        else:
+            total[1] += event.count
+    return {key: (views, clicks) for key, (views, clicks) in totals.items()}
+
+
+def merge_deltas(target: Dict[MetricKey, list], deltas: MetricDeltas) -> None:
+    for key, (views, clicks) in deltas.items():
+        total = target.setdefault(key, [0, 0])
+        total[0] += views
+        total[1] += clicks
+
+
+def apply_engagement_deltas(db: Session, deltas: MetricDeltas) -> None:
+    """Apply deltas to content and campaign totals and the analytics rollups in one transaction"""
+    ContentRepository(db).apply_metric_deltas(
+        ((content_id, views, clicks) for (content_id, _, _), (views, clicks) in deltas.items()),
+        commit=False
+    )
+
+    content_ids = list({content_id for content_id, _, _ in deltas})
+    contents: Dict[int, tuple] = {}
+    for start in range(0, len(content_ids), _LOOKUP_CHUNK_SIZE):
+        chunk = content_ids[start:start + _LOOKUP_CHUNK_SIZE]
+        rows = (
+            db.query(Content.id, Content.business_id, Content.campaign_id, Content.content_type)
+            .filter(Content.id.in_(chunk))
+        )
+        contents.update((row.id, row) for row in rows)
+
+    CampaignRepository(db).apply_metric_deltas(
+        (
+            (contents[content_id].campaign_id, views, clicks)
+            for (content_id, _, _), (views, clicks) in deltas.items()
+            if content_id in contents and contents[content_id].campaign_id is not None
+        ),
+        commit=False
+    )
+
+    def rollup_deltas():
+        for (content_id, hour, platform), (views, clicks) in deltas.items():
+            content = contents.get(content_id)
+            if content is None:
+                continue
+            key = (
+                datetime.fromtimestamp(hour * 3600, timezone.utc),
+                content.business_id,
+                content.campaign_id,
+                content.content_type.value,
+                platform or default_platform(content.content_type)
+            )
+            yield key, views, clicks
+
+    AnalyticsRepository(db).apply_rollup_deltas(rollup_deltas(), commit=False)
+    db.commit()
+
+
+class InMemoryEventBuffer:
+    """Per-process buffer of aggregated engagement deltas"""
+
+    def __init__(self):
+        self._pending: Dict[MetricKey, list] = {}
+
+    async def add(self, deltas: MetricDeltas) -> None:
+        merge_deltas(self._pending, deltas)
+
+    async def drain(self) -> MetricDeltas:
+        pending, self._pending = self._pending, {}
+        return {key: (views, clicks) for key, (views, clicks) in pending.items()}
+
+    async def commit(self) -> None:
+        pass
+
+    async def requeue(self, deltas: MetricDeltas) -> None:
+        merge_deltas(self._pending, deltas)
+
+    async def recover(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+class RedisEventBuffer:
+    """Engagement deltas buffered in a Redis hash shared by every API node.
+
+    Each node adds with HINCRBY, so a request costs one round trip however
+    many events it carries. Draining renames the hash to a ``draining`` key,
+    which hands the whole batch to exactly one flusher; that key is only
+    deleted once the batch is committed to the database (or put back after a
+    failed write). Draining keys left behind by a crashed process are merged
+    back into the pending hash by ``recover``, so events are applied at least
+    once. Fields are ``content_id:hour:platform:views`` (or ``:clicks``).
+    """
+
+    PENDING_KEY = "metrics:events:pending"
+    DRAINING_PREFIX = "metrics:events:draining"
+    # Draining keys older than this belong to a flusher that died mid-batch
+    STALE_AFTER = 300
+
+    def __init__(self, redis_client: Redis):
+        self._redis = redis_client
+        self._draining: Optional[str] = None
+
+    async def add(self, deltas: MetricDeltas) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            self._queue_increments(pipe, deltas)
+            await pipe.execute()
+
+    async def drain(self) -> MetricDeltas:
+        draining_key = self._draining_key()
+        try:
+            await self._redis.rename(self.PENDING_KEY, draining_key)
+        except ResponseError:
+            # Nothing buffered since the last drain
+            return {}
+        self._draining = draining_key
+        return self._parse(await self._redis.hgetall(draining_key))
+
+    async def commit(self) -> None:
+        """Forget the drained batch once it is in the database"""
+        if self._draining is not None:
+            await self._redis.delete(self._draining)
+            self._draining = None
+
+    async def requeue(self, deltas: MetricDeltas) -> None:
+        """Put deltas from a failed write back, replacing the drained batch in one transaction"""
+        async with self._redis.pipeline(transaction=True) as pipe:
+            self._queue_increments(pipe, deltas)
+            if self._draining is not None:
+                pipe.delete(self._draining)
+            await pipe.execute()
+        self._draining = None
+
+    async def recover(self) -> None:
+        """Merge batches abandoned by crashed flushers back into the pending hash"""
+        now = time.time()
+        async for key in self._redis.scan_iter(match=f"{self.DRAINING_PREFIX}:*"):
+            key = key.decode() if isinstance(key, bytes) else key
+            if now - int(key.split(":")[3]) < self.STALE_AFTER:
+                continue
+            # Claim the key first so two recovering nodes can't both merge it
+            claimed_key = self._draining_key()
+            try:
+                await self._redis.rename(key, claimed_key)
+            except ResponseError:
+                continue
+            deltas = self._parse(await self._redis.hgetall(claimed_key))
+            async with self._redis.pipeline(transaction=True) as pipe:
+                self._queue_increments(pipe, deltas)
+                pipe.delete(claimed_key)
+                await pipe.execute()
+            print(f"Recovered {len(deltas)} engagement deltas from an interrupted flush")
+
+    async def aclose(self) -> None:
+        await self._redis.close()
+
+    def _draining_key(self) -> str:
+        return f"{self.DRAINING_PREFIX}:{int(time.time())}:{uuid.uuid4().hex}"
+
+    def _queue_increments(self, pipe, deltas: MetricDeltas) -> None:
+        for (content_id, hour, platform), (views, clicks) in deltas.items():
+            if views:
+                pipe.hincrby(self.PENDING_KEY, f"{content_id}:{hour}:{platform}:views", views)
+            if clicks:
+                pipe.hincrby(self.PENDING_KEY, f"{content_id}:{hour}:{platform}:clicks", clicks)
+
+    @staticmethod
+    def _parse(raw: dict) -> MetricDeltas:
+        totals: Dict[MetricKey, list] = {}
+        for field, value in raw.items():
+            field = field.decode() if isinstance(field, bytes) else field
+            content_id, hour, platform, kind = field.split(":")
+            total = totals.setdefault((int(content_id), int(hour), platform), [0, 0])
+            total[0 if kind == "views" else 1] += int(value)
+        return {key: (views, clicks) for key, (views, clicks) in totals.items()}
+
+
+class MetricsPipeline:
+    """Buffers engagement events and writes them to the database in bulk.
+
+    Requests only aggregate their events into the buffer. A background task
+    flushes the buffer every ``flush_interval`` seconds, or sooner once
+    ``flush_threshold`` events are waiting, with one batched statement per
+    table, including the hourly and daily analytics rollups. If a flush
+    fails its deltas go back into the buffer and are retried on the next
+    one; at most ``max_retained_keys`` of them are kept, newest hours
+    first, and the events dropped beyond that are counted.    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        buffer,
+        flush_interval: float,
+        flush_threshold: int,
+        max_retained_keys: int = 100_000
+    ):
+        self.session_factory = session_factory
+        self.buffer = buffer
+        self._flush_interval = flush_interval
+        self._flush_threshold = flush_threshold
+        self._max_retained_keys = max_retained_keys
+        self._pending_events = 0
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.events_received = 0
+        self.events_flushed = 0
+        self.events_dropped = 0
+        self.flushes = 0
+        self.flush_failures = 0
+
+    async def ingest(self, events: Iterable[EngagementEvent]) -> int:
+        """Buffer events for the next flush, returning how many were accepted"""
+        deltas = aggregate_events(events)
+        count = sum(views + clicks for views, clicks in deltas.values())
+        if not count:
+            return 0
+        await self.buffer.add(deltas)
+        self.events_received += count
+        self._pending_events += count
+        if self._pending_events >= self._flush_threshold:
+            self._flush_requested.set()
+        return count
+
+    async def flush(self) -> int:
+        """Write buffered deltas to the database, returning the events written"""
+        async with self._flush_lock:
+            self._pending_events = 0
+            deltas = await self.buffer.drain()
+            if not deltas:
+                return 0
+            try:
+                await run_in_threadpool(self._apply, deltas)
+            except Exception as e:
+                print(f"Engagement metrics flush failed, will retry: {e}")
+                self.flush_failures += 1
+                await self.buffer.requeue(self._retained(deltas))
+                return 0
+            await self.buffer.commit()
+            count = sum(views + clicks for views, clicks in deltas.values())
+            self.events_flushed += count
+            self.flushes += 1
+            return count
+
+    def start(self) -> None:
+        """Start flushing in the background"""
+        if self._flush_task is None:
+            self._stopping = False
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the background flusher, writing out anything still buffered"""
+        if self._flush_task is not None:
+            # Wake the loop and let it exit rather than cancelling it, which
+            # asyncio.wait_for can swallow when the event fires at the same time
+            self._stopping = True
+            self._flush_requested.set()
+            await self._flush_task
+            self._flush_task = None
+        await self.flush()
+        await self.buffer.aclose()
+
+    def _retained(self, deltas: MetricDeltas) -> MetricDeltas:
+        """The deltas to retry after a failed flush, bounded so an outage can't grow the buffer forever"""
+        if len(deltas) <= self._max_retained_keys:
+            return deltas
+        newest_first = sorted(deltas, key=lambda key: key[1], reverse=True)
+        dropped = sum(views + clicks for views, clicks in (deltas[key] for key in newest_first[self._max_retained_keys:]))
+        self.events_dropped += dropped
+        print(f"⚠️  Engagement metrics buffer full after failed flushes; dropped {dropped} events")
+        return {key: deltas[key] for key in newest_first[:self._max_retained_keys]}
+
+    def _apply(self, deltas: MetricDeltas) -> None:
+        db = self.session_factory()
+        try:
+            apply_engagement_deltas(db, deltas)
+        finally:
+            db.close()
+
+    async def _flush_loop(self) -> None:
+        try:
+            await self.buffer.recover()
+        except Exception as e:
+            print(f"Engagement metrics recovery error: {e}")
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            if self._stopping:
+                return
+            self._flush_requested.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                # e.g. Redis unavailable while draining; try again next interval
+                print(f"Engagement metrics flush error: {e}")
+
+
+def create_metrics_pipeline(session_factory: Callable[[], Session]) -> MetricsPipeline:
+    """Create the pipeline with the buffer configured by ``metrics_buffer_backend``"""
+    bind = getattr(session_factory, "kw", {}).get("bind")
+    if bind is not None and not has_native_upsert(bind.dialect.name):
+        print(f"⚠️  No upsert support for {bind.dialect.name}; engagement rollups will be written row by row")
+    if settings.metrics_buffer_backend == "redis":
+        buffer = RedisEventBuffer(Redis.from_url(settings.redis_url))
+    else:
+        buffer = InMemoryEventBuffer()
+    return MetricsPipeline(
+        session_factory,
+        buffer,
+        flush_interval=settings.metrics_flush_interval,
+        flush_threshold=settings.metrics_flush_threshold,
+        max_retained_keys=settings.metrics_max_retained_keys,
+    )
+
+
+def get_metrics_pipeline(request: Request) -> MetricsPipeline:
+    """Dependency returning the process-wide metrics pipeline"""
+    return request.app.state.metrics_pipeline
@@ -0,0 +1,79 @@
+import asyncio
+import time
+from typing import List, Optional
+
+import httpx
+
+
+class OllamaModelCache:
+    """TTL cache of the models installed on the Ollama server.
+
+    One instance is shared by all requests through the process-wide
+    AIContentService. A background task keeps the inventory fresh so model
+    selection never waits on ``/api/tags``; the cache is invalidated when
+    Ollama reports that a model it listed no longer exists.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, ttl: float, refresh_interval: float):
+        self._client = client
+        self._ttl = ttl
+        self._refresh_interval = refresh_interval
+        self._models: List[str] = []
+        self._fetched_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def available(self) -> bool:
+        """Whether the last inventory fetch found any models"""
+        return len(self._models) > 0
+
+    def _is_fresh(self) -> bool:
+        return self._fetched_at is not None and time.monotonic() - self._fetched_at < self._ttl
+
+    async def get_models(self) -> List[str]:
+        """Return the cached model names, fetching them only if the cache is stale"""
+        if self._is_fresh():
+            return self._models
+        return await self.refresh()
+
+    async def refresh(self, force: bool = False) -> List[str]:
+        """Fetch the model inventory from Ollama"""
+        async with self._lock:
+            # Another caller may have refreshed while we waited for the lock
+            if not force and self._is_fresh():
+                return self._models
+            try:
+                response = await self._client.get("/api/tags", timeout=2.0)
+                response.raise_for_status()
+                models = response.json().get("models", [])
+                self._models = [model["name"] for model in models]
+            except Exception as e:
+                print(f"❌ Could not fetch Ollama models: {e}")
+                self._models = []
+            self._fetched_at = time.monotonic()
+            return self._models
+
+    def invalidate(self) -> None:
+        """Mark the inventory as stale so the next lookup fetches it again"""
+        self._fetched_at = None
+
+    def start(self) -> None:
+        """Start refreshing the inventory in the background"""
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh task"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            await self.refresh(force=True)
@@ -0,0 +1,91 @@
+import math
+import re
+from collections import defaultdict
+from typing import Dict, Hashable, List, Set, Tuple
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Mirrors the most common entries of PostgreSQL's English stop word list
+STOP_WORDS = frozenset(
+    "a an and are as at be but by for from has have in into is it its of on or "
+    "our that the their this to was we were will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stop words removed"""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def trigrams(text: str) -> Set[str]:
+    """pg_trgm-style trigrams of each word, padded with spaces"""
+    grams: Set[str] = set()
+    for word in _TOKEN_RE.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: str, b: str) -> float:
+    """Trigram similarity between two strings, as pg_trgm's ``similarity()``"""
+    grams_a, grams_b = trigrams(a), trigrams(b)
+    if not grams_a or not grams_b:
+        return 0.0
+    return len(grams_a & grams_b) / len(grams_a | grams_b)
+
+
+class InvertedIndex:
+    """In-memory full-text index used when PostgreSQL search isn't available.
+
+    Documents are added as weighted fields (e.g. a title weighted above the
+    body, like ``setweight`` in PostgreSQL). Queries are scored with TF-IDF;
+    the last query word also matches as a prefix so search-as-you-type works,
+    and documents whose ``name`` field is trigram-similar to the whole query
+    are included to tolerate typos.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.3):
+        self._similarity_threshold = similarity_threshold
+        self._postings: Dict[str, Dict[Hashable, float]] = defaultdict(dict)
+        self._names: Dict[Hashable, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, key: Hashable, fields: Dict[str, str], weights: Dict[str, float]) -> None:
+        """Index a document's fields; ``name`` is also used for fuzzy matching"""
+        self._names[key] = fields.get("name") or ""
+        for field, text in fields.items():
+            if not text:
+                continue
+            weight = weights.get(field, 1.0)
+            for token in tokenize(text):
+                postings = self._postings[token]
+                postings[key] = postings.get(key, 0.0) + weight
+
+    def search(self, query: str, limit: int = 20) -> List[Tuple[Hashable, float]]:
+        """Return ``(key, score)`` pairs for the best matching documents"""
+        terms = tokenize(query)
+        scores: Dict[Hashable, float] = defaultdict(float)
+        document_count = max(len(self._names), 1)
+
+        for position, term in enumerate(terms):
+            if position == len(terms) - 1:
+                matched = [token for token in self._postings if token.startswith(term)]
+            else:
+                matched = [term] if term in self._postings else []
+            for token in matched:
+                postings = self._postings[token]
+                idf = math.log(1 + document_count / len(postings))
+                for key, weight in postings.items():
+                    # Dampen repeated occurrences, as ts_rank does
+                    scores[key] += math.log1p(weight) * idf
+
+        if query.strip():
+            for key, name in self._names.items():
+                score = similarity(query, name) if name else 0.0
+                if score >= self._similarity_threshold:
+                    scores[key] += score
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit]
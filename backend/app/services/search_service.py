@@ -0,0 +1,184 @@
+from typing import Iterable, List, Optional
+
+from sqlalchemy import func, literal_column, or_
+from sqlalchemy.orm import Session
+
+from app.models.business import Business
+from app.models.content import Content
+from app.models.industry import Industry
+from app.schemas.search import SearchResult, SearchResultType
+from app.services.search_index import InvertedIndex, tokenize
+
+SNIPPET_LENGTH = 160
+
+# Relative field weights for the in-memory index, matching the A/B/C
+# weights of the PostgreSQL search_vector columns
+FIELD_WEIGHTS = {"name": 1.0, "industry": 0.6, "meta": 0.6, "description": 0.4, "body": 0.4}
+
+
+def _snippet(text: Optional[str]) -> Optional[str]:
+    if not text:
+        return None
+    text = " ".join(text.split())
+    if len(text) <= SNIPPET_LENGTH:
+        return text
+    return text[:SNIPPET_LENGTH].rsplit(" ", 1)[0] + "…"
+
+
+class SearchService:
+    """Ranked search across businesses, industries and content.
+
+    On PostgreSQL this queries the generated ``search_vector`` columns
+    (GIN-indexed tsvectors) and adds pg_trgm similarity on names so typos
+    still match. Other databases, i.e. SQLite in development and tests,
+    fall back to an in-memory inverted index built per query; that fallback
+    is for development only and is not meant to scale.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(
+        self,
+        query: str,
+        types: Optional[Iterable[SearchResultType]] = None,
+        limit: int = 20
+    ) -> List[SearchResult]:
+        """Return the best ``limit`` matches for ``query`` across the given types"""
+        types = set(types or SearchResultType)
+        if self.db.get_bind().dialect.name == "postgresql":
+            results = self._search_postgres(query, types, limit)
+        else:
+            results = self._search_in_memory(query, types, limit)
+        results.sort(key=lambda result: result.score, reverse=True)
+        return results[:limit]
+
+    def _search_postgres(self, query: str, types: set, limit: int) -> List[SearchResult]:
+        ts_query = func.websearch_to_tsquery("english", query)
+        results: List[SearchResult] = []
+
+        def rank(table: str):
+            # Normalized to 0..1 so it can be added to trigram similarity
+            return func.ts_rank(literal_column(f"{table}.search_vector"), ts_query, 32)
+
+        def matches(table: str):
+            return literal_column(f"{table}.search_vector").bool_op("@@")(ts_query)
+
+        if SearchResultType.BUSINESS in types:
+            score = rank("businesses") + func.similarity(Business.name, query)
+            rows = (
+                self.db.query(Business.id, Business.name, Business.description, score.label("score"))
+                .filter(or_(matches("businesses"), Business.name.bool_op("%")(query)))
+                .order_by(score.desc())
+                .limit(limit)
+                .all()
+            )
+            results.extend(
+                SearchResult(type=SearchResultType.BUSINESS, id=row.id, title=row.name,
+                             snippet=_snippet(row.description), score=row.score)
+                for row in rows
+            )
+
+        if SearchResultType.INDUSTRY in types:
+            score = rank("industries") + func.similarity(Industry.name, query)
+            rows = (
+                self.db.query(Industry.id, Industry.name, Industry.description, score.label("score"))
+                .filter(Industry.is_active == True)
+                .filter(or_(matches("industries"), Industry.name.bool_op("%")(query)))
+                .order_by(score.desc())
+                .limit(limit)
+                .all()
+            )
+            results.extend(
+                SearchResult(type=SearchResultType.INDUSTRY, id=row.id, title=row.name,
+                             snippet=_snippet(row.description), score=row.score)
+                for row in rows
+            )
+
+        if SearchResultType.CONTENT in types:
+            score = rank("content")
+            rows = (
+                self.db.query(
+                    Content.id,
+                    Content.title,
+                    Content.business_id,
+                    # Only fetch enough of the body for the snippet
+                    func.left(Content.content_text, SNIPPET_LENGTH * 2).label("body"),
+                    score.label("score")
+                )
+                .filter(matches("content"))
+                .order_by(score.desc())
+                .limit(limit)
+                .all()
+            )
+            results.extend(
+                SearchResult(type=SearchResultType.CONTENT, id=row.id, title=row.title,
+                             snippet=_snippet(row.body), business_id=row.business_id, score=row.score)
+                for row in rows
+            )
+
+        return results
+
+    def _search_in_memory(self, query: str, types: set, limit: int) -> List[SearchResult]:
+        """Rank candidate rows with a throwaway inverted index (development only).
+
+        Only rows containing one of the query terms are loaded and indexed,
+        so trigram typo matching applies among those candidates rather than
+        across every name.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        
+        def containing_terms(*columns):
+            # The last term also matches as a prefix, which substring matching covers
+            return or_(*(
+                func.lower(column).contains(term, autoescape=True)
+                for column in columns for term in terms
+            ))
+        
+        index = InvertedIndex()
+        results = {}
+
+        if SearchResultType.BUSINESS in types:
+            rows = (
+                self.db.query(Business.id, Business.name, Business.industry, Business.description)
+                .filter(containing_terms(Business.name, Business.industry, Business.description))
+            )
+            for row in rows:
+                key = (SearchResultType.BUSINESS, row.id)
+                index.add(key, {"name": row.name, "industry": row.industry, "description": row.description}, FIELD_WEIGHTS)
+                results[key] = SearchResult(type=SearchResultType.BUSINESS, id=row.id, title=row.name,
+                                            snippet=_snippet(row.description), score=0)
+
+        if SearchResultType.INDUSTRY in types:
+            rows = (
+                self.db.query(Industry.id, Industry.name, Industry.description)
+                .filter(Industry.is_active == True)
+                .filter(containing_terms(Industry.name, Industry.description))
+            )
+            for row in rows:
+                key = (SearchResultType.INDUSTRY, row.id)
+                index.add(key, {"name": row.name, "description": row.description}, FIELD_WEIGHTS)
+                results[key] = SearchResult(type=SearchResultType.INDUSTRY, id=row.id, title=row.name,
+                                            snippet=_snippet(row.description), score=0)
+
+        if SearchResultType.CONTENT in types:
+            rows = (
+                self.db.query(
+                    Content.id, Content.title, Content.meta_description, Content.content_text, Content.business_id
+                )
+                .filter(containing_terms(Content.title, Content.meta_description, Content.content_text))
+            )
+            for row in rows:
+                key = (SearchResultType.CONTENT, row.id)
+                index.add(key, {"name": row.title, "meta": row.meta_description, "body": row.content_text}, FIELD_WEIGHTS)
+                results[key] = SearchResult(type=SearchResultType.CONTENT, id=row.id, title=row.title,
+                                            snippet=_snippet(row.content_text), business_id=row.business_id, score=0)
+
+        ranked = []
+        for key, score in index.search(query, limit=limit):
+            result = results[key]
+            result.score = score
+            ranked.append(result)
+        return ranked
@@ -0,0 +1,181 @@
+import asyncio
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+class SuggestionCache:
+    """Content-addressed cache for AI topic and keyword suggestions.
+
+    Entries are keyed on a hash of the normalized prompt plus the model that
+    answered it, so identical "suggest" clicks reuse the previous answer.
+    There is always an in-process LRU tier; when a Redis client is given it is
+    used as a second, shared tier. Every entry is also indexed by business so
+    it can be dropped when the business profile changes; with Redis the
+    invalidation is published so other workers drop their memory tier too.
+    """
+
+    KEY_PREFIX = "suggestions"
+    CHANNEL = "suggestions:invalidations"
+
+    def __init__(self, max_entries: int, ttl: int, redis_client: Optional[Any] = None):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._redis = redis_client
+        self._entries: "OrderedDict[str, Tuple[float, int, List[str]]]" = OrderedDict()
+        self._business_keys: Dict[int, Set[str]] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self.memory_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.redis_errors = 0
+
+    @staticmethod
+    def make_key(prompt: str, model: str) -> str:
+        """Build a cache key from the normalized prompt and model name"""
+        normalized = re.sub(r"\s+", " ", prompt).strip()
+        return hashlib.sha256(f"{model}\n{normalized}".encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[List[str]]:
+        """Look a key up in the memory tier, then in Redis"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, business_id, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return value
+            self._discard(key)
+
+        if self._redis is not None:
+            try:
+                raw = await self._redis.get(self._redis_key(key))
+            except Exception as e:
+                print(f"Suggestion cache Redis error: {e}")
+                self.redis_errors += 1
+                raw = None
+            if raw is not None:
+                data = json.loads(raw)
+                self._store(key, data["business_id"], data["suggestions"])
+                self.redis_hits += 1
+                return data["suggestions"]
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, business_id: int, suggestions: List[str]) -> None:
+        """Store suggestions in every tier"""
+        self._store(key, business_id, suggestions)
+
+        if self._redis is not None:
+            try:
+                business_set = self._redis_business_key(business_id)
+                payload = json.dumps({"business_id": business_id, "suggestions": suggestions})
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    pipe.set(self._redis_key(key), payload, ex=self._ttl)
+                    pipe.sadd(business_set, key)
+                    pipe.expire(business_set, self._ttl)
+                    await pipe.execute()
+            except Exception as e:
+                print(f"Suggestion cache Redis error: {e}")
+                self.redis_errors += 1
+
+    async def invalidate_business(self, business_id: int) -> None:
+        """Drop every cached suggestion generated for a business, in every worker"""
+        self._discard_business(business_id)
+
+        if self._redis is not None:
+            try:
+                business_set = self._redis_business_key(business_id)
+                keys = await self._redis.smembers(business_set)
+                names = [self._redis_key(k.decode() if isinstance(k, bytes) else k) for k in keys]
+                await self._redis.delete(business_set, *names)
+                await self._redis.publish(self.CHANNEL, business_id)
+            except Exception as e:
+                print(f"Suggestion cache Redis error: {e}")
+                self.redis_errors += 1
+
+    async def start(self) -> None:
+        """Follow invalidations published by other workers"""
+        if self._redis is None or self._listener is not None:
+            return
+        try:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(self.CHANNEL)
+        except Exception as e:
+            # Other workers' entries still expire after the TTL
+            print(f"Suggestion cache Redis error: {e}")
+            self.redis_errors += 1
+            return
+        self._listener = asyncio.create_task(self._listen(pubsub))
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring"""
+        hits = self.memory_hits + self.redis_hits
+        lookups = hits + self.misses
+        return {
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "redis_errors": self.redis_errors,
+            "entries": len(self._entries),
+            "redis_enabled": self._redis is not None,
+        }
+
+    async def aclose(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.close()
+
+    async def _listen(self, pubsub: Any) -> None:
+        try:
+            async for message in pubsub.listen():
+                self._on_invalidation(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Suggestion cache Redis error: {e}")
+            self.redis_errors += 1
+        finally:
+            await pubsub.aclose()
+
+    def _on_invalidation(self, message: dict) -> None:
+        self._discard_business(int(message["data"]))
+
+    def _discard_business(self, business_id: int) -> None:
+        for key in list(self._business_keys.get(business_id, ())):
+            self._discard(key)
+
+    def _store(self, key: str, business_id: int, suggestions: List[str]) -> None:
+        self._discard(key)
+        self._entries[key] = (time.monotonic() + self._ttl, business_id, suggestions)
+        self._business_keys.setdefault(business_id, set()).add(key)
+        while len(self._entries) > self._max_entries:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._business_keys.get(entry[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._business_keys[entry[1]]
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.KEY_PREFIX}:{key}"
+
+    def _redis_business_key(self, business_id: int) -> str:
+        return f"{self.KEY_PREFIX}:business:{business_id}"
@@ -0,0 +1,106 @@
+"""
+Celery worker for background content generation.
+Run from backend directory: celery -A app.worker worker --loglevel=info
+"""
+import asyncio
+import threading
+from typing import Optional
+
+from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.repositories.industry_repository import IndustryRepository
+from app.schemas.content import ContentGenerate
+from app.services.ai_content_service import AIContentService
+from app.services.generation_jobs import run_generation_job
+
+celery_app = Celery(
+    "ai_seo_platform",
+    broker=settings.celery_broker_url or settings.redis_url,
+    backend=settings.celery_result_backend or settings.redis_url,
+)
+celery_app.conf.update(
+    task_track_started=True,
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+)
+
+# Overridable so tests can run tasks against their own database session
+session_factory = SessionLocal
+
+
+# One event loop and AI service per worker process, so provider connection
+# pools and the Ollama model inventory are reused across tasks. The loop runs
+# in its own thread so the service's background tasks (model inventory
+# refresh, suggestion cache invalidations) keep running between tasks.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_ai_service: Optional[AIContentService] = None
+
+
+def _run(coroutine):
+    """Run ``coroutine`` on the worker's event loop and wait for its result"""
+    return asyncio.run_coroutine_threadsafe(coroutine, _loop).result()
+
+
+def _get_ai_service() -> AIContentService:
+    global _loop, _loop_thread, _ai_service
+    if _ai_service is None:
+        _loop = asyncio.new_event_loop()
+        _loop_thread = threading.Thread(target=_loop.run_forever, name="ai-service-loop", daemon=True)
+        _loop_thread.start()
+        ai_service = AIContentService()
+        _run(ai_service.startup())
+        _ai_service = ai_service
+    return _ai_service
+
+
+@worker_process_init.connect
+def _init_worker_process(**kwargs) -> None:
+    _get_ai_service()
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_process(**kwargs) -> None:
+    global _loop, _loop_thread, _ai_service
+    if _ai_service is not None:
+        _run(_ai_service.aclose())
+    if _loop is not None:
+        _loop.call_soon_threadsafe(_loop.stop)
+        _loop_thread.join()
+        _loop.close()
+    _loop = None
+    _loop_thread = None
+    _ai_service = None
+
+
+async def _generate(task, task_id: str, ai_service: AIContentService, request_data: dict) -> int:
+    def on_progress(stage: str, progress: int) -> None:
+        # task.request is thread-local and this runs on the loop's thread,
+        # so name the task explicitly
+        task.update_state(task_id=task_id, state="PROGRESS", meta={"stage": stage, "progress": progress})
+
+    return await run_generation_job(
+        ai_service, session_factory, ContentGenerate(**request_data), on_progress
+    )
+
+
+@celery_app.task(bind=True, name="content.generate")
+def generate_content_task(self, request_data: dict) -> dict:
+    """Generate and save content for a queued request"""
+    ai_service = _get_ai_service()
+    content_id = _run(_generate(self, self.request.id, ai_service, request_data))
+    return {"content_id": content_id}
+
+
+@celery_app.task(name="industries.reconcile_business_counts")
+def reconcile_industry_counts_task() -> dict:
+    """Fix industry business counts that drifted from the businesses table"""
+    db = session_factory()
+    try:
+        return {"corrected": IndustryRepository(db).reconcile_business_counts()}
+    finally:
+        db.close()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Rebuild the hourly and daily engagement rollups from content counters.
+Pause event ingestion while it runs; events flushed mid-rebuild may be
+counted twice or lost.
+Run from backend directory: python scripts/backfill_engagement_rollups.py [--business-id ID]
+"""
+import sys
+import os
+
+# Add the app directory to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+from app.repositories.analytics_repository import AnalyticsRepository
+
+def backfill_engagement_rollups(business_id=None):
+    """Replace the rollups for one business, or all of them, in one transaction"""
+    db = SessionLocal()
+    try:
+        scope = f"business {business_id}" if business_id else "all businesses"
+        print(f"📈 Rebuilding engagement rollups for {scope}...")
+        
+        written = AnalyticsRepository(db).rebuild_from_content(business_id=business_id)
+        
+        print(f"🎉 Wrote {written} rollup rows")
+        
+    except Exception as e:
+        print(f"❌ Error rebuilding engagement rollups: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Rebuild engagement rollups from content counters")
+    parser.add_argument("--business-id", type=int, help="Only rebuild this business's rollups")
+    args = parser.parse_args()
+    
+    backfill_engagement_rollups(args.business_id)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Mixed read/generate load benchmark for the API.
+Run from backend directory: python scripts/benchmark_mixed_load.py
+
+Drives the app in-process with concurrent list/get reads and content
+generations against a throwaway SQLite database. Database round trips and
+AI provider calls are given artificial latency so the numbers show whether
+DB I/O overlaps with in-flight generations or blocks the event loop.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+# Add the app directory to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.main import app
+from app.db.database import Base, get_db
+from app.models.business import Business
+from app.models.user import User
+from app.services.ai_content_service import AIContentService
+
+
+def build_database(path: str, db_latency: float):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def enable_wal(dbapi_connection, connection_record):
+        # Let readers and the single writer proceed concurrently
+        dbapi_connection.execute("PRAGMA journal_mode=WAL")
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def simulate_network_round_trip(conn, cursor, statement, parameters, context, executemany):
+        time.sleep(db_latency)
+
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = session_factory()
+    db.add(User(id=1, email="bench@example.com", hashed_password="x"))
+    db.add(Business(id=1, name="Benchmark Inc", industry="Technology", owner_id=1))
+    db.commit()
+    db.close()
+    return session_factory
+
+
+async def run(args) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        session_factory = build_database(os.path.join(tmp, "bench.db"), args.db_latency_ms / 1000)
+
+        def override_get_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        async def slow_generation(self, prompt, content_type):
+            await asyncio.sleep(args.ai_latency_ms / 1000)
+            return self._generate_mock_content(content_type)
+
+        app.dependency_overrides[get_db] = override_get_db
+        AIContentService._generate_with_ai = slow_generation
+
+        latencies = {"read": [], "generate": []}
+        rng = random.Random(42)
+
+        async def one_request(client: httpx.AsyncClient) -> None:
+            if rng.random() < args.generate_ratio:
+                kind = "generate"
+                request = client.post(
+                    "/api/v1/content/generate",
+                    json={"business_id": 1, "content_type": "twitter_post"},
+                )
+            else:
+                kind = "read"
+                request = client.get("/api/v1/content/?limit=20")
+            started = time.perf_counter()
+            response = await request
+            response.raise_for_status()
+            latencies[kind].append(time.perf_counter() - started)
+
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+                semaphore = asyncio.Semaphore(args.concurrency)
+
+                async def bounded() -> None:
+                    async with semaphore:
+                        await one_request(client)
+
+                started = time.perf_counter()
+                await asyncio.gather(*(bounded() for _ in range(args.requests)))
+                elapsed = time.perf_counter() - started
+
+        app.dependency_overrides.clear()
+
+    print(f"requests={args.requests} concurrency={args.concurrency} "
+          f"db_latency={args.db_latency_ms}ms ai_latency={args.ai_latency_ms}ms")
+    print(f"throughput: {args.requests / elapsed:.1f} req/s ({elapsed:.2f}s total)")
+    for kind, values in latencies.items():
+        if values:
+            values.sort()
+            p95 = values[int(len(values) * 0.95) - 1]
+            print(f"{kind:>8}: n={len(values)} p50={statistics.median(values) * 1000:.0f}ms "
+                  f"p95={p95 * 1000:.0f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--generate-ratio", type=float, default=0.2)
+    parser.add_argument("--db-latency-ms", type=float, default=5.0)
+    parser.add_argument("--ai-latency-ms", type=float, default=500.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
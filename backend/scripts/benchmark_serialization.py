@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for serializing a page of content responses.
+Run from backend directory: python scripts/benchmark_serialization.py
+
+Serializes 100 ContentResponse-shaped rows (with ~1200-word bodies) the way
+the list endpoint used to, through response_model validation and the
+standard json module, and the ways it can now: the same path rendered by
+FastJSONResponse, and rows_response, which skips re-validation.
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import datetime, timezone
+from typing import List
+
+# Add the app directory to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.api.responses import FastJSONResponse, rows_response
+from app.models.business import Business
+from app.models.content import Content, ContentStatus, ContentType
+from app.schemas.content import ContentResponse
+
+
+def build_rows(count: int) -> List[Content]:
+    business = Business(id=1, name="Acme Analytics", industry="Technology", owner_id=1)
+    now = datetime.now(timezone.utc)
+    return [
+        Content(
+            id=i,
+            title=f"How small teams scale content, part {i}",
+            content_text="Search engines reward depth and clarity. " * 200,
+            content_type=ContentType.BLOG_POST,
+            status=ContentStatus.PUBLISHED,
+            meta_description="A practical guide to scaling content production.",
+            keywords=["seo", "content", "automation"],
+            ai_prompt_used="Write a detailed blog post about scaling content. " * 20,
+            ai_model_used="llama3.2:3b",
+            generation_settings={"temperature": 0.7, "max_tokens": 2000},
+            views=1200 + i,
+            clicks=85,
+            engagement_rate=708,
+            is_auto_generated=True,
+            requires_approval=False,
+            created_at=now,
+            updated_at=now,
+            business_id=business.id,
+            business=business,
+        )
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark content list serialization")
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    
+    rows = build_rows(args.rows)
+    adapter = TypeAdapter(List[ContentResponse])
+    
+    def validated(response_class):
+        # What FastAPI does for response_model: validate, dump to JSON-able
+        # Python, then let the response class render it
+        def run():
+            content = adapter.dump_python(adapter.validate_python(rows, from_attributes=True), mode="json")
+            return response_class(content).body
+        return run
+    
+    cases = [
+        ("response_model + json (before)", validated(JSONResponse)),
+        ("response_model + orjson", validated(FastJSONResponse)),
+        ("rows_response, no validation", lambda: rows_response(ContentResponse, rows).body),
+    ]
+    
+    payload = len(cases[0][1]())
+    print(f"Serializing {args.rows} ContentResponse rows ({payload / 1024:.0f} KB), best of 5 x {args.repeat}")
+    baseline = None
+    for name, run in cases:
+        assert json.loads(run()) == json.loads(cases[0][1]())
+        best = min(timeit.repeat(run, number=args.repeat, repeat=5)) / args.repeat
+        baseline = baseline or best
+        print(f"  {name:<32} {best * 1000:7.2f} ms  ({baseline / best:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
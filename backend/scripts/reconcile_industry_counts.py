@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Recount businesses per industry and fix any drifted business_count values.
+The counts are kept up to date by ORM events; this catches changes made
+with bulk or raw SQL. Also available as the industries.reconcile_business_counts
+Celery task.
+Run from backend directory: python scripts/reconcile_industry_counts.py
+"""
+import sys
+import os
+
+# Add the app directory to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+from app.repositories.industry_repository import IndustryRepository
+
+def reconcile_industry_counts():
+    """Correct every industry whose stored count differs from its businesses"""
+    db = SessionLocal()
+    try:
+        print("🔢 Reconciling industry business counts...")
+        
+        corrected = IndustryRepository(db).reconcile_business_counts()
+        
+        print(f"🎉 Corrected {corrected} industries")
+        
+    except Exception as e:
+        print(f"❌ Error reconciling industry counts: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    reconcile_industry_counts()
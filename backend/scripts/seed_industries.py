@@ -2,6 +2,10 @@
 """
 Seed script to populate initial industry data.
 Run from backend directory: python scripts/seed_industries.py
+
+Running API workers cache the industry catalogue. With REDIS_CACHE_ENABLED
+the script tells them to reload it; without Redis they keep serving the old
+catalogue until INDUSTRY_CATALOG_TTL runs out or they are restarted.
 """
 import sys
 import os
@@ -10,8 +14,24 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.db.database import SessionLocal
 from app.models.industry import Industry
+from app.services.industry_catalog import create_industry_catalog_cache
+
+def notify_api_workers():
+    """Tell running API workers to reload their cached catalogue, which needs Redis"""
+    if not settings.redis_cache_enabled:
+        print(
+            f"ℹ️  Redis is not enabled, so running API workers keep their cached industries "
+            f"for up to {settings.industry_catalog_ttl:.0f}s; restart them to see the changes now"
+        )
+        return
+    catalog_cache = create_industry_catalog_cache()
+    try:
+        catalog_cache.invalidate()
+    finally:
+        catalog_cache.stop()
 
 # Initial industry data with modern categories
 INITIAL_INDUSTRIES = [
@@ -172,6 +192,7 @@ def seed_industries():
                 print(f"   ⏭️  Skipped: {industry_data['name']} (already exists)")
         
         db.commit()
+        notify_api_workers()
         print(f"\n🎉 Successfully seeded {created_count} industries!")
         
         # Display summary
@@ -211,6 +232,7 @@ def force_seed_industries():
                 print(f"   ✅ Created: {industry_data['name']}")
         
         db.commit()
+        notify_api_workers()
         print(f"\n🎉 Successfully processed industries!")
         print(f"   Created: {created_count}")
         print(f"   Updated: {updated_count}")
@@ -225,7 +247,13 @@ def force_seed_industries():
 if __name__ == "__main__":
     import argparse
     
-    parser = argparse.ArgumentParser(description="Seed initial industry data")
+    parser = argparse.ArgumentParser(
+        description="Seed initial industry data",
+        epilog=(
+            "Running API workers reload their cached industries right away only when "
+            "REDIS_CACHE_ENABLED is set; otherwise restart them or wait for INDUSTRY_CATALOG_TTL."
+        )
+    )
     parser.add_argument("--force", action="store_true", help="Force update existing industries")
     args = parser.parse_args()
     
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.repositories.analytics_repository import AnalyticsRepository
+
+START = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+class TestAnalyticsAPI:
+    """Test suite for the analytics time series endpoint"""
+
+    def test_daily_timeseries(self, client: TestClient, db_session: Session, created_business):
+        """Test that daily buckets and totals come from the rollups"""
+        AnalyticsRepository(db_session).apply_rollup_deltas([
+            ((START + timedelta(hours=2), created_business.id, 0, "blog_post", "blog"), 12, 3),
+            ((START + timedelta(days=1, hours=2), created_business.id, 0, "blog_post", "blog"), 8, 1),
+        ])
+        
+        response = client.get("/api/v1/analytics/timeseries", params={
+            "business_id": created_business.id,
+            "start": "2026-03-01T00:00:00Z",
+            "end": "2026-03-04T00:00:00Z",
+        })
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["granularity"] == "day"
+        assert (data["total_views"], data["total_clicks"]) == (20, 4)
+        assert [point["views"] for point in data["points"]] == [12, 8, 0]
+        assert data["points"][0]["bucket_start"].startswith("2026-03-01T00:00:00")
+
+    def test_hourly_timeseries_with_filters(self, client: TestClient, db_session: Session, created_business):
+        """Test that platform filters apply to hourly buckets"""
+        AnalyticsRepository(db_session).apply_rollup_deltas([
+            ((START, created_business.id, 0, "blog_post", "blog"), 5, 0),
+            ((START, created_business.id, 0, "linkedin_post", "linkedin"), 7, 2),
+        ])
+        
+        response = client.get("/api/v1/analytics/timeseries", params={
+            "business_id": created_business.id,
+            "granularity": "hour",
+            "platform": "linkedin",
+            "start": "2026-03-01T00:00:00Z",
+            "end": "2026-03-01T02:00:00Z",
+        })
+        
+        assert response.status_code == 200
+        assert [(point["views"], point["clicks"]) for point in response.json()["points"]] == [(7, 2), (0, 0)]
+
+    def test_invalid_ranges(self, client: TestClient, created_business):
+        """Test that reversed and oversized ranges are rejected"""
+        params = {"business_id": created_business.id, "granularity": "hour"}
+        
+        reversed_range = client.get("/api/v1/analytics/timeseries", params={
+            **params, "start": "2026-03-02T00:00:00Z", "end": "2026-03-01T00:00:00Z"
+        })
+        too_many = client.get("/api/v1/analytics/timeseries", params={
+            **params, "start": "2020-01-01T00:00:00Z", "end": "2026-03-01T00:00:00Z"
+        })
+        
+        assert reversed_range.status_code == 400
+        assert too_many.status_code == 400
+
+    def test_unknown_business(self, client: TestClient):
+        """Test that an unknown business returns 404"""
+        response = client.get("/api/v1/analytics/timeseries", params={"business_id": 999999})
+        
+        assert response.status_code == 404
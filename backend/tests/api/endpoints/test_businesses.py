@@ -159,4 +159,19 @@ class TestBusinessCRUD:
         
         # Verify deletion
         get_response = client.get(f"/api/v1/businesses/{business_id}")
-        assert get_response.status_code == 404
\ No newline at end of file
+        assert get_response.status_code == 404
+
+    def test_update_business_invalidates_suggestion_cache(self, client: TestClient, created_business):
+        """Test that updating a business drops its cached suggestions"""
+        import asyncio
+        from app.main import app
+
+        cache = app.state.ai_service.suggestion_cache
+        asyncio.run(cache.set("cached-key", created_business.id, ["Cached topic"]))
+
+        response = client.put(f"/api/v1/businesses/{created_business.id}", json={"name": "Renamed"})
+
+        assert response.status_code == 200
+        assert asyncio.run(cache.get("cached-key")) is None
+        stats = client.get("/api/v1/suggestions/cache/stats").json()
+        assert stats["misses"] >= 1
@@ -0,0 +1,101 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.campaign import Campaign, CampaignType
+from app.models.content import Content, ContentType
+from app.repositories.content_repository import ContentRepository
+
+
+class TestConditionalRequests:
+    """Test suite for ETag and Last-Modified handling on read endpoints"""
+
+    def test_content_not_modified(self, client: TestClient, created_content):
+        """Test that a matching If-None-Match returns an empty 304 with validators"""
+        first = client.get(f"/api/v1/content/{created_content.id}")
+        etag = first.headers["etag"]
+        
+        second = client.get(f"/api/v1/content/{created_content.id}", headers={"If-None-Match": etag})
+        
+        assert first.status_code == 200
+        assert first.headers["cache-control"] == "private, no-cache"
+        assert "last-modified" in first.headers
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+
+    def test_bulk_metric_update_changes_etag(self, client: TestClient, db_session: Session, created_content):
+        """Test that Core UPDATEs bump row_version and so the ETag"""
+        etag = client.get(f"/api/v1/content/{created_content.id}").headers["etag"]
+        
+        ContentRepository(db_session).apply_metric_deltas([(created_content.id, 3, 1)])
+        response = client.get(f"/api/v1/content/{created_content.id}", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert response.json()["views"] == 3
+        assert response.headers["etag"] != etag
+
+    def test_business_change_changes_content_etag(self, client: TestClient, created_business, created_content):
+        """Test that embedded business details are part of the content version"""
+        etag = client.get(f"/api/v1/content/{created_content.id}").headers["etag"]
+        
+        client.put(f"/api/v1/businesses/{created_business.id}", json={"name": "Renamed Inc"})
+        response = client.get(f"/api/v1/content/{created_content.id}", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert response.json()["business"]["name"] == "Renamed Inc"
+
+    def test_if_modified_since(self, client: TestClient, created_business):
+        """Test that If-Modified-Since is honoured when no ETag is sent"""
+        first = client.get(f"/api/v1/businesses/{created_business.id}")
+        
+        cached = client.get(
+            f"/api/v1/businesses/{created_business.id}",
+            headers={"If-Modified-Since": first.headers["last-modified"]}
+        )
+        stale = client.get(
+            f"/api/v1/businesses/{created_business.id}",
+            headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+        )
+        
+        assert cached.status_code == 304
+        assert stale.status_code == 200
+
+    def test_validators_exposed_to_browsers(self, client: TestClient, created_business):
+        """Test that cross-origin scripts may read both cache validators"""
+        response = client.get(
+            f"/api/v1/businesses/{created_business.id}",
+            headers={"Origin": "http://localhost:5173"}
+        )
+        
+        exposed = {header.strip().lower() for header in response.headers["access-control-expose-headers"].split(",")}
+        assert {"etag", "last-modified"} <= exposed
+
+    def test_list_etag_changes_with_page(self, client: TestClient, db_session: Session, created_business, created_content):
+        """Test that list ETags cover the rows on the page"""
+        url = f"/api/v1/content/?business_id={created_business.id}"
+        etag = client.get(url).headers["etag"]
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+        
+        db_session.add(Content(
+            title="Another post",
+            content_text="More content",
+            content_type=ContentType.BLOG_POST,
+            business_id=created_business.id
+        ))
+        db_session.commit()
+        response = client.get(url, headers={"If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert "last-modified" not in response.headers
+
+    def test_campaign_not_modified(self, client: TestClient, db_session: Session, created_business):
+        """Test that campaigns support conditional GETs"""
+        campaign = Campaign(name="Launch", campaign_type=CampaignType.CUSTOM, business_id=created_business.id)
+        db_session.add(campaign)
+        db_session.commit()
+        
+        etag = client.get(f"/api/v1/campaigns/{campaign.id}").headers["etag"]
+        response = client.get(f"/api/v1/campaigns/{campaign.id}", headers={"If-None-Match": f'"other", {etag}'})
+        
+        assert response.status_code == 304
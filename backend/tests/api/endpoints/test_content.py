@@ -1,8 +1,10 @@
+import json
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.models.content import Content
+from app.repositories.content_repository import ContentRepository
 
 
 class TestContentAPI:
@@ -104,6 +106,51 @@ class TestContentAPI:
         for content_item in data:
             assert content_item["business_id"] == created_business.id
 
+    def test_list_content_cursor_pagination(self, client: TestClient, created_business, db_session: Session):
+        """Test walking content pages with the X-Next-Cursor header"""
+        from datetime import datetime, timedelta
+        from app.models.content import ContentType
+        base_time = datetime(2025, 1, 1, 12, 0, 0, 500000)
+        for i in range(5):
+            db_session.add(Content(
+                title=f"Paged Content {i}",
+                content_text="Pagination test content",
+                content_type=ContentType.BLOG_POST,
+                business_id=created_business.id,
+                # Two rows share a timestamp so the id tie-breaker is exercised
+                created_at=base_time + timedelta(seconds=min(i, 3))
+            ))
+        db_session.commit()
+        
+        titles = []
+        cursor = None
+        for _ in range(3):
+            url = f"/api/v1/content/?business_id={created_business.id}&limit=2"
+            response = client.get(url + (f"&cursor={cursor}" if cursor else ""))
+            assert response.status_code == 200
+            titles.extend(item["title"] for item in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+        
+        assert cursor is None
+        assert titles == [f"Paged Content {i}" for i in (4, 3, 2, 1, 0)]
+
+    def test_list_content_invalid_cursor(self, client: TestClient):
+        """Test that a malformed cursor is rejected"""
+        response = client.get("/api/v1/content/?cursor=not-a-cursor")
+        
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+    def test_list_content_rejects_empty_pages(self, client: TestClient, db_session: Session, created_content):
+        """Test that a non-positive limit is rejected by the API and yields an empty page from the repository"""
+        for limit in (0, -1):
+            assert client.get(f"/api/v1/content/?limit={limit}").status_code == 422
+            assert client.get(f"/api/v1/businesses/?limit={limit}").status_code == 422
+            assert client.get(f"/api/v1/campaigns/?limit={limit}").status_code == 422
+            assert ContentRepository(db_session).get_page(limit=limit) == ([], None)
+
     def test_update_content(self, client: TestClient, created_content):
         """Test updating content"""
         content_id = created_content.id
@@ -146,4 +193,143 @@ class TestContentAPI:
         
         # Get business and verify it exists
         business_response = client.get(f"/api/v1/businesses/{business_id}")
-        assert business_response.status_code == 200
\ No newline at end of file
+        assert business_response.status_code == 200
+
+    def test_generate_content_stream(self, client: TestClient, created_business, db_session: Session):
+        """Test streaming content generation as NDJSON"""
+        request_data = {"business_id": created_business.id, "content_type": "linkedin_post"}
+
+        with client.stream("POST", "/api/v1/content/generate/stream", json=request_data) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            events = [json.loads(line) for line in response.iter_lines() if line]
+
+        tokens = [event["text"] for event in events if event["type"] == "token"]
+        assert len(tokens) > 1
+        assert events[-1]["type"] == "complete"
+
+        saved = events[-1]["content"]
+        assert saved["content_text"] == "".join(tokens).strip()
+        assert saved["business_id"] == created_business.id
+        assert saved["status"] == "pending_approval"
+        assert db_session.get(Content, saved["id"]) is not None
+
+    def test_generate_content_stream_unknown_business(self, client: TestClient):
+        """Test streaming generation for a business that doesn't exist"""
+        response = client.post(
+            "/api/v1/content/generate/stream",
+            json={"business_id": 999999, "content_type": "blog_post"}
+        )
+
+        assert response.status_code == 404
+
+    def test_generate_content_as_job(self, client: TestClient, created_business, db_session: Session):
+        """Test queueing content generation and polling the job"""
+        from app.main import app
+
+        job_queue = app.state.job_queue
+        job_queue.session_factory = lambda: db_session
+
+        response = client.post(
+            "/api/v1/content/generate?async_job=true",
+            json={"business_id": created_business.id, "content_type": "facebook_post"}
+        )
+
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] in ["queued", "running", "succeeded"]
+        assert response.headers["location"].endswith(f"/api/v1/content/jobs/{job['id']}")
+
+        # Let the in-process workers drain the queue on the app's event loop
+        client.portal.call(job_queue.join)
+
+        poll = client.get(f"/api/v1/content/jobs/{job['id']}")
+        assert poll.status_code == 200
+        result = poll.json()
+        assert result["status"] == "succeeded"
+        assert result["progress"] == 100
+        assert result["content"]["id"] == result["content_id"]
+        assert result["content"]["content_type"] == "facebook_post"
+
+    def test_get_unknown_job(self, client: TestClient):
+        """Test polling a job that doesn't exist"""
+        response = client.get("/api/v1/content/jobs/does-not-exist")
+
+        assert response.status_code == 404
+
+    def test_generate_content_batch_has_no_n_plus_one(
+        self, client: TestClient, created_business, db_session: Session, assert_max_queries
+    ):
+        """Test that a batch loads its businesses once instead of once per saved item"""
+        items = [
+            {"business_id": created_business.id, "content_type": "twitter_post", "topic": f"Topic {index}"}
+            for index in range(5)
+        ]
+        db_session.expire_all()
+
+        # The business lookup plus the inserts; SQLite can't batch INSERT ... RETURNING
+        with assert_max_queries(1 + len(items)):
+            response = client.post("/api/v1/content/generate/batch", json={"items": items})
+
+        assert response.status_code == 200
+        assert all(result["content"]["business"]["id"] == created_business.id for result in response.json()["results"])
+
+    def test_generate_content_batch(self, client: TestClient, created_business, db_session: Session):
+        """Test generating several content items in one request"""
+        items = [
+            {"business_id": created_business.id, "content_type": content_type, "topic": "Product launch"}
+            for content_type in ["linkedin_post", "twitter_post", "blog_post"]
+        ]
+        items.insert(1, {"business_id": 999999, "content_type": "facebook_post"})
+
+        response = client.post("/api/v1/content/generate/batch", json={"items": items})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["succeeded"] == 3
+        assert data["failed"] == 1
+        assert [result["index"] for result in data["results"]] == [0, 1, 2, 3]
+        assert data["results"][1]["error"] == "Business not found"
+        assert data["results"][1]["content"] is None
+
+        saved = [result["content"] for result in data["results"] if result["content"]]
+        assert [content["content_type"] for content in saved] == ["linkedin_post", "twitter_post", "blog_post"]
+        assert db_session.query(Content).filter(Content.business_id == created_business.id).count() == 3
+
+    def test_generate_content_batch_keeps_items_when_one_row_fails(
+        self, client: TestClient, created_business, db_session: Session, monkeypatch, assert_max_queries
+    ):
+        """Test that a row the database rejects only fails its own item"""
+        from app.main import app
+
+        ai_service = app.state.ai_service
+        generate_content = ai_service.generate_content
+
+        async def generate_with_bad_row(**kwargs):
+            content_data = await generate_content(**kwargs)
+            if kwargs["topic"] == "bad":
+                content_data["title"] = None  # Violates NOT NULL
+            return content_data
+
+        monkeypatch.setattr(ai_service, "generate_content", generate_with_bad_row)
+        items = [
+            {"business_id": created_business.id, "content_type": "twitter_post", "topic": topic}
+            for topic in ["good", "bad", "also good"]
+        ]
+        db_session.expire_all()
+
+        # The business lookup, the rejected batch's inserts, then one insert per item
+        with assert_max_queries(1 + 2 * len(items)):
+            response = client.post("/api/v1/content/generate/batch", json={"items": items})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["succeeded"], data["failed"]) == (2, 1)
+        assert data["results"][1]["error"] == "Content could not be saved"
+        assert db_session.query(Content).filter(Content.business_id == created_business.id).count() == 2
+
+    def test_generate_content_batch_requires_items(self, client: TestClient):
+        """Test that an empty batch is rejected"""
+        response = client.post("/api/v1/content/generate/batch", json={"items": []})
+
+        assert response.status_code == 422
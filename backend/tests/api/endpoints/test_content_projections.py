@@ -0,0 +1,73 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class TestContentProjections:
+    """Test suite for summary views and sparse field selection on content lists"""
+
+    def _capture_selects(self, db_session: Session):
+        statements = []
+        
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+        
+        event.listen(db_session.connection(), "before_cursor_execute", before_cursor_execute)
+        return statements
+
+    def test_summary_view(self, client: TestClient, db_session: Session, created_content):
+        """Test that the summary view omits large columns from the response and the query"""
+        statements = self._capture_selects(db_session)
+        
+        response = client.get(f"/api/v1/content/?business_id={created_content.business_id}&view=summary")
+        
+        assert response.status_code == 200
+        [item] = response.json()
+        assert item["id"] == created_content.id
+        assert item["title"] == created_content.title
+        assert "content_text" not in item
+        assert "ai_prompt_used" not in item
+        assert "business" not in item
+        assert len(statements) == 1
+        assert "content_text" not in statements[0]
+        assert "businesses" not in statements[0]
+        assert response.headers["etag"]
+
+    def test_sparse_fields(self, client: TestClient, db_session: Session, created_content):
+        """Test that only the requested fields, plus id, are returned"""
+        statements = self._capture_selects(db_session)
+        
+        response = client.get("/api/v1/content/?fields=title,views,business")
+        
+        assert response.status_code == 200
+        item = next(item for item in response.json() if item["id"] == created_content.id)
+        assert set(item) == {"id", "title", "views", "business"}
+        assert item["business"]["id"] == created_content.business_id
+        assert len(statements) == 1
+        assert "content_text" not in statements[0]
+
+    def test_full_view_unchanged(self, client: TestClient, created_content):
+        """Test that lists still return full objects by default"""
+        response = client.get(f"/api/v1/content/?business_id={created_content.business_id}")
+        
+        [item] = response.json()
+        assert item["content_text"] == created_content.content_text
+        assert item["business"]["name"]
+
+    def test_projection_etags_differ(self, client: TestClient, created_content):
+        """Test that each projection has its own ETag"""
+        url = f"/api/v1/content/?business_id={created_content.business_id}"
+        
+        full = client.get(url).headers["etag"]
+        summary = client.get(f"{url}&view=summary").headers["etag"]
+        
+        assert full != summary
+        assert client.get(f"{url}&view=summary", headers={"If-None-Match": summary}).status_code == 304
+
+    def test_unknown_field(self, client: TestClient):
+        """Test that unknown field names are rejected"""
+        response = client.get("/api/v1/content/?fields=title,password")
+        
+        assert response.status_code == 400
+        assert "password" in response.json()["detail"]
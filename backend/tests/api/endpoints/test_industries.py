@@ -0,0 +1,93 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.business import Business
+from app.models.industry import Industry
+
+
+class TestIndustriesAPI:
+    """Test suite for industry endpoints"""
+
+    def test_counts_in_list_search_and_detail(self, client: TestClient, db_session: Session, created_user):
+        """Test that every industry read reports the stored business count"""
+        industry = Industry(name="Hospitality", slug="hospitality")
+        db_session.add(industry)
+        db_session.commit()
+        db_session.add_all([
+            Business(name=f"Hotel {i}", owner_id=created_user.id, industry_id=industry.id) for i in range(3)
+        ])
+        db_session.commit()
+        
+        listed = client.get("/api/v1/industries/").json()
+        searched = client.get("/api/v1/industries/?search=hospit").json()
+        by_id = client.get(f"/api/v1/industries/{industry.id}").json()
+        by_slug = client.get("/api/v1/industries/slug/hospitality").json()
+        
+        assert [row["business_count"] for row in listed if row["slug"] == "hospitality"] == [3]
+        assert [row["business_count"] for row in searched] == [3]
+        assert by_id["business_count"] == 3
+        assert by_slug["business_count"] == 3
+
+    def test_business_writes_refresh_counts(self, client: TestClient, db_session: Session, created_user):
+        """Test that creating, moving and deleting businesses update cached industry counts"""
+        first = Industry(name="Farming", slug="farming")
+        second = Industry(name="Fishing", slug="fishing")
+        db_session.add_all([first, second])
+        db_session.commit()
+        
+        def counts():
+            listed = client.get("/api/v1/industries/").json()
+            return {row["slug"]: row["business_count"] for row in listed if row["slug"] in ("farming", "fishing")}
+        
+        assert counts() == {"farming": 0, "fishing": 0}
+        business = client.post(
+            "/api/v1/businesses/",
+            json={"name": "Green Acres", "owner_id": created_user.id, "industry_id": first.id}
+        ).json()
+        assert counts() == {"farming": 1, "fishing": 0}
+        client.put(f"/api/v1/businesses/{business['id']}", json={"industry_id": second.id})
+        assert counts() == {"farming": 0, "fishing": 1}
+        client.delete(f"/api/v1/businesses/{business['id']}")
+        assert counts() == {"farming": 0, "fishing": 0}
+
+    def test_delete_with_businesses_deactivates(self, client: TestClient, db_session: Session, created_user):
+        """Test that an industry in use is deactivated rather than deleted"""
+        industry = Industry(name="Logistics", slug="logistics")
+        db_session.add(industry)
+        db_session.commit()
+        db_session.add(Business(name="Freight Co", owner_id=created_user.id, industry_id=industry.id))
+        db_session.commit()
+        
+        response = client.delete(f"/api/v1/industries/{industry.id}")
+        
+        assert response.status_code == 200
+        assert response.json()["deactivated"] is True
+
+    def test_etag_not_modified(self, client: TestClient, db_session: Session):
+        """Test that a matching If-None-Match gets an empty 304"""
+        db_session.add(Industry(name="Aviation", slug="aviation"))
+        db_session.commit()
+        
+        first = client.get("/api/v1/industries/slug/aviation")
+        etag = first.headers["etag"]
+        second = client.get("/api/v1/industries/slug/aviation", headers={"If-None-Match": etag})
+        listed = client.get("/api/v1/industries/", headers={"If-None-Match": f'W/{etag}'})
+        
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.content == b""
+        assert listed.status_code == 304
+
+    def test_update_invalidates_catalog(self, client: TestClient, db_session: Session):
+        """Test that updates are visible immediately and change the ETag"""
+        industry = Industry(name="Mining", slug="mining")
+        db_session.add(industry)
+        db_session.commit()
+        
+        before = client.get(f"/api/v1/industries/{industry.id}")
+        client.put(f"/api/v1/industries/{industry.id}", json={"description": "Extraction"})
+        after = client.get(f"/api/v1/industries/{industry.id}", headers={"If-None-Match": before.headers["etag"]})
+        
+        assert after.status_code == 200
+        assert after.json()["description"] == "Extraction"
+        assert after.headers["etag"] != before.headers["etag"]
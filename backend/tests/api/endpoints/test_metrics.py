@@ -0,0 +1,85 @@
+import json
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.content import Content
+
+
+class TestMetricsAPI:
+    """Test suite for engagement event ingestion"""
+
+    def test_ingest_events(self, client: TestClient, created_content, db_session: Session):
+        """Test that an NDJSON batch is accepted and flushed to the content row"""
+        from app.main import app
+        
+        pipeline = app.state.metrics_pipeline
+        pipeline.session_factory = lambda: db_session
+        content_id = created_content.id
+        
+        lines = [{"content_id": content_id, "type": "view"}] * 20
+        lines += [{"content_id": content_id, "type": "click", "count": 4}]
+        body = "\n".join(json.dumps(line) for line in lines) + "\n"
+        
+        response = client.post(
+            "/api/v1/metrics/events",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"}
+        )
+        
+        assert response.status_code == 202
+        assert response.json() == {"accepted": 21, "rejected": 0, "errors": []}
+        
+        client.portal.call(pipeline.flush)
+        content = db_session.get(Content, content_id)
+        db_session.refresh(content)
+        assert content.views == 20
+        assert content.clicks == 4
+
+    def test_invalid_lines_reported(self, client: TestClient, created_content):
+        """Test that malformed lines are skipped and reported by line number"""
+        body = "\n".join([
+            json.dumps({"content_id": created_content.id, "type": "view"}),
+            "not json",
+            json.dumps({"content_id": created_content.id, "type": "share"}),
+        ])
+        
+        response = client.post("/api/v1/metrics/events", content=body)
+        
+        assert response.status_code == 202
+        data = response.json()
+        assert data["accepted"] == 1
+        assert data["rejected"] == 2
+        assert [error["line"] for error in data["errors"]] == [2, 3]
+
+    def test_too_many_events(self, client: TestClient, monkeypatch):
+        """Test that oversized batches are rejected"""
+        from app.core.config import settings
+        
+        monkeypatch.setattr(settings, "metrics_max_events_per_request", 2)
+        body = "\n".join(json.dumps({"content_id": 1, "type": "view"}) for _ in range(3))
+        
+        response = client.post("/api/v1/metrics/events", content=body)
+        
+        assert response.status_code == 413
+
+    def test_oversized_line_and_body(self, client: TestClient, monkeypatch):
+        """Test that a very long line or body is rejected before it is buffered"""
+        from app.core.config import settings
+        
+        monkeypatch.setattr(settings, "metrics_max_line_bytes", 100)
+        monkeypatch.setattr(settings, "metrics_max_body_bytes", 1000)
+        long_line = json.dumps({"content_id": 1, "type": "view", "padding": "x" * 200})
+        
+        def chunks():
+            yield b"\n" * 600
+            yield b"\n" * 600
+        
+        line_response = client.post("/api/v1/metrics/events", content=long_line)
+        length_response = client.post("/api/v1/metrics/events", content="\n" * 1001)
+        streamed_response = client.post("/api/v1/metrics/events", content=chunks())
+        
+        assert line_response.status_code == 413
+        assert "Lines over 100 bytes" in line_response.json()["detail"]
+        assert length_response.status_code == 413
+        assert streamed_response.status_code == 413
+        assert "body over 1000 bytes" in streamed_response.json()["detail"]
@@ -0,0 +1,63 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.content import Content, ContentType
+from app.models.industry import Industry
+
+
+class TestSearchAPI:
+    """Test suite for the search endpoint"""
+
+    @pytest.fixture
+    def searchable_data(self, db_session: Session, created_business):
+        """An industry and content item alongside the test business"""
+        db_session.add(Industry(name="Technology Consulting", slug="technology-consulting",
+                                description="IT strategy and software advice"))
+        db_session.add(Industry(name="Retired Technology", slug="retired-technology", is_active=False))
+        db_session.add(Content(
+            title="Ten Automation Tips",
+            content_text="How small businesses save time with workflow automation.",
+            content_type=ContentType.BLOG_POST,
+            business_id=created_business.id
+        ))
+        db_session.commit()
+        return created_business
+
+    def test_search_across_types(self, client: TestClient, searchable_data):
+        """Test that matches from every type are returned, best first"""
+        response = client.get("/api/v1/search/?q=technology")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["query"] == "technology"
+        found = {(result["type"], result["title"]) for result in data["results"]}
+        assert ("industry", "Technology Consulting") in found
+        assert ("business", "Test Business Inc") in found
+        assert ("industry", "Retired Technology") not in found
+        scores = [result["score"] for result in data["results"]]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_search_content_body(self, client: TestClient, searchable_data):
+        """Test that content bodies are searchable and scoped by type"""
+        response = client.get("/api/v1/search/?q=workflow&types=content")
+        
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert len(results) == 1
+        assert results[0]["title"] == "Ten Automation Tips"
+        assert results[0]["business_id"] == searchable_data.id
+        assert "workflow automation" in results[0]["snippet"]
+
+    def test_stop_words_only_match_nothing(self, client: TestClient, searchable_data):
+        """Test that a query of stop words loads no candidates and returns no results"""
+        response = client.get("/api/v1/search/?q=the")
+
+        assert response.status_code == 200
+        assert response.json()["results"] == []
+
+    def test_search_requires_query(self, client: TestClient):
+        """Test that an empty query is rejected"""
+        response = client.get("/api/v1/search/?q=")
+        
+        assert response.status_code == 422
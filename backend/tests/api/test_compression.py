@@ -0,0 +1,130 @@
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.compression import CompressionMiddleware, CompressionStats, choose_encoding
+
+LARGE_TEXT = "Blog post paragraph about local SEO. " * 100
+
+
+def build_app(stats: CompressionStats) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(
+        CompressionMiddleware,
+        stats=stats,
+        minimum_size=1024,
+        content_types=["application/json", "text/plain"],
+    )
+
+    @app.get("/large")
+    def large():
+        return {"body": LARGE_TEXT}
+
+    @app.get("/small")
+    def small():
+        return {"body": "short"}
+
+    @app.get("/tagged")
+    def tagged():
+        return PlainTextResponse(LARGE_TEXT, headers={"ETag": '"abc"'})
+
+    @app.get("/binary")
+    def binary():
+        return Response(LARGE_TEXT.encode(), media_type="application/octet-stream")
+
+    @app.get("/stream")
+    def stream():
+        def lines():
+            for _ in range(3):
+                yield (LARGE_TEXT + "\n").encode()
+        return StreamingResponse(lines(), media_type="application/json")
+
+    return app
+
+
+class TestCompression:
+    """Test suite for the response compression middleware"""
+
+    def test_choose_encoding(self):
+        """Test Accept-Encoding negotiation with q-values and wildcards"""
+        assert choose_encoding("gzip, deflate", ("br", "gzip")) == "gzip"
+        assert choose_encoding("br;q=0.5, gzip", ("br", "gzip")) == "gzip"
+        assert choose_encoding("br, gzip", ("br", "gzip")) == "br"
+        assert choose_encoding("gzip;q=0", ("gzip",)) is None
+        assert choose_encoding("*", ("gzip",)) == "gzip"
+        assert choose_encoding("identity", ("gzip",)) is None
+        assert choose_encoding("", ("gzip",)) is None
+
+    def test_large_json_is_compressed(self):
+        """Test that bodies over the threshold are gzipped and counted"""
+        stats = CompressionStats()
+        client = TestClient(build_app(stats))
+
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json() == {"body": LARGE_TEXT}
+        totals = stats.snapshot()["encodings"]["gzip"]
+        assert totals["responses"] == 1
+        assert totals["bytes_out"] < totals["bytes_in"]
+        assert int(response.headers["content-length"]) == totals["bytes_out"]
+
+    def test_small_response_is_not_compressed(self):
+        """Test that bodies under the threshold pass through but still vary"""
+        stats = CompressionStats()
+        client = TestClient(build_app(stats))
+
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert stats.snapshot()["skipped"] == {"below_minimum_size": 1}
+
+    def test_without_accept_encoding(self):
+        """Test that clients not accepting gzip get the identity body"""
+        stats = CompressionStats()
+        client = TestClient(build_app(stats))
+
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"body": LARGE_TEXT}
+        assert stats.snapshot()["encodings"] == {}
+
+    def test_content_type_allowlist(self):
+        """Test that content types outside the allowlist are left alone"""
+        stats = CompressionStats()
+        client = TestClient(build_app(stats))
+
+        response = client.get("/binary", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert stats.snapshot()["skipped"] == {"content_type": 1}
+
+    def test_streaming_response_passes_through(self):
+        """Test that streamed bodies are not buffered or compressed"""
+        stats = CompressionStats()
+        client = TestClient(build_app(stats))
+
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text == (LARGE_TEXT + "\n") * 3
+        assert stats.snapshot()["skipped"] == {"streaming": 1}
+
+    def test_etag_is_weakened(self):
+        """Test that a strong ETag becomes weak once the body is compressed"""
+        client = TestClient(build_app(CompressionStats()))
+
+        response = client.get("/tagged", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == 'W/"abc"'
+
+    def test_app_reports_compression_stats(self, client):
+        """Test that the app exposes its compression totals"""
+        response = client.get("/api/v1/metrics/compression")
+
+        assert response.status_code == 200
+        assert set(response.json()) == {"encodings", "skipped"}
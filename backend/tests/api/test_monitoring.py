@@ -0,0 +1,76 @@
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.api.monitoring import AppStateCollector
+from app.core.monitoring import render_metrics
+from app.db.database import engine
+from app.db.instrumentation import statement_operation
+from app.main import app
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestMetricsRendering:
+    """Test suite for the Prometheus text rendering"""
+
+    def test_state_metrics_rendered_with_registered_ones(self, client: TestClient):
+        """Test that scrape-time component metrics follow the registered metrics"""
+        text = render_metrics(AppStateCollector(app, engine)).decode()
+
+        assert "# TYPE http_request_duration_seconds histogram" in text
+        assert "# TYPE engagement_events_total counter" in text
+        assert 'engagement_events_total{stage="dropped"}' in text
+
+    def test_statement_operation(self):
+        """Test that SQL statements are labelled by kind"""
+        assert statement_operation("SELECT 1") == "select"
+        assert statement_operation("  insert into t values (1)") == "insert"
+        assert statement_operation("WITH x AS (SELECT 1) SELECT * FROM x") == "select"
+        assert statement_operation("PRAGMA foreign_keys") == "other"
+
+
+class TestMetricsEndpoint:
+    """Test suite for the /metrics endpoint"""
+
+    def test_request_latency_by_route_template(self, client: TestClient, created_business):
+        """Test that requests are timed under their route template, not the raw path"""
+        labels = {"method": "GET", "route": "/api/v1/businesses/{business_id}", "status": "200"}
+        before = _sample("http_request_duration_seconds_count", **labels)
+
+        client.get(f"/api/v1/businesses/{created_business.id}")
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert _sample("http_request_duration_seconds_count", **labels) == before + 1
+        assert 'route="/api/v1/businesses/{business_id}"' in response.text
+        assert f'route="/api/v1/businesses/{created_business.id}"' not in response.text
+
+    def test_database_queries_are_timed(self, client: TestClient, created_business):
+        """Test that SQL statements run by a request land in the query histogram"""
+        before = _sample("db_query_duration_seconds_count", operation="select")
+
+        client.get(f"/api/v1/businesses/{created_business.id}")
+
+        assert _sample("db_query_duration_seconds_count", operation="select") > before
+
+    def test_mock_fallback_is_counted(self, client: TestClient, created_business, monkeypatch):
+        """Test that generating without a provider counts a mock fallback"""
+        service = app.state.ai_service
+        monkeypatch.setattr(service, "anthropic_client", None)
+        monkeypatch.setattr(service, "openai_client", None)
+        monkeypatch.setattr(service, "ollama_models", None)
+        labels = {"content_type": "twitter_post", "operation": "generate", "reason": "no_provider"}
+        before = _sample("llm_mock_fallbacks_total", **labels)
+
+        client.post(
+            "/api/v1/content/generate",
+            json={"business_id": created_business.id, "content_type": "twitter_post"}
+        )
+        text = client.get("/metrics").text
+
+        assert _sample("llm_mock_fallbacks_total", **labels) == before + 1
+        assert "llm_mock_fallbacks_total{" in text
+        assert 'cache_requests_total{cache="industry_catalog"' in text
@@ -0,0 +1,71 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.api.monitoring import QueryCountMiddleware
+from app.db.instrumentation import count_queries
+from app.models.content import Content
+
+
+class TestQueryCounting:
+    """Test suite for per-request SQL statement counting"""
+
+    def test_nested_blocks_roll_up(self, db_session: Session):
+        """Test that statements in an inner block also count toward the outer one"""
+        with count_queries() as outer:
+            db_session.execute(text("SELECT 1"))
+            with count_queries() as inner:
+                db_session.execute(text("SELECT 2"))
+
+        assert inner.count == 1
+        assert outer.count == 2
+
+    def test_transaction_control_is_not_counted(self, db_session: Session):
+        """Test that SAVEPOINT and RELEASE don't count toward the query budget"""
+        with count_queries() as stats:
+            with db_session.begin_nested():
+                db_session.execute(text("SELECT 1"))
+
+        assert stats.count == 1
+
+    def test_server_timing_header(self, client: TestClient, created_business):
+        """Test that responses report their query count and database time"""
+        response = client.get(f"/api/v1/businesses/{created_business.id}")
+
+        assert response.status_code == 200
+        assert response.headers["server-timing"].startswith("db;dur=")
+        assert 'desc="1 queries"' in response.headers["server-timing"]
+
+    def test_content_list_has_no_n_plus_one(
+        self, client: TestClient, db_session: Session, created_business, sample_content_data, assert_max_queries
+    ):
+        """Test that listing content with its business runs one query however many rows there are"""
+        for index in range(5):
+            db_session.add(Content(**{**sample_content_data, "title": f"Post {index}", "business_id": created_business.id}))
+        db_session.commit()
+        db_session.expire_all()
+
+        with assert_max_queries(1):
+            response = client.get("/api/v1/content/")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 5
+
+    def test_over_budget_requests_are_logged(self, db_session: Session, caplog):
+        """Test that a request over budget is logged with its repeated statement"""
+        app = FastAPI()
+        app.add_middleware(QueryCountMiddleware, query_budget=3, repeated_threshold=3)
+
+        @app.get("/loop")
+        def loop():
+            for index in range(6):
+                db_session.execute(text("SELECT :value"), {"value": index})
+            return {}
+
+        response = TestClient(app).get("/loop")
+
+        assert 'desc="6 queries"' in response.headers["server-timing"]
+        output = caplog.text
+        assert "GET /loop ran 6 SQL statements" in output
+        assert "Possible N+1, 6x: SELECT ?" in output
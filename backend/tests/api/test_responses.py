@@ -0,0 +1,35 @@
+import json
+
+from sqlalchemy.orm import Session
+
+from app.api.responses import FastJSONResponse, rows_response
+from app.models.content import Content
+from app.schemas.business import BusinessResponse
+from app.schemas.content import ContentResponse
+
+
+class TestResponses:
+    """Test suite for the fast JSON response helpers"""
+
+    def test_rows_match_validated_output(self, db_session: Session, created_content):
+        """Test that direct row serialization matches Pydantic's JSON output"""
+        content = db_session.get(Content, created_content.id)
+        
+        direct = rows_response(ContentResponse, [content]).body
+        validated = ContentResponse.model_validate(content).model_dump_json()
+        
+        assert json.loads(direct) == [json.loads(validated)]
+
+    def test_flat_schema_with_headers(self, created_business):
+        """Test that flat schemas serialize and headers are passed through"""
+        response = rows_response(BusinessResponse, [created_business], headers={"X-Next-Cursor": "abc"})
+        
+        assert response.headers["x-next-cursor"] == "abc"
+        assert response.media_type == "application/json"
+        assert json.loads(response.body)[0]["name"] == created_business.name
+
+    def test_default_response_class(self):
+        """Test that the default response renders compact UTF-8 JSON"""
+        response = FastJSONResponse({"name": "Café", "count": 2})
+        
+        assert response.body == '{"name":"Café","count":2}'.encode("utf-8")
@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core import tracing
+from app.models.content import ContentType
+from app.repositories.business_repository import BusinessRepository
+from app.services.ai_content_service import AIContentService
+
+
+@pytest.fixture
+def span_exporter():
+    """Trace into an in-memory exporter for the duration of a test"""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    assert tracing.configure_tracing(exporter)
+    yield exporter
+    tracing.shutdown_tracing()
+
+
+class TestTracingDisabled:
+    """Test suite for tracing while it is switched off"""
+
+    def test_spans_are_shared_no_ops(self):
+        """Test that spans cost nothing when tracing is off"""
+        assert not tracing.tracing_active()
+        assert tracing.span("a", key="value") is tracing.span("b")
+        tracing.set_span_attributes(key="value")
+
+    def test_missing_sdk_leaves_tracing_off(self, monkeypatch):
+        """Test that enabling tracing without the SDK installed degrades to no tracing"""
+        monkeypatch.setattr(tracing, "trace", None)
+
+        assert tracing.configure_tracing() is False
+        assert not tracing.tracing_active()
+
+
+class TestTracingEnabled:
+    """Test suite for spans exported while tracing is on"""
+
+    def test_repository_methods_are_spans(self, span_exporter, db_session: Session, created_business):
+        """Test that repository calls are traced as Repository.method spans"""
+        BusinessRepository(db_session).get_by_id(created_business.id)
+
+        names = [span.name for span in span_exporter.get_finished_spans()]
+        assert "BusinessRepository.get_by_id" in names
+
+    @pytest.mark.asyncio
+    async def test_generation_stages_are_nested(self, span_exporter, created_business, monkeypatch):
+        """Test that prompt, provider call and SEO stages are children of the generation span"""
+        service = AIContentService()
+        monkeypatch.setattr(service, "anthropic_client", None)
+        monkeypatch.setattr(service, "openai_client", None)
+        monkeypatch.setattr(service, "ollama_models", None)
+        try:
+            await service.generate_content(created_business, ContentType.TWITTER_POST)
+        finally:
+            await service.aclose()
+
+        spans = {span.name: span for span in span_exporter.get_finished_spans()}
+        root = spans["ai.generate_content"]
+        assert root.attributes["llm.content_type"] == "twitter_post"
+        for stage in ("ai.build_prompt", "ai.seo_metadata"):
+            assert spans[stage].parent.span_id == root.context.span_id
@@ -1,12 +1,15 @@
+from contextlib import contextmanager
+
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
 from app.db.database import Base, get_db
+from app.db.instrumentation import count_queries
 from app.models import business, content, user
 from app.core.config import settings
 
@@ -19,6 +22,16 @@ engine = create_engine(
     poolclass=StaticPool,
 )
 
+# pysqlite starts and ends transactions itself, which breaks SAVEPOINT
+# (and so the per-test savepoints below); let SQLAlchemy emit BEGIN instead
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(engine, "begin")
+def _begin_transaction(connection):
+    connection.exec_driver_sql("BEGIN")
+
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 @pytest.fixture(scope="session")
@@ -33,7 +46,9 @@ def db_session(db_engine):
     """Create a fresh database session for each test"""
     connection = db_engine.connect()
     transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    # Rollbacks inside the app (e.g. a failed batch insert) only undo to a
+    # savepoint, so the test's own transaction still discards everything
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
     yield session
     session.close()
     transaction.rollback()
@@ -53,6 +68,17 @@ def client(db_session):
         yield test_client
     app.dependency_overrides.clear()
 
+@pytest.fixture
+def assert_max_queries():
+    """Context manager failing the test if its block runs more than ``n`` SQL statements"""
+    @contextmanager
+    def check(n):
+        with count_queries() as stats:
+            yield stats
+        statements = "\n".join(f"{count}x {statement}" for statement, count in stats.statements.most_common())
+        assert stats.count <= n, f"Expected at most {n} queries, ran {stats.count}:\n{statements}"
+    return check
+
 @pytest.fixture
 def sample_user_data():
     """Sample user data for tests"""
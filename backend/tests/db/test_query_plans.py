@@ -0,0 +1,110 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.models.business import Business
+from app.models.campaign import Campaign, CampaignStatus, CampaignType
+from app.models.content import Content, ContentStatus, ContentType
+from app.repositories.campaign_repository import CampaignRepository
+from app.repositories.content_repository import ContentRepository
+
+
+@contextmanager
+def capture_statements(db: Session):
+    """Record the SQL statements and parameters executed on a session"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    connection = db.connection()
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+
+
+def query_plan(db: Session, statement: str, parameters) -> str:
+    """Return SQLite's EXPLAIN QUERY PLAN output for a captured statement"""
+    rows = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return "\n".join(row[-1] for row in rows)
+
+
+@pytest.fixture
+def seeded_dataset(db_session: Session, created_user):
+    """Several businesses with mostly published content and a few queued items"""
+    statuses = [ContentStatus.PUBLISHED] * 18 + [ContentStatus.SCHEDULED, ContentStatus.PENDING_APPROVAL]
+    now = datetime(2025, 1, 1)
+    for b in range(10):
+        business = Business(name=f"Plan Business {b}", owner_id=created_user.id)
+        db_session.add(business)
+        db_session.flush()
+        for c in range(100):
+            status = statuses[c % len(statuses)]
+            db_session.add(Content(
+                title=f"Content {b}-{c}",
+                content_text="Seeded content",
+                content_type=ContentType.BLOG_POST,
+                status=status,
+                business_id=business.id,
+                created_at=now + timedelta(minutes=c),
+                scheduled_publish_at=now + timedelta(days=c) if status == ContentStatus.SCHEDULED else None,
+            ))
+        for c in range(10):
+            db_session.add(Campaign(
+                name=f"Campaign {b}-{c}",
+                campaign_type=CampaignType.CUSTOM,
+                status=CampaignStatus.ACTIVE if c == 0 else CampaignStatus.COMPLETED,
+                business_id=business.id,
+            ))
+    db_session.commit()
+    db_session.execute(text("ANALYZE"))
+    return db_session
+
+
+class TestQueryPlans:
+    """Test suite asserting that hot repository queries use indexes"""
+
+    @pytest.mark.parametrize("run_query,expected_index", [
+        (lambda db, business_id: ContentRepository(db).get_multi(business_id=business_id, limit=20),
+         "ix_content_business_id_created_at_id"),
+        (lambda db, business_id: ContentRepository(db).get_page(business_id=business_id, limit=20),
+         "ix_content_business_id_created_at_id"),
+        (lambda db, business_id: ContentRepository(db).get_by_status(ContentStatus.SCHEDULED),
+         "ix_content_status_scheduled_publish_at"),
+        (lambda db, business_id: ContentRepository(db).get_pending_approval(business_id=business_id),
+         "ix_content_pending_approval"),
+        (lambda db, business_id: ContentRepository(db).get_scheduled_content(before_date=datetime(2025, 3, 1)),
+         "ix_content_status_scheduled_publish_at"),
+        (lambda db, business_id: CampaignRepository(db).get_active_campaigns(business_id=business_id),
+         "ix_campaigns_business_id_status"),
+        (lambda db, business_id: CampaignRepository(db).get_active_campaigns(),
+         "ix_campaigns_status"),
+        # Unordered, so either index led by business_id serves it equally well
+        (lambda db, business_id: CampaignRepository(db).get_multi(business_id=business_id),
+         "ix_campaigns_business_id_"),
+    ], ids=[
+        "content_by_business",
+        "content_page_by_business",
+        "content_by_status",
+        "content_pending_approval",
+        "content_scheduled_due",
+        "active_campaigns_by_business",
+        "active_campaigns",
+        "campaigns_by_business",
+    ])
+    def test_query_uses_index(self, seeded_dataset: Session, run_query, expected_index):
+        """Test that the query is answered with an index search, not a table scan"""
+        business_id = seeded_dataset.query(Business.id).first()[0]
+        with capture_statements(seeded_dataset) as statements:
+            run_query(seeded_dataset, business_id)
+
+        assert len(statements) == 1
+        plan = query_plan(seeded_dataset, *statements[0])
+        assert f"USING INDEX {expected_index}" in plan
+        assert "SCAN content" not in plan
+        assert "SCAN campaigns" not in plan
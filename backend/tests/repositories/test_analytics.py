@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.models.analytics import EngagementRollup
+from app.models.content import Content, ContentStatus, ContentType
+from app.repositories.analytics_repository import AnalyticsRepository, DAY, HOUR, default_platform
+
+START = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+class TestAnalyticsRepository:
+    """Test suite for engagement rollup maintenance and queries"""
+
+    def test_apply_rollup_deltas_upserts(self, db_session: Session, created_business):
+        """Test that repeated deltas increment the same hourly and daily rows"""
+        repo = AnalyticsRepository(db_session)
+        key = (START + timedelta(hours=3), created_business.id, None, "blog_post", "blog")
+        
+        assert repo.apply_rollup_deltas([(key, 10, 1)]) == 2
+        repo.apply_rollup_deltas([(key, 5, 2), ((START + timedelta(hours=4),) + key[1:], 1, 0)])
+        
+        rows = db_session.query(EngagementRollup).filter(EngagementRollup.business_id == created_business.id)
+        totals = {(row.granularity, row.bucket_start.hour): (row.views, row.clicks) for row in rows}
+        assert totals == {("hour", 3): (15, 3), ("hour", 4): (1, 0), ("day", 0): (16, 3)}
+
+    def test_apply_rollup_deltas_without_native_upsert(self, db_session: Session, created_business, monkeypatch):
+        """Test that dialects without ON CONFLICT update or insert rollups row by row"""
+        monkeypatch.setattr(db_session.get_bind().dialect, "name", "mssql")
+        repo = AnalyticsRepository(db_session)
+        key = (START + timedelta(hours=3), created_business.id, None, "blog_post", "blog")
+        
+        assert repo.apply_rollup_deltas([(key, 10, 1)]) == 2
+        repo.apply_rollup_deltas([(key, 5, 2), ((START + timedelta(hours=4),) + key[1:], 1, 0)])
+        
+        rows = db_session.query(EngagementRollup).filter(EngagementRollup.business_id == created_business.id)
+        totals = {(row.granularity, row.bucket_start.hour): (row.views, row.clicks) for row in rows}
+        assert totals == {("hour", 3): (15, 3), ("hour", 4): (1, 0), ("day", 0): (16, 3)}
+
+    def test_get_timeseries_zero_fills(self, db_session: Session, created_business):
+        """Test that every bucket in the range is returned, including empty ones"""
+        repo = AnalyticsRepository(db_session)
+        repo.apply_rollup_deltas([
+            ((START + timedelta(hours=1), created_business.id, 0, "blog_post", "blog"), 4, 1),
+            ((START + timedelta(hours=1), created_business.id, 0, "linkedin_post", "linkedin"), 6, 0),
+            ((START + timedelta(days=2), created_business.id, 0, "blog_post", "blog"), 3, 0),
+        ])
+        
+        hourly = repo.get_timeseries(created_business.id, HOUR, START, START + timedelta(hours=3))
+        assert [(point[0].hour, point[1], point[2]) for point in hourly] == [(0, 0, 0), (1, 10, 1), (2, 0, 0)]
+        
+        daily = repo.get_timeseries(
+            created_business.id, DAY, START, START + timedelta(days=3), content_type=ContentType.BLOG_POST
+        )
+        assert [(point[0].day, point[1]) for point in daily] == [(1, 4), (2, 0), (3, 3)]
+
+    def test_rebuild_from_content(self, db_session: Session, created_business):
+        """Test that rollups are recomputed from content counters, replacing old rows"""
+        repo = AnalyticsRepository(db_session)
+        repo.apply_rollup_deltas([((START, created_business.id, 0, "email", "email"), 99, 99)])
+        db_session.add(Content(
+            title="Launch post",
+            content_text="Launch",
+            content_type=ContentType.LINKEDIN_POST,
+            status=ContentStatus.PUBLISHED,
+            published_at=START + timedelta(hours=5, minutes=20),
+            views=30,
+            clicks=3,
+            business_id=created_business.id
+        ))
+        db_session.commit()
+        
+        assert repo.rebuild_from_content(business_id=created_business.id) == 2
+        
+        rows = db_session.query(EngagementRollup).filter(EngagementRollup.business_id == created_business.id).all()
+        assert sorted((row.granularity, row.platform, row.views, row.clicks) for row in rows) == [
+            ("day", "linkedin", 30, 3),
+            ("hour", "linkedin", 30, 3),
+        ]
+
+    def test_default_platform(self):
+        """Test that platforms are derived from content types"""
+        assert default_platform(ContentType.TWITTER_POST) == "twitter"
+        assert default_platform(ContentType.EMAIL) == "email"
@@ -0,0 +1,55 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models.business import Business
+from app.models.industry import Industry
+from app.repositories.industry_repository import IndustryRepository
+
+
+def _add_industry(db: Session, name: str) -> Industry:
+    industry = Industry(name=name, slug=name.lower())
+    db.add(industry)
+    db.commit()
+    return industry
+
+
+def _count(db: Session, industry: Industry) -> int:
+    db.refresh(industry)
+    return industry.business_count
+
+
+class TestIndustryBusinessCounts:
+    """Test suite for the maintained industry business_count column"""
+
+    def test_counts_follow_business_changes(self, db_session: Session, created_user):
+        """Test that creating, moving and deleting businesses keeps counts in step"""
+        retail = _add_industry(db_session, "Retail")
+        finance = _add_industry(db_session, "Finance")
+        first = Business(name="Shop One", owner_id=created_user.id, industry_id=retail.id)
+        second = Business(name="Shop Two", owner_id=created_user.id, industry_id=retail.id)
+        db_session.add_all([first, second, Business(name="No Industry", owner_id=created_user.id)])
+        db_session.commit()
+        assert (_count(db_session, retail), _count(db_session, finance)) == (2, 0)
+        
+        first.industry_id = finance.id
+        db_session.commit()
+        assert (_count(db_session, retail), _count(db_session, finance)) == (1, 1)
+        
+        second.name = "Renamed Shop"
+        db_session.commit()
+        assert _count(db_session, retail) == 1
+        
+        db_session.delete(second)
+        db_session.commit()
+        assert (_count(db_session, retail), _count(db_session, finance)) == (0, 1)
+
+    def test_reconcile_business_counts(self, db_session: Session, created_user):
+        """Test that counts changed outside the ORM are corrected"""
+        retail = _add_industry(db_session, "Retail")
+        db_session.add(Business(name="Shop", owner_id=created_user.id, industry_id=retail.id))
+        db_session.commit()
+        db_session.execute(text("UPDATE industries SET business_count = 7 WHERE id = :id"), {"id": retail.id})
+        
+        assert IndustryRepository(db_session).reconcile_business_counts() == 1
+        assert _count(db_session, retail) == 1
+        assert IndustryRepository(db_session).reconcile_business_counts() == 0
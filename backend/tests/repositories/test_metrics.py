@@ -0,0 +1,118 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.database import Base
+from app.models.business import Business
+from app.models.campaign import Campaign, CampaignType
+from app.models.content import Content, ContentType
+from app.models.user import User
+from app.repositories.campaign_repository import CampaignRepository
+from app.repositories.content_repository import ContentRepository
+
+
+def _add_content(db: Session, business_id: int, title: str) -> Content:
+    content = Content(
+        title=title,
+        content_text="Metrics test content",
+        content_type=ContentType.BLOG_POST,
+        business_id=business_id
+    )
+    db.add(content)
+    db.commit()
+    return content
+
+
+class TestContentMetrics:
+    """Test suite for SQL-side content metric updates"""
+
+    def test_update_performance_metrics(self, db_session: Session, created_content):
+        """Test that metrics are incremented and the updated row returned"""
+        repo = ContentRepository(db_session)
+        repo.update_performance_metrics(created_content.id, views=10, clicks=2)
+        content = repo.update_performance_metrics(created_content.id, views=5, clicks=1, engagement_rate=1500)
+        
+        assert content.views == 15
+        assert content.clicks == 3
+        assert content.engagement_rate == 1500
+
+    def test_update_missing_content(self, db_session: Session):
+        """Test that updating unknown content returns None"""
+        assert ContentRepository(db_session).update_performance_metrics(999999, views=1) is None
+
+    def test_apply_metric_deltas(self, db_session: Session, created_business):
+        """Test that a batch of deltas is summed per content and applied"""
+        first = _add_content(db_session, created_business.id, "First")
+        second = _add_content(db_session, created_business.id, "Second")
+        deltas = [(first.id, 1, 0)] * 3000 + [(second.id, 2, 1)] * 500 + [(first.id, 0, 7)]
+        
+        touched = ContentRepository(db_session).apply_metric_deltas(deltas)
+        
+        assert touched == 2
+        db_session.refresh(first)
+        db_session.refresh(second)
+        assert (first.views, first.clicks) == (3000, 7)
+        assert (second.views, second.clicks) == (1000, 500)
+
+
+class TestCampaignMetrics:
+    """Test suite for SQL-side campaign metric updates"""
+
+    def test_update_campaign_metrics(self, db_session: Session, created_business):
+        """Test that totals are incremented and the engagement rate recomputed"""
+        campaign = Campaign(name="Launch", campaign_type=CampaignType.CUSTOM, business_id=created_business.id)
+        db_session.add(campaign)
+        db_session.commit()
+        
+        repo = CampaignRepository(db_session)
+        repo.update_campaign_metrics(campaign.id, content_pieces=2, views=200, clicks=10)
+        campaign = repo.update_campaign_metrics(campaign.id, published=1, views=100, clicks=5)
+        
+        assert campaign.total_content_pieces == 2
+        assert campaign.published_content == 1
+        assert campaign.total_views == 300
+        assert campaign.total_clicks == 15
+        assert campaign.avg_engagement_rate == 500  # 5.00%
+
+
+class TestConcurrentMetricUpdates:
+    """Test suite proving concurrent metric updates don't lose increments"""
+
+    def test_no_lost_increments(self, tmp_path):
+        """Test that parallel writers' increments all land"""
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'metrics.db'}",
+            connect_args={"check_same_thread": False, "timeout": 30},
+        )
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        
+        with session_factory() as db:
+            db.add(User(id=1, email="metrics@example.com", hashed_password="x"))
+            db.add(Business(id=1, name="Metrics Inc", owner_id=1))
+            db.commit()
+            content_id = _add_content(db, 1, "Concurrent").id
+        
+        threads, increments = 8, 50
+        barrier = threading.Barrier(threads)
+        
+        def writer():
+            with session_factory() as db:
+                repo = ContentRepository(db)
+                barrier.wait()
+                for _ in range(increments):
+                    repo.update_performance_metrics(content_id, views=1, clicks=1)
+        
+        workers = [threading.Thread(target=writer) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        with session_factory() as db:
+            content = db.get(Content, content_id)
+            assert content.views == threads * increments
+            assert content.clicks == threads * increments
+        engine.dispose()
@@ -0,0 +1,134 @@
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models.business import Business
+from app.models.campaign import CampaignStatus, CampaignType
+from app.models.content import ContentStatus
+from app.models.industry import Industry
+from app.repositories.business_repository import BusinessRepository
+from app.repositories.campaign_repository import CampaignRepository
+from app.repositories.content_repository import ContentRepository
+from app.repositories.industry_repository import IndustryRepository
+
+
+class TestRepositoryWrites:
+    """Test suite for single-statement repository writes"""
+
+    def test_create_is_one_insert(self, db_session: Session, created_business, sample_content_data, assert_max_queries):
+        """Test that create returns server defaults without refreshing the row"""
+        repo = ContentRepository(db_session)
+
+        with assert_max_queries(1):
+            content = repo.create({**sample_content_data, "business_id": created_business.id})
+            assert content.id is not None
+            assert content.created_at is not None
+            assert content.row_version == 1
+
+    def test_other_objects_still_expire(self, db_session: Session, created_business, sample_content_data):
+        """Test that only the written row skips the reload after a repository commit"""
+        db_session.execute(update(Business.__table__).values(name="Changed elsewhere"))
+        content = ContentRepository(db_session).create({**sample_content_data, "business_id": created_business.id})
+
+        assert "title" in content.__dict__
+        assert created_business.name == "Changed elsewhere"
+
+    def test_update_is_one_statement(self, db_session: Session, created_content, assert_max_queries):
+        """Test that update changes and returns the row with one UPDATE ... RETURNING"""
+        repo = ContentRepository(db_session)
+        content_id = created_content.id
+        db_session.expunge_all()
+
+        with assert_max_queries(1):
+            content = repo.update(content_id, {"title": "Renamed", "not_a_column": "ignored"})
+            assert content.title == "Renamed"
+            assert content.row_version == 2
+            assert content.updated_at is not None
+
+    def test_update_missing_row(self, db_session: Session, assert_max_queries):
+        """Test that updating a missing id returns None"""
+        with assert_max_queries(1):
+            assert ContentRepository(db_session).update(999, {"title": "Nothing"}) is None
+
+    def test_update_refreshes_loaded_object(self, db_session: Session, created_content):
+        """Test that an object already in the session sees the returned values"""
+        ContentRepository(db_session).update(created_content.id, {"title": "Renamed"})
+
+        assert created_content.title == "Renamed"
+        assert created_content.row_version == 2
+
+    def test_status_changes_never_load_the_row(self, db_session: Session, created_content, assert_max_queries):
+        """Test that approving and publishing content are one statement each"""
+        repo = ContentRepository(db_session)
+        content_id = created_content.id
+        db_session.expunge_all()
+
+        with assert_max_queries(1):
+            approved = repo.approve_content(content_id)
+            assert approved.status == ContentStatus.APPROVED
+        with assert_max_queries(1):
+            published = repo.publish_content(content_id)
+            assert published.status == ContentStatus.PUBLISHED
+            assert published.published_at is not None
+
+    def test_metric_updates_keep_returned_rows(self, db_session: Session, created_business, created_content, assert_max_queries):
+        """Test that metric increments return rows that stay loaded after the commit"""
+        content_id, title = created_content.id, created_content.title
+        campaign = CampaignRepository(db_session).create({
+            "name": "Metrics",
+            "campaign_type": CampaignType.PRODUCT_LAUNCH,
+            "business_id": created_business.id
+        })
+        db_session.expunge_all()
+
+        with assert_max_queries(1):
+            content = ContentRepository(db_session).update_performance_metrics(content_id, views=10, clicks=2)
+            assert (content.views, content.clicks, content.title) == (10, 2, title)
+        with assert_max_queries(1):
+            updated = CampaignRepository(db_session).update_campaign_metrics(campaign.id, views=10, clicks=1)
+            assert (updated.total_views, updated.total_clicks, updated.name) == (10, 1, "Metrics")
+
+    def test_start_campaign_keeps_start_date(self, db_session: Session, created_business, assert_max_queries):
+        """Test that starting a campaign only fills in a missing start date"""
+        repo = CampaignRepository(db_session)
+        campaign = repo.create({
+            "name": "Launch",
+            "campaign_type": CampaignType.PRODUCT_LAUNCH,
+            "business_id": created_business.id
+        })
+
+        with assert_max_queries(1):
+            started = repo.start_campaign(campaign.id)
+        start_date = started.start_date
+        repo.pause_campaign(campaign.id)
+        restarted = repo.start_campaign(campaign.id)
+
+        assert start_date is not None
+        assert restarted.status == CampaignStatus.ACTIVE
+        assert restarted.start_date == start_date
+
+    def test_delete_is_one_statement(self, db_session: Session, created_content, assert_max_queries):
+        """Test that deleting a row without dependents is a single DELETE ... RETURNING"""
+        repo = ContentRepository(db_session)
+        content_id = created_content.id
+
+        with assert_max_queries(1):
+            assert repo.delete(content_id) is True
+        assert repo.delete(content_id) is False
+        assert repo.get_by_id(content_id) is None
+
+    def test_business_updates_keep_industry_counts(self, db_session: Session, created_business):
+        """Test that business updates still move counts between already-loaded industries"""
+        first = Industry(name="First", slug="first")
+        second = Industry(name="Second", slug="second")
+        db_session.add_all([first, second])
+        db_session.commit()
+        repo = BusinessRepository(db_session)
+
+        repo.update(created_business.id, {"industry_id": first.id})
+        assert first.business_count == 1
+        repo.update(created_business.id, {"industry_id": second.id})
+
+        assert first.business_count == 0
+        assert second.business_count == 1
+        assert IndustryRepository(db_session).deactivate(second.id) is True
+        assert second.is_active is False
@@ -0,0 +1,332 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from prometheus_client import REGISTRY
+
+from app.main import app
+from app.models.content import ContentType
+from app.services.ai_content_service import AIContentService, ReasoningFilter
+
+
+class TestAIContentServiceLifecycle:
+    """Test suite for the process-wide AIContentService instance"""
+
+    def test_service_created_once_at_startup(self, client: TestClient, created_business):
+        """Test that every request is served by the same service instance"""
+        service = app.state.ai_service
+        assert isinstance(service, AIContentService)
+
+        request_data = {"business_id": created_business.id, "content_type": "blog_post"}
+        first = client.post("/api/v1/suggestions/topics", json=request_data)
+        second = client.post("/api/v1/suggestions/keywords", json=request_data)
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert app.state.ai_service is service
+
+    def test_generate_content_uses_shared_service(self, client: TestClient, created_business):
+        """Test content generation through the injected service"""
+        response = client.post(
+            "/api/v1/content/generate",
+            json={"business_id": created_business.id, "content_type": "twitter_post"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["business_id"] == created_business.id
+        assert data["content_type"] == "twitter_post"
+        assert data["status"] == "pending_approval"
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_connection_pools(self):
+        """Test that shutting the service down closes its HTTP clients"""
+        service = AIContentService()
+        ollama_client = service.ollama_client
+
+        await service.aclose()
+
+        if ollama_client is not None:
+            assert ollama_client.is_closed
+
+
+OLLAMA_STUB_DELAY = 0.5
+
+
+class _OllamaStubHandler(BaseHTTPRequestHandler):
+    """Minimal Ollama API stub that answers slowly, like a local model would"""
+
+    def do_GET(self):
+        self._send_json({"models": [{"name": settings.ollama_default_model}]})
+
+    chat_requests = 0
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length))
+        type(self).chat_requests += 1
+        time.sleep(OLLAMA_STUB_DELAY)
+        if "numbered list" in payload["messages"][0]["content"]:
+            content = "1. First suggestion idea\n2. Second suggestion idea"
+        else:
+            content = "<think>planning</think>Stub content #SEO"
+        self._send_json({
+            "model": payload["model"],
+            "message": {"role": "assistant", "content": content},
+            "done": True,
+            "prompt_eval_count": 120,
+            "eval_count": 30,
+        })
+
+    def _send_json(self, data):
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def ollama_stub(monkeypatch):
+    """Run a local Ollama stub server and point the settings at it"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OllamaStubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(settings, "environment", "development")
+    monkeypatch.setattr(settings, "ollama_base_url", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(_OllamaStubHandler, "chat_requests", 0)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestOllamaConcurrency:
+    """Test suite for the non-blocking Ollama generation path"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_generations_keep_health_responsive(self, ollama_stub, monkeypatch):
+        """Test that slow Ollama generations do not freeze the event loop"""
+        generations = 5
+        monkeypatch.setattr(settings, "ai_provider_concurrency", {"ollama": generations})
+        service = AIContentService()
+        await service.startup()
+        assert service.ollama_available
+
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+                started = time.perf_counter()
+                tasks = [
+                    asyncio.create_task(service._generate_with_ai("Write a tweet", ContentType.TWITTER_POST))
+                    for _ in range(generations)
+                ]
+                await asyncio.sleep(0.05)
+
+                health_started = time.perf_counter()
+                health = await http.get("/health")
+                health_elapsed = time.perf_counter() - health_started
+
+                results = await asyncio.gather(*tasks)
+                total_elapsed = time.perf_counter() - started
+        finally:
+            await service.aclose()
+
+        assert health.status_code == 200
+        assert health_elapsed < OLLAMA_STUB_DELAY / 2
+        # Generations overlap instead of running one after another
+        assert total_elapsed < OLLAMA_STUB_DELAY * generations / 2
+        assert results == ["Stub content #SEO"] * generations
+
+
+class TestReasoningFilter:
+    """Test suite for incremental <think> block stripping"""
+
+    def _run(self, chunks):
+        reasoning_filter = ReasoningFilter()
+        output = "".join(reasoning_filter.feed(chunk) for chunk in chunks)
+        return output + reasoning_filter.flush()
+
+    def test_passes_plain_text_through(self):
+        """Test that text without reasoning tags is unchanged"""
+        assert self._run(["Hello ", "world"]) == "Hello world"
+
+    def test_strips_reasoning_block(self):
+        """Test that a complete reasoning block is removed"""
+        assert self._run(["<think>plan the post</think>\n\nFinal post"]) == "Final post"
+
+    def test_strips_tags_split_across_chunks(self):
+        """Test that tags split over several chunks are still recognised"""
+        chunks = ["<th", "ink>some ", "reasoning</th", "in", "k>", " Answer", " text"]
+        assert self._run(chunks) == "Answer text"
+
+    def test_holds_back_possible_tag_prefix(self):
+        """Test that a trailing partial tag is not emitted early"""
+        reasoning_filter = ReasoningFilter()
+        assert reasoning_filter.feed("Price < 5 <thi") == "Price < 5 "
+        assert reasoning_filter.feed("s is fine") == "<this is fine"
+
+    def test_unterminated_reasoning_is_kept(self):
+        """Test that text after an unclosed <think> tag is emitted at the end"""
+        assert self._run(["<think>", "Only content"]) == "Only content"
+
+
+class TestOllamaModelSelection:
+    """Test suite for model selection against the cached inventory"""
+
+    @pytest.mark.asyncio
+    async def test_missing_model_invalidates_inventory(self, ollama_stub):
+        """Test that a model-not-found error drops the cached inventory"""
+        service = AIContentService()
+        await service.startup()
+        try:
+            assert service.ollama_models._is_fresh()
+            response = httpx.Response(404, request=httpx.Request("POST", "http://ollama/api/chat"))
+
+            with pytest.raises(httpx.HTTPStatusError):
+                service._raise_for_ollama_status(response)
+
+            assert not service.ollama_models._is_fresh()
+        finally:
+            await service.aclose()
+
+
+class TestSuggestionCaching:
+    """Test suite for cached topic and keyword suggestions"""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_reuse_cached_suggestions(self, ollama_stub, created_business):
+        """Test that repeated suggestion requests only call the model once"""
+        service = AIContentService()
+        await service.startup()
+        try:
+            first = await service.generate_topic_suggestions(created_business, "blog_post", category="educational")
+            second = await service.generate_topic_suggestions(created_business, "blog_post", category="educational")
+            other = await service.generate_topic_suggestions(created_business, "blog_post", category="promotional")
+        finally:
+            await service.aclose()
+
+        assert first == second == ["First suggestion idea", "Second suggestion idea"]
+        assert other == first
+        assert _OllamaStubHandler.chat_requests == 2
+        stats = service.suggestion_cache.stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 2
+
+
+class TestProviderConcurrency:
+    """Test suite for per-provider generation limits"""
+
+    @pytest.mark.asyncio
+    async def test_provider_semaphore_bounds_fan_out(self, ollama_stub, monkeypatch):
+        """Test that no more than the configured number of calls run at once"""
+        monkeypatch.setattr(settings, "ai_provider_concurrency", {"ollama": 2})
+        service = AIContentService()
+        await service.startup()
+        try:
+            started = time.perf_counter()
+            await asyncio.gather(*(
+                service._generate_with_ai("Write a tweet", ContentType.TWITTER_POST)
+                for _ in range(4)
+            ))
+            elapsed = time.perf_counter() - started
+        finally:
+            await service.aclose()
+
+        # Four calls with two slots take two rounds of the stub delay
+        assert elapsed >= OLLAMA_STUB_DELAY * 2
+        assert _OllamaStubHandler.chat_requests == 4
+
+    @pytest.mark.asyncio
+    async def test_streams_share_the_provider_limit(self, ollama_stub, monkeypatch):
+        """Test that streamed generations wait for a provider slot like regular ones"""
+        monkeypatch.setattr(settings, "ai_provider_concurrency", {"ollama": 1})
+        service = AIContentService()
+        await service.startup()
+
+        async def consume():
+            return [chunk async for chunk in service._stream_with_ai("Write a tweet", ContentType.TWITTER_POST)]
+
+        try:
+            started = time.perf_counter()
+            streams = await asyncio.gather(consume(), consume())
+            elapsed = time.perf_counter() - started
+        finally:
+            await service.aclose()
+
+        assert elapsed >= OLLAMA_STUB_DELAY * 2
+        assert all("Stub content" in "".join(chunks) for chunks in streams)
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestProviderMetrics:
+    """Test suite for LLM provider latency, outcome and token metrics"""
+
+    @pytest.mark.asyncio
+    async def test_generation_records_latency_and_tokens(self, ollama_stub):
+        """Test that an Ollama generation is timed and its token usage counted"""
+        labels = {
+            "provider": "ollama",
+            "model": settings.ollama_default_model,
+            "content_type": ContentType.TWITTER_POST.value,
+        }
+        calls_before = _sample("llm_request_duration_seconds_count", operation="generate", **labels)
+        successes_before = _sample("llm_requests_total", operation="generate", outcome="success", **labels)
+        tokens_before = _sample("llm_tokens_total", kind="completion", **labels)
+
+        service = AIContentService()
+        await service.startup()
+        try:
+            await service._generate_with_ai("Write a tweet", ContentType.TWITTER_POST)
+        finally:
+            await service.aclose()
+
+        assert _sample("llm_request_duration_seconds_count", operation="generate", **labels) == calls_before + 1
+        assert _sample("llm_request_duration_seconds_sum", operation="generate", **labels) >= OLLAMA_STUB_DELAY
+        assert _sample("llm_requests_total", operation="generate", outcome="success", **labels) == successes_before + 1
+        assert _sample("llm_tokens_total", kind="completion", **labels) == tokens_before + 30
+
+    @pytest.mark.asyncio
+    async def test_provider_failures_are_counted_once(self, ollama_stub, monkeypatch):
+        """Test that failed generations count one error each, whether or not the call itself started"""
+        labels = {
+            "provider": "ollama",
+            "model": settings.ollama_default_model,
+            "content_type": ContentType.TWITTER_POST.value,
+            "operation": "generate",
+            "outcome": "error",
+        }
+        errors_before = _sample("llm_requests_total", **labels)
+
+        service = AIContentService()
+        await service.startup()
+        try:
+            async def failing_chat(*args, **kwargs):
+                raise httpx.ConnectError("connection refused")
+
+            monkeypatch.setattr(service, "_ollama_chat", failing_chat)
+            await service._generate_with_ai("Write a tweet", ContentType.TWITTER_POST)
+
+            async def failing_selection(content_type):
+                raise RuntimeError("no models")
+
+            monkeypatch.setattr(service, "_select_ollama_model", failing_selection)
+            content = await service._generate_with_ai("Write a tweet", ContentType.TWITTER_POST)
+        finally:
+            await service.aclose()
+
+        assert _sample("llm_requests_total", **labels) == errors_before + 2
+        assert content
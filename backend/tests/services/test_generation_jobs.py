@@ -0,0 +1,137 @@
+import pytest
+
+from app.core.config import settings
+from app.models.content import Content
+from app.schemas.content import ContentGenerate, GenerationJobStatus
+from app.services.ai_content_service import AIContentService
+from app.services.generation_jobs import CeleryJobQueue, InProcessJobQueue, create_job_queue
+
+
+class _FakeRedis:
+    """Just enough of the sync Redis client for job id tracking"""
+
+    def __init__(self):
+        self.values = {}
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def exists(self, key):
+        return int(key in self.values)
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def close(self):
+        pass
+
+
+class TestInProcessJobQueue:
+    """Test suite for the asyncio-backed generation job queue"""
+
+    @pytest.mark.asyncio
+    async def test_job_runs_to_completion(self, db_session, created_business):
+        """Test that a queued job generates and saves content"""
+        business_id = created_business.id
+        queue = InProcessJobQueue(AIContentService(), lambda: db_session, workers=2, max_retained=10)
+        await queue.start()
+        try:
+            job = await queue.submit(ContentGenerate(business_id=business_id, content_type="twitter_post"))
+            await queue.join()
+        finally:
+            await queue.stop()
+
+        assert job.status == GenerationJobStatus.SUCCEEDED
+        assert job.stage == "completed"
+        assert db_session.get(Content, job.content_id).business_id == business_id
+
+    @pytest.mark.asyncio
+    async def test_missing_business_fails_job(self, db_session):
+        """Test that errors are reported on the job instead of raised"""
+        queue = InProcessJobQueue(AIContentService(), lambda: db_session, workers=1, max_retained=10)
+        await queue.start()
+        try:
+            job = await queue.submit(ContentGenerate(business_id=999999, content_type="blog_post"))
+            await queue.join()
+        finally:
+            await queue.stop()
+
+        assert job.status == GenerationJobStatus.FAILED
+        assert job.error == "Business not found"
+
+    @pytest.mark.asyncio
+    async def test_old_finished_jobs_are_evicted(self, db_session, created_business):
+        """Test that only the newest finished jobs are retained"""
+        queue = InProcessJobQueue(AIContentService(), lambda: db_session, workers=1, max_retained=2)
+        await queue.start()
+        try:
+            jobs = [
+                await queue.submit(ContentGenerate(business_id=created_business.id, content_type="twitter_post"))
+                for _ in range(3)
+            ]
+            await queue.join()
+        finally:
+            await queue.stop()
+
+        assert queue.get(jobs[0].id) is None
+        assert queue.get(jobs[2].id) is jobs[2]
+
+
+class TestCeleryGenerationTask:
+    """Test suite for the Celery generation task with an in-memory broker"""
+
+    def test_task_generates_content(self, monkeypatch, db_session, created_business):
+        """Test running the Celery task eagerly against the test database"""
+        from app import worker
+
+        monkeypatch.setattr(worker, "session_factory", lambda: db_session)
+        worker.celery_app.conf.update(broker_url="memory://", result_backend="cache+memory://")
+
+        try:
+            result = worker.generate_content_task.apply(
+                args=[{"business_id": created_business.id, "content_type": "linkedin_post"}]
+            )
+            service = worker._ai_service
+            # Background tasks keep running between jobs
+            loop_running = worker._loop.is_running()
+            second = worker.generate_content_task.apply(
+                args=[{"business_id": created_business.id, "content_type": "twitter_post"}]
+            )
+        finally:
+            worker._shutdown_worker_process()
+
+        assert result.successful() and second.successful()
+        content = db_session.get(Content, result.result["content_id"])
+        assert content.content_type.value == "linkedin_post"
+        # The process-wide service (and its connection pools) is reused
+        assert service is not None
+        assert loop_running
+        assert worker._ai_service is None and worker._loop is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_ids_are_missing(self, monkeypatch):
+        """Test that only submitted ids are reported, since Celery calls any id PENDING"""
+        from app import worker
+
+        submitted = []
+        monkeypatch.setattr(worker.generate_content_task, "apply_async", lambda **kwargs: submitted.append(kwargs))
+        worker.celery_app.conf.update(broker_url="memory://", result_backend="cache+memory://")
+        queue = CeleryJobQueue(_FakeRedis())
+
+        job = await queue.submit(ContentGenerate(business_id=1, content_type="twitter_post"))
+
+        assert submitted[0]["task_id"] == job.id
+        assert queue.get(job.id).status == GenerationJobStatus.QUEUED
+        assert queue.get("made-up-id") is None
+
+
+class TestJobQueueBackend:
+    """Test suite for choosing the job queue backend"""
+
+    def test_inprocess_backend_refuses_multiple_workers(self, monkeypatch):
+        """Test that in-process jobs are rejected when several server workers would share them"""
+        monkeypatch.setattr(settings, "job_queue_backend", "inprocess")
+        monkeypatch.setattr(settings, "web_concurrency", 2)
+
+        with pytest.raises(RuntimeError, match="celery"):
+            create_job_queue(AIContentService(), lambda: None)
@@ -0,0 +1,73 @@
+from sqlalchemy.orm import Session
+
+from app.models.industry import Industry
+from app.services.industry_catalog import IndustryCatalogCache
+
+
+def _seed(db: Session):
+    db.add_all([
+        Industry(name="Retail", slug="retail", sort_order=2),
+        Industry(name="Real Estate", slug="real-estate", sort_order=1),
+        Industry(name="Retired", slug="retired", is_active=False),
+    ])
+    db.commit()
+
+
+class TestIndustryCatalogCache:
+    """Test suite for the process-local industry catalogue cache"""
+
+    def test_catalog_loaded_once(self, db_session: Session):
+        """Test that repeated reads reuse the snapshot and its indexes"""
+        _seed(db_session)
+        cache = IndustryCatalogCache(ttl=60)
+        
+        catalog = cache.get(db_session)
+        assert cache.get(db_session) is catalog
+        assert (cache.loads, cache.hits) == (1, 1)
+        assert catalog.by_slug["retail"].name == "Retail"
+        assert catalog.by_id[catalog.by_slug["retired"].id].is_active is False
+
+    def test_list_and_search(self, db_session: Session):
+        """Test that listing and searching match the repository queries"""
+        _seed(db_session)
+        catalog = IndustryCatalogCache(ttl=60).get(db_session)
+        
+        assert [i.slug for i in catalog.list() if i.slug.startswith("re")] == ["real-estate", "retail"]
+        assert "retired" in [i.slug for i in catalog.list(active_only=False)]
+        assert [i.slug for i in catalog.search("RE")][:2] == ["real-estate", "retail"]
+        assert "retired" not in [i.slug for i in catalog.search("ret")]
+
+    def test_invalidate_reloads_with_new_etag(self, db_session: Session):
+        """Test that a write invalidates the snapshot and changes the ETag"""
+        _seed(db_session)
+        cache = IndustryCatalogCache(ttl=60)
+        before = cache.get(db_session)
+        
+        db_session.add(Industry(name="Robotics", slug="robotics"))
+        db_session.commit()
+        assert cache.get(db_session) is before
+        
+        cache.invalidate()
+        after = cache.get(db_session)
+        assert "robotics" in after.by_slug
+        assert after.etag != before.etag
+        assert cache.loads == 2
+
+    def test_published_version_bump(self, db_session: Session):
+        """Test that a version bump from another worker drops the snapshot"""
+        cache = IndustryCatalogCache(ttl=60)
+        before = cache.get(db_session)
+        
+        cache._on_version({"data": b"7"})
+        
+        assert cache.get(db_session) is not before
+        assert cache.get(db_session).version == 7
+
+    def test_ttl_expiry(self, db_session: Session):
+        """Test that the snapshot is reloaded once it is older than the TTL"""
+        cache = IndustryCatalogCache(ttl=0)
+        
+        cache.get(db_session)
+        cache.get(db_session)
+        
+        assert cache.loads == 2
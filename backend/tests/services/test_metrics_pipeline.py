@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.analytics import EngagementRollup
+from app.models.campaign import Campaign, CampaignType
+from app.models.content import Content
+from app.schemas.metrics import EngagementEvent
+from app.services.metrics_pipeline import InMemoryEventBuffer, MetricsPipeline
+
+
+def _events(content_id, views=0, clicks=0):
+    return (
+        [EngagementEvent(content_id=content_id, type="view")] * views
+        + [EngagementEvent(content_id=content_id, type="click")] * clicks
+    )
+
+
+class TestMetricsPipeline:
+    """Test suite for buffered engagement event ingestion"""
+
+    @pytest.fixture
+    def pipeline(self, db_session):
+        return MetricsPipeline(lambda: db_session, InMemoryEventBuffer(), flush_interval=60, flush_threshold=100)
+
+    @pytest.mark.asyncio
+    async def test_flush_applies_aggregated_events(self, pipeline, db_session, created_business, created_content):
+        """Test that buffered events reach content and campaign totals in one flush"""
+        campaign = Campaign(name="Spring", campaign_type=CampaignType.CUSTOM, business_id=created_business.id)
+        db_session.add(campaign)
+        db_session.commit()
+        created_content.campaign_id = campaign.id
+        db_session.commit()
+        content_id, campaign_id = created_content.id, campaign.id
+        
+        await pipeline.ingest(_events(content_id, views=40, clicks=2))
+        await pipeline.ingest(_events(content_id, views=10, clicks=3))
+        assert db_session.get(Content, content_id).views == 0
+        
+        assert await pipeline.flush() == 55
+        
+        content = db_session.get(Content, content_id)
+        assert (content.views, content.clicks, content.engagement_rate) == (50, 5, 1000)
+        campaign = db_session.get(Campaign, campaign_id)
+        assert (campaign.total_views, campaign.total_clicks, campaign.avg_engagement_rate) == (50, 5, 1000)
+        assert pipeline.flushes == 1
+        assert await pipeline.flush() == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_updates_rollups(self, pipeline, db_session, created_business, created_content):
+        """Test that events land in hourly and daily rollups by platform"""
+        content_id, business_id = created_content.id, created_business.id
+        occurred_at = datetime(2026, 3, 1, 9, 30, tzinfo=timezone.utc)
+        events = [
+            EngagementEvent(content_id=content_id, type="view", count=5, occurred_at=occurred_at),
+            EngagementEvent(content_id=content_id, type="view", count=2, occurred_at=occurred_at + timedelta(hours=1)),
+            EngagementEvent(content_id=content_id, type="click", occurred_at=occurred_at, platform="newsletter"),
+        ]
+        await pipeline.ingest(events)
+        await pipeline.flush()
+        
+        rows = (
+            db_session.query(EngagementRollup)
+            .filter(EngagementRollup.business_id == business_id)
+            .order_by(EngagementRollup.granularity, EngagementRollup.platform, EngagementRollup.bucket_start)
+            .all()
+        )
+        assert [(row.granularity, row.platform, row.bucket_start.hour, row.views, row.clicks) for row in rows] == [
+            ("day", "blog", 0, 7, 0),
+            ("day", "newsletter", 0, 0, 1),
+            ("hour", "blog", 9, 5, 0),
+            ("hour", "blog", 10, 2, 0),
+            ("hour", "newsletter", 9, 0, 1),
+        ]
+        assert {row.content_type for row in rows} == {"blog_post"}
+        assert {row.campaign_id for row in rows} == {0}
+
+    @pytest.mark.asyncio
+    async def test_threshold_requests_early_flush(self, pipeline, created_content):
+        """Test that a full buffer wakes the background flusher"""
+        await pipeline.ingest(_events(created_content.id, views=99))
+        assert not pipeline._flush_requested.is_set()
+        
+        await pipeline.ingest(_events(created_content.id, views=1))
+        assert pipeline._flush_requested.is_set()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_events(self, created_content):
+        """Test that deltas are put back in the buffer when the database write fails"""
+        def broken_session():
+            raise RuntimeError("database unavailable")
+        
+        pipeline = MetricsPipeline(broken_session, InMemoryEventBuffer(), flush_interval=60, flush_threshold=100)
+        await pipeline.ingest(_events(created_content.id, views=3))
+        
+        assert await pipeline.flush() == 0
+        assert pipeline.flush_failures == 1
+        [(key, deltas)] = (await pipeline.buffer.drain()).items()
+        assert key[0] == created_content.id
+        assert deltas == (3, 0)
+
+    @pytest.mark.asyncio
+    async def test_failed_flushes_retain_a_bounded_buffer(self, created_content):
+        """Test that retried deltas are capped to the newest hours and the rest counted as dropped"""
+        def broken_session():
+            raise RuntimeError("database unavailable")
+
+        pipeline = MetricsPipeline(
+            broken_session, InMemoryEventBuffer(), flush_interval=60, flush_threshold=1000, max_retained_keys=2
+        )
+        now = datetime.now(timezone.utc)
+        await pipeline.ingest([
+            EngagementEvent(content_id=created_content.id, type="view", occurred_at=now - timedelta(hours=hours))
+            for hours in (0, 1, 2, 2)
+        ])
+
+        assert await pipeline.flush() == 0
+        assert pipeline.events_dropped == 2
+        retained = await pipeline.buffer.drain()
+        assert len(retained) == 2
+        newest_hour = int(now.timestamp()) // 3600
+        assert {hour for _, hour, _ in retained} == {newest_hour, newest_hour - 1}
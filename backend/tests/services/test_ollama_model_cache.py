@@ -0,0 +1,78 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.ollama_model_cache import OllamaModelCache
+
+
+def _tags_client(calls, models=("llama3.2:3b",)):
+    """Build an Ollama client whose /api/tags endpoint counts requests"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"models": [{"name": name} for name in models]})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://ollama")
+
+
+class TestOllamaModelCache:
+    """Test suite for the shared Ollama model inventory cache"""
+
+    @pytest.mark.asyncio
+    async def test_inventory_fetched_once_within_ttl(self):
+        """Test that repeated lookups are served from the cache"""
+        calls = []
+        async with _tags_client(calls) as client:
+            cache = OllamaModelCache(client, ttl=60, refresh_interval=30)
+
+            for _ in range(5):
+                assert await cache.get_models() == ["llama3.2:3b"]
+
+        assert calls == ["/api/tags"]
+        assert cache.available
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_fetch(self):
+        """Test that a cold cache is only fetched once under concurrency"""
+        calls = []
+        async with _tags_client(calls) as client:
+            cache = OllamaModelCache(client, ttl=60, refresh_interval=30)
+            await asyncio.gather(*(cache.get_models() for _ in range(10)))
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_refetch(self):
+        """Test that invalidation makes the next lookup hit Ollama again"""
+        calls = []
+        async with _tags_client(calls) as client:
+            cache = OllamaModelCache(client, ttl=60, refresh_interval=30)
+            await cache.get_models()
+            cache.invalidate()
+            await cache.get_models()
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_background_refresh(self):
+        """Test that the background task keeps refreshing the inventory"""
+        calls = []
+        async with _tags_client(calls) as client:
+            cache = OllamaModelCache(client, ttl=60, refresh_interval=0.01)
+            cache.start()
+            await asyncio.sleep(0.1)
+            await cache.stop()
+
+        assert len(calls) >= 2
+
+    @pytest.mark.asyncio
+    async def test_unreachable_server_reports_unavailable(self):
+        """Test that fetch errors leave the inventory empty"""
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://ollama") as client:
+            cache = OllamaModelCache(client, ttl=60, refresh_interval=30)
+            assert await cache.get_models() == []
+
+        assert not cache.available
@@ -0,0 +1,37 @@
+from app.services.search_index import InvertedIndex, similarity, tokenize
+
+WEIGHTS = {"name": 1.0, "description": 0.4}
+
+
+def _index():
+    index = InvertedIndex()
+    index.add("plumbing", {"name": "Acme Plumbing", "description": "Emergency pipe repair"}, WEIGHTS)
+    index.add("bakery", {"name": "Sunrise Bakery", "description": "Fresh bread and plumbing-free pastries"}, WEIGHTS)
+    index.add("dental", {"name": "Bright Dental", "description": "Family dentistry"}, WEIGHTS)
+    return index
+
+
+class TestInvertedIndex:
+    """Test suite for the in-memory full-text search fallback"""
+
+    def test_tokenize_drops_stop_words(self):
+        """Test that tokens are lowercased and stop words removed"""
+        assert tokenize("The Best Bakery in Town") == ["best", "bakery", "town"]
+
+    def test_name_matches_rank_above_description_matches(self):
+        """Test that field weights order results"""
+        ranked = [key for key, _ in _index().search("plumbing")]
+        assert ranked == ["plumbing", "bakery"]
+
+    def test_last_term_matches_as_prefix(self):
+        """Test search-as-you-type on the final query word"""
+        assert [key for key, _ in _index().search("dent")][0] == "dental"
+
+    def test_typo_matches_by_trigram_similarity(self):
+        """Test that misspelled names still match"""
+        assert [key for key, _ in _index().search("Acme Plumbng")][0] == "plumbing"
+        assert similarity("Plumbng", "Plumbing") > 0.3
+
+    def test_no_match(self):
+        """Test that unrelated queries return nothing"""
+        assert _index().search("astronomy") == []
@@ -0,0 +1,74 @@
+import pytest
+
+from app.services.suggestion_cache import SuggestionCache
+
+
+class TestSuggestionCache:
+    """Test suite for the in-process suggestion cache tier"""
+
+    def test_key_ignores_whitespace_differences(self):
+        """Test that prompts differing only in whitespace share a key"""
+        key = SuggestionCache.make_key("Business: Acme\n\nTopic:  SEO ", "llama3.2:3b")
+
+        assert key == SuggestionCache.make_key("Business: Acme Topic: SEO", "llama3.2:3b")
+        assert key != SuggestionCache.make_key("Business: Acme Topic: SEO", "phi3:3.8b")
+
+    @pytest.mark.asyncio
+    async def test_hit_and_miss_counters(self):
+        """Test that lookups are counted as hits or misses"""
+        cache = SuggestionCache(max_entries=10, ttl=60)
+
+        assert await cache.get("key") is None
+        await cache.set("key", 1, ["topic"])
+        assert await cache.get("key") == ["topic"]
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_evicted(self):
+        """Test that the LRU tier stays within its size limit"""
+        cache = SuggestionCache(max_entries=2, ttl=60)
+        await cache.set("a", 1, ["a"])
+        await cache.set("b", 1, ["b"])
+        await cache.get("a")
+        await cache.set("c", 1, ["c"])
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == ["a"]
+        assert await cache.get("c") == ["c"]
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self):
+        """Test that entries past their TTL are not returned"""
+        cache = SuggestionCache(max_entries=10, ttl=0)
+        await cache.set("key", 1, ["topic"])
+
+        assert await cache.get("key") is None
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_business(self):
+        """Test that invalidation only drops the given business's entries"""
+        cache = SuggestionCache(max_entries=10, ttl=60)
+        await cache.set("a", 1, ["a"])
+        await cache.set("b", 2, ["b"])
+
+        await cache.invalidate_business(1)
+
+        assert await cache.get("a") is None
+        assert await cache.get("b") == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_published_invalidation(self):
+        """Test that an invalidation published by another worker drops local entries"""
+        cache = SuggestionCache(max_entries=10, ttl=60)
+        await cache.set("a", 1, ["a"])
+        await cache.set("b", 2, ["b"])
+
+        cache._on_invalidation({"data": b"1"})
+
+        assert await cache.get("a") is None
+        assert await cache.get("b") == ["b"]